@@ -7,7 +7,7 @@ import os
 from flask import Flask, request, session, redirect, url_for, render_template, jsonify
 from oauth_auth import IBMQuantumOAuth, setup_oauth_routes
 from ibm_cloud_auth import IBMCloudIAM, setup_ibm_cloud_routes
-from secure_token_manager import init_token_manager, get_user_token, store_user_token, validate_user_token
+from secure_token_manager import init_token_manager, get_user_token, store_user_token, validate_user_token, delete_user_token
 import secrets
 
 class QuantumAuthManager:
@@ -134,9 +134,7 @@ class QuantumAuthManager:
 
             # Clear token from secure storage
             if user_id:
-                from secure_token_manager import SecureTokenManager
-                manager = SecureTokenManager()
-                manager.delete_token(user_id)
+                delete_user_token(user_id)
 
             # Clear session
             session.clear()
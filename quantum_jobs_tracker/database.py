@@ -301,22 +301,21 @@ class QuantumDatabase:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                for backend in backends_data:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO backends 
-                        (name, status, qubits, max_experiments, max_shots, operational, 
-                         pending_jobs, data_json, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ''', (
-                        backend.get('name', ''),
-                        backend.get('status', ''),
-                        backend.get('qubits', 0),
-                        backend.get('max_experiments', 0),
-                        backend.get('max_shots', 0),
-                        backend.get('operational', False),
-                        backend.get('pending_jobs', 0),
-                        json.dumps(backend)
-                    ))
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO backends 
+                    (name, status, qubits, max_experiments, max_shots, operational, 
+                     pending_jobs, data_json, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', [(
+                    backend.get('name', ''),
+                    backend.get('status', ''),
+                    backend.get('qubits', 0),
+                    backend.get('max_experiments', 0),
+                    backend.get('max_shots', 0),
+                    backend.get('operational', False),
+                    backend.get('pending_jobs', 0),
+                    json.dumps(backend)
+                ) for backend in backends_data])
                 
                 conn.commit()
     
@@ -326,23 +325,22 @@ class QuantumDatabase:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                for job in jobs_data:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO jobs 
-                        (job_id, backend_name, status, creation_date, end_date, 
-                         queue_position, estimated_time, result_json, error_message, timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                    ''', (
-                        job.get('job_id', ''),
-                        job.get('backend_name', ''),
-                        job.get('status', ''),
-                        job.get('creation_date'),
-                        job.get('end_date'),
-                        job.get('queue_position', 0),
-                        job.get('estimated_time', ''),
-                        json.dumps(job.get('result', {})),
-                        job.get('error_message', ''),
-                    ))
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO jobs 
+                    (job_id, backend_name, status, creation_date, end_date, 
+                     queue_position, estimated_time, result_json, error_message, timestamp)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', [(
+                    job.get('job_id', ''),
+                    job.get('backend_name', ''),
+                    job.get('status', ''),
+                    job.get('creation_date'),
+                    job.get('end_date'),
+                    job.get('queue_position', 0),
+                    job.get('estimated_time', ''),
+                    json.dumps(job.get('result', {})),
+                    job.get('error_message', ''),
+                ) for job in jobs_data])
                 
                 conn.commit()
     
@@ -368,21 +366,25 @@ class QuantumDatabase:
     
     def store_quantum_state(self, state_data: Dict[str, Any]):
         """Store quantum state data"""
+        self.store_quantum_states([state_data])
+    
+    def store_quantum_states(self, states_data: List[Dict[str, Any]]):
+        """Store several quantum states in one transaction"""
         with self.lock:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
+                cursor.executemany('''
                     INSERT INTO quantum_states 
                     (state_name, state_vector, theta, phi, fidelity, timestamp)
                     VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                ''', (
+                ''', [(
                     state_data.get('name', 'current_state'),
                     json.dumps(state_data.get('state_vector', [])),
                     state_data.get('theta', 0.0),
                     state_data.get('phi', 0.0),
                     state_data.get('fidelity', 1.0)
-                ))
+                ) for state_data in states_data])
                 
                 conn.commit()
     
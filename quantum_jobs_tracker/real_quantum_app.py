@@ -1,15 +1,44 @@
 ﻿from flask import Flask, render_template, jsonify, request, redirect, Response, session
+from flask.json.provider import DefaultJSONProvider
 import numpy as np
 import time
 import json
+import logging
+import logging.handlers
+import atexit
 import threading
 import os
 import base64
 import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import math
 import random
+import re
+import html
 import secrets
+import hashlib
+import types
+import queue
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field as dc_field
+from datetime import datetime
+from functools import lru_cache, partial
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    import redis
+except ImportError:
+    redis = None
 # Add current directory to Python path for imports
 import sys
 import os
@@ -25,10 +54,30 @@ except ImportError:
 
 from database import db
 
+# Backend refresh and request diagnostics go through logging so disabled levels cost nothing
+logger = logging.getLogger('quantum_manager')
+# database.py configures the root logger first, so the level is set on ours directly.
+# QJOBS_LOG picks the level; otherwise WARNING, or INFO under FLASK_DEBUG=1
+_default_log_level = 'INFO' if os.environ.get('FLASK_DEBUG') == '1' else 'WARNING'
+_log_level_name = os.environ.get('QJOBS_LOG', _default_log_level).upper()
+_log_level = logging.getLevelNamesMapping().get(_log_level_name)
+logger.setLevel(_log_level if _log_level is not None else _default_log_level)
+# Request threads only enqueue records; formatting and the stderr write happen on the
+# listener's thread
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.handlers[0].setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False
+_log_listener.start()
+atexit.register(_log_listener.stop)
+if _log_level is None:
+    logger.warning("Unknown QJOBS_LOG level %r; using %s", _log_level_name, _default_log_level)
+
 # Import IBM Cloud Authentication Policy
 try:
     from ibm_cloud_auth import IBMCloudAuthPolicy, setup_ibm_cloud_auth_policy
-    from secure_token_manager import init_token_manager, get_user_token, store_user_token, validate_user_token
+    from secure_token_manager import init_token_manager, get_user_token, store_user_token, validate_user_token, delete_user_token
     WATSONX_AUTH_AVAILABLE = True
     print("✅ IBM watsonx.ai Authentication Policy loaded")
 except ImportError as e:
@@ -39,6 +88,44 @@ except ImportError as e:
 import matplotlib
 matplotlib.use('Agg')  # Must be before importing pyplot
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes jsonify() responses with orjson when it is installed
+
+    Honours sort_keys and compact like the default provider; anything orjson cannot
+    encode, even through default(), goes through the stdlib encoder instead.
+    """
+
+    def _orjson_dumps(self, obj, indent=False):
+        # Dates keep Flask's HTTP-date format by going through default()
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is not None:
+            try:
+                return self._orjson_dumps(obj, indent=kwargs.get('indent')).decode('utf-8')
+            except TypeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if orjson is not None:
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = (self.compact is None and self._app.debug) or self.compact is False
+            try:
+                body = self._orjson_dumps(obj, indent=indent)
+            except TypeError:
+                pass
+            else:
+                return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+        return super().response(*args, **kwargs)
 
 # Set up path for templates and static files
 app = Flask(__name__,
@@ -47,6 +134,99 @@ app = Flask(__name__,
 
 # Configure Flask app
 app.secret_key = secrets.token_hex(32)
+app.json = OrjsonProvider(app)
+# Responses are consumed by the dashboards, not read by people: no key sorting and no
+# indentation, even in debug mode (Flask 2.3 replaced JSON_SORT_KEYS and
+# JSONIFY_PRETTYPRINT_REGULAR with these provider attributes)
+app.json.sort_keys = False
+app.json.compact = True
+
+def _json_body(payload):
+    """Serialize payload to JSON bytes, with orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass  # Types orjson does not know about go through Flask's encoder
+    return app.json.dumps(payload).encode('utf-8')
+
+def ojsonify(payload, status=200):
+    """jsonify() replacement for the large polled payloads, serialized with orjson when available"""
+    return Response(_json_body(payload), status=status, mimetype='application/json')
+
+def _cached_json(key, builder, redis_key=None, updated_at=0):
+    """JSON response for key, reusing the bytes serialized by an earlier request within RESPONSE_CACHE_TTL
+
+    builder() is only called on a miss; key should include whatever the payload depends on.
+    With redis_key and the Redis response cache enabled, a miss first tries the body
+    published by _publish_responses(), used only if it was published for an update no
+    older than updated_at.
+    """
+    now = time.monotonic()
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None and now - cached[0] < RESPONSE_CACHE_TTL:
+            _response_cache.move_to_end(key)
+            return Response(cached[1], mimetype='application/json')
+    body = None
+    if redis_key is not None and _response_redis is not None:
+        try:
+            published = _response_redis.get(redis_key)
+        except Exception as e:
+            logger.debug("Redis read of %s failed: %s", redis_key, e)
+        else:
+            if published is not None:
+                published_at, _, published_body = published.partition(b'\n')
+                try:
+                    if float(published_at) >= updated_at:
+                        body = published_body
+                except ValueError:
+                    pass  # Body from an older release without the timestamp header
+    if body is None:
+        body = _json_body(builder())
+    with _response_cache_lock:
+        _response_cache[key] = (now, body)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+    return Response(body, mimetype='application/json')
+
+def _response_redis_key(name, credential_key):
+    """Redis key of a published body, scoped to the account (see _credential_key) it was built for"""
+    return f"{name}:{hashlib.sha256(repr(credential_key).encode('utf-8')).hexdigest()[:16]}"
+
+def _publish_responses(backend_data, job_data, credential_key, updated_at):
+    """Store the /backends and /jobs bodies in Redis for other workers; no-op unless enabled
+
+    Each body is prefixed with the update time and a newline, which _cached_json() checks.
+    """
+    if _response_redis is None:
+        return
+    header = f"{updated_at!r}\n".encode('ascii')
+    try:
+        pipe = _response_redis.pipeline(transaction=False)
+        pipe.set(_response_redis_key('api:backends', credential_key), header + _json_body(backend_data),
+                 ex=REDIS_RESPONSE_TTL)
+        pipe.set(_response_redis_key('api:jobs', credential_key), header + _json_body(job_data),
+                 ex=REDIS_RESPONSE_TTL)
+        pipe.execute()
+    except Exception as e:
+        logger.warning("Failed to publish responses to Redis: %s", e)
+
+def _stream_json_list(items):
+    """JSON array response written one element at a time
+
+    Only one serialized element is held at once, and the first bytes go out before the
+    last element is encoded; meant for the long lists carrying visualizations or counts.
+    """
+    def generate():
+        yield b'['
+        sep = b''
+        for item in items:
+            yield sep + _json_body(item)
+            sep = b','
+        yield b']'
+    return Response(generate(), mimetype='application/json')
 
 # Load IBM Quantum credentials from environment
 ibm_quantum_token = os.getenv('IBM_QUANTUM_TOKEN')
@@ -71,6 +251,7 @@ class QuantumManagerSingleton:
     """Singleton pattern for QuantumBackendManager to avoid reinitialization"""
     _instance = None
     _manager = None
+    _lock = threading.RLock()  # connect_with_credentials can re-enter via the manager
 
     def __new__(cls):
         if cls._instance is None:
@@ -78,19 +259,22 @@ class QuantumManagerSingleton:
         return cls._instance
 
     def get_manager(self, token=None, crn=None):
-        if self._manager is None and token:
-            self._manager = QuantumBackendManager(token, crn)
-        elif self._manager is not None and token:
-            # Update credentials if provided
-            if hasattr(self._manager, 'connect_with_credentials'):
+        if not token:
+            return self._manager
+        with self._lock:
+            if self._manager is None:
+                self._manager = QuantumBackendManager(token, crn)
+            elif hasattr(self._manager, 'connect_with_credentials'):
+                # Update credentials if provided
                 self._manager.connect_with_credentials(token, crn)
-        return self._manager
+            return self._manager
 
     def reset_manager(self):
         """Reset the manager instance"""
-        self._manager = None
+        with self._lock:
+            self._manager = None
 
-    def is_connected(self):
+    def is_manager_connected(self):
         """Check if manager is connected"""
         return self._manager is not None and hasattr(self._manager, 'is_connected') and self._manager.is_connected
 
@@ -369,10 +553,557 @@ except Exception as e:
     print("   Please install with: pip install qiskit-ibm-runtime")
     IBM_PACKAGES_AVAILABLE = False
 
+# Cache lifetimes (seconds) for data fetched from IBM Quantum
+BACKENDS_CACHE_TTL = 10  # Raw backend list from provider.backends()
+BACKEND_PROPERTIES_CACHE_TTL = 60  # Processed configuration/properties per backend
+
+# Assembled job results; terminal jobs never change, others are refetched after the TTL
+JOB_RESULT_CACHE_TTL = 30
+JOB_RESULT_CACHE_SIZE = 512
+_TERMINAL_JOB_STATUSES = frozenset({'done', 'cancelled', 'error'})
+# Finished jobs whose results are prewarmed after each refresh, and the seconds a job
+# whose result could not be fetched is left out of the prewarm
+JOB_RESULT_PREWARM_LIMIT = 8
+JOB_RESULT_FAILURE_TTL = 60
+
+# Jobs listed per page; the page after the one just served is fetched ahead of time
+JOBS_PAGE_SIZE = 50
+# Unfinished jobs looked up individually per refresh when the job listings do not cover them
+JOB_REFRESH_MAX_LOOKUPS = 8
+
+# Rendered backend visualizations, keyed on the backend fields they are drawn from
+VISUALIZATION_CACHE_SIZE = 256
+
+# Transpiled circuits kept per (circuit structure, backend name)
+TRANSPILE_CACHE_SIZE = 64
+
+# Ranked recommendations, keyed on the backend fields and parameters they are computed from
+RECOMMENDATION_CACHE_SIZE = 32
+# Seconds before recommendations and predictions trigger a background refresh of backend data
+RECOMMENDATION_DATA_MAX_AGE = 60
+
+# Serialized /backends and /jobs bodies, reused by dashboard polls arriving within the TTL
+RESPONSE_CACHE_TTL = 2.0
+RESPONSE_CACHE_SIZE = 8
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# Set QUANTUM_REDIS_CACHE=1 to publish the serialized /backends and /jobs bodies to Redis
+# (REDIS_URL) after every data update, so any worker can serve them without its own manager
+REDIS_RESPONSE_CACHE = os.getenv('QUANTUM_REDIS_CACHE') == '1' and redis is not None
+REDIS_RESPONSE_TTL = 30
+_response_redis = None
+if REDIS_RESPONSE_CACHE:
+    try:
+        _response_redis = redis.from_url(os.getenv('REDIS_URL', 'redis://localhost:6379'),
+                                         socket_timeout=0.5, decode_responses=False)
+    except Exception as e:
+        logger.warning("Redis response cache disabled: %s", e)
+
+# Browser cache lifetime (seconds) for the rendered dashboard pages
+DASHBOARD_PAGE_MAX_AGE = 60
+
+# Upper bound on concurrent job result downloads, across all callers; a slot is only
+# held for the job.result() download, never while waiting for a job to finish
+JOB_RESULT_FETCH_WORKERS = 8
+_result_fetch_slots = threading.BoundedSemaphore(JOB_RESULT_FETCH_WORKERS)
+# Seconds a result request waits for a queued or running job before answering "not finished"
+JOB_RESULT_WAIT_TIMEOUT = float(os.getenv('IBMQ_RESULT_WAIT_S', 30))
+
+# Seconds between status checks while waiting for a job to finish; never below 100 ms
+MIN_POLL_INTERVAL = 0.1
+DEFAULT_POLL_INTERVAL = float(os.getenv('IBMQ_POLL_INTERVAL_S', 1.0))
+
+# Upper bound on concurrent configuration()/properties() calls to IBM Quantum
+BACKEND_FETCH_WORKERS = 8
+
+# Seconds to wait for service.backends() when probing a connection candidate
+CONNECTION_PROBE_TIMEOUT = float(os.getenv('IBM_QUANTUM_PROBE_TIMEOUT', 5))
+
+# Connection probes run here so a hung request can't stall startup; a probe that
+# times out keeps its worker until the request returns, hence more than one worker
+_probe_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ibm-probe')
+
+# set_token() hands manager construction (IBM Quantum auth, several round trips) to this
+# worker so the request returns at once; one worker keeps credential updates in order
+_init_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quantum-init')
+
+@dataclass(slots=True)
+class BackendInfo:
+    """Fixed schema for one entry of the get_backends() list view"""
+    name: str
+    num_qubits: int
+    backend_version: str = 'unknown'
+    last_update_date: str = 'unknown'
+    operational: bool = True  # Assume operational if we can access it
+    pending_jobs: int = 0  # Will be updated later
+    real_data: bool = True
+    gate_errors: dict = dc_field(default_factory=dict)
+    readout_errors: dict = dc_field(default_factory=dict)
+    t1_times: dict = dc_field(default_factory=dict)
+    t2_times: dict = dc_field(default_factory=dict)
+    coupling_map: list = dc_field(default_factory=list)
+    basis_gates: list = dc_field(default_factory=list)
+    conditional: bool = False
+    open_pulse: bool = False
+    memory: bool = False
+    max_shots: int = 0
+    max_experiments: int = 0
+
+    def as_dict(self):
+        """Shallow dict view for JSON responses and existing dict-based callers"""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+@dataclass(slots=True, frozen=True)
+class BackendSummary:
+    """One backend as returned by the /backends endpoint
+
+    orjson encodes slotted dataclasses directly, and Flask's encoder falls back to
+    dataclasses.asdict(), so instances go into responses as they are.
+    """
+    name: str
+    num_qubits: int
+    status: str = 'active'
+    pending_jobs: int = 0
+    operational: bool = True
+    visualization: str = None
+    visualization_format: str = None
+    real_data: bool = True
+
+@dataclass(slots=True)
+class _InFlight:
+    """Result slot shared by callers waiting on one in-progress fetch"""
+    done: threading.Event = dc_field(default_factory=threading.Event)
+    result: object = None
+    error: Exception = None
+
+# Backend histograms are four labelled bars, so they are emitted as an SVG string
+# instead of going through a matplotlib figure; set QUANTUM_MPL_HISTOGRAMS=1 for PNGs
+USE_MATPLOTLIB_HISTOGRAMS = os.getenv('QUANTUM_MPL_HISTOGRAMS') == '1'
+HISTOGRAM_IMAGE_FORMAT = 'png' if USE_MATPLOTLIB_HISTOGRAMS else 'svg+xml'
+
+_HIST_SVG = (
+    "<svg xmlns='http://www.w3.org/2000/svg' width='480' height='300' viewBox='0 0 480 300' "
+    "font-family='sans-serif'>"
+    "<rect width='480' height='300' fill='white'/>"
+    "<text x='240' y='24' text-anchor='middle' font-size='16' font-weight='bold'>{title} Measurement Results</text>"
+    "<line x1='50' y1='250' x2='450' y2='250' stroke='#333'/>"
+    "<line x1='50' y1='50' x2='50' y2='250' stroke='#333'/>"
+    "{bars}"
+    "<text x='240' y='290' text-anchor='middle' font-size='12' font-style='italic'>{info}</text>"
+    "</svg>"
+)
+_HIST_SVG_BAR = (
+    "<rect x='{x}' y='{y:.1f}' width='70' height='{h:.1f}' fill='{color}'/>"
+    "<text x='{cx}' y='{label_y:.1f}' text-anchor='middle' font-size='12' font-weight='bold'>{prob:.2f}</text>"
+    "<text x='{cx}' y='268' text-anchor='middle' font-size='12'>{outcome}</text>"
+)
+_HIST_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728')
+_HIST_OUTCOMES = ('00', '01', '10', '11')
+# (active, operational) -> outcome probabilities before pending-job noise: a Bell state
+# for working backends, a mixed state when not operational, mostly |00> when inactive
+_HIST_BASE_PROBS = {
+    (True, True): (0.5, 0.0, 0.0, 0.5),
+    (True, False): (0.4, 0.1, 0.1, 0.4),
+    (False, False): (0.8, 0.05, 0.05, 0.1),
+}
+_FALLBACK_OUTCOMES = ('|00âŸ©', '|01âŸ©', '|10âŸ©', '|11âŸ©')
+_FALLBACK_PROBS = (0.5, 0.2, 0.2, 0.1)
+
+def _render_histogram_svg(backend_name, outcomes, probabilities, info_text):
+    """Render the backend histogram as a base64-encoded SVG (200 px = probability 1)"""
+    bars = "".join(
+        _HIST_SVG_BAR.format(x=70 + 100 * i, cx=105 + 100 * i, y=250 - 200 * prob, h=200 * prob,
+                             label_y=244 - 200 * prob, color=_HIST_COLORS[i % len(_HIST_COLORS)],
+                             prob=prob, outcome=html.escape(outcome))
+        for i, (outcome, prob) in enumerate(zip(outcomes, probabilities))
+    )
+    svg = _HIST_SVG.format(title=html.escape(backend_name), bars=bars, info=html.escape(info_text))
+    return base64.b64encode(svg.encode('utf-8')).decode('ascii')
+
+# qiskit and its visualization stack are imported on first use and kept for the process
+_QK = None
+
+def _qk():
+    """Namespace of the qiskit names the manager uses, imported once"""
+    global _QK
+    if _QK is None:
+        from qiskit import QuantumCircuit, transpile
+        from qiskit.visualization import circuit_drawer, plot_bloch_vector
+        _QK = types.SimpleNamespace(
+            QuantumCircuit=QuantumCircuit,
+            transpile=transpile,
+            circuit_drawer=circuit_drawer,
+            plot_bloch_vector=plot_bloch_vector,
+        )
+    return _QK
+
+# Single-qubit gate matrices for apply_quantum_gate; rotations follow qiskit's conventions
+_GATES = {
+    'h': np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2),
+    'x': np.array([[0, 1], [1, 0]], dtype=complex),
+    'y': np.array([[0, -1j], [1j, 0]], dtype=complex),
+    'z': np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+def _rotation_gate(gate_type, angle):
+    """RX/RY/RZ matrix for angle, or None for an unknown gate type"""
+    angle = float(angle)
+    c, s = np.cos(angle / 2), np.sin(angle / 2)
+    if gate_type == 'rx':
+        return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+    if gate_type == 'ry':
+        return np.array([[c, -s], [s, c]], dtype=complex)
+    if gate_type == 'rz':
+        return np.array([[np.exp(-0.5j * angle), 0], [0, np.exp(0.5j * angle)]], dtype=complex)
+    return None
+
+def _bloch(alpha, beta):
+    """Bloch vector [x, y, z] of alpha|0> + beta|1>, using x + iy = 2 * alpha * conj(beta)"""
+    alpha, beta = complex(alpha), complex(beta)
+    xy = 2 * alpha * beta.conjugate()
+    return [xy.real, xy.imag, abs(alpha) ** 2 - abs(beta) ** 2]
+
+def _finalize_state(state):
+    """Attach the fields the state-info getters report, computed once when the state is set"""
+    alpha = state.get('alpha', 1.0)
+    beta = state.get('beta', 0.0)
+    
+    # Convert the Bloch vector to spherical coordinates; theta is 0 at the origin and phi
+    # is 0 whenever x is 0, as the state-info endpoints have always reported
+    v = np.asarray(state['vector'], dtype=np.float64)
+    r = float(np.linalg.norm(v))
+    state['_spherical'] = {
+        'r': r,
+        'theta': float(np.arccos(np.clip(v[2] / r, -1.0, 1.0))) if r > 0 else 0.0,
+        'phi': float(np.arctan2(v[1], v[0])) if v[0] != 0 else 0.0
+    }
+    
+    # Fidelity (assuming target is |0âŸ© state)
+    # <target|rho|target> for target [0, 0, 1] reduces to (1 + z) / 2
+    state['_fidelity_z'] = float(0.5 * (1.0 + v[2]))
+    
+    alpha_abs = state['_alpha_abs'] = float(abs(alpha))
+    beta_abs = state['_beta_abs'] = float(abs(beta))
+    beta_phase = state['_beta_phase'] = float(np.angle(beta))
+    state['_equation_str'] = f"|ÏˆâŸ© = {alpha:.3f}|0âŸ© + {beta:.3f}|1âŸ©"
+    state['_equation_polar'] = f"|ÏˆâŸ© = {alpha_abs:.3f}|0âŸ© + {beta_abs:.3f}e^(i{beta_phase:.3f})|1âŸ©"
+    return state
+
+def _credential_key(token, crn):
+    """Comparable identity of a token/CRN pair: sha256 of the token, and the CRN with '' as None
+
+    The digest keeps the raw token out of the connection bookkeeping and is compared at
+    fixed length.
+    """
+    return (hashlib.sha256(token.encode('utf-8')).hexdigest() if token else None, crn or None)
+
+def _build_job_summarizer(sample):
+    """Return a job -> (job_id, backend_name, status) function specialised for the class of sample
+
+    The /jobs provider fallback only needs these three fields; whether each is a method
+    or a plain attribute is resolved once per job class.
+    """
+    if not hasattr(sample, 'job_id'):
+        get_id = str
+    elif callable(sample.job_id):
+        get_id = lambda job: job.job_id()
+    else:
+        get_id = lambda job: job.job_id
+
+    if not hasattr(sample, 'backend'):
+        get_backend = lambda job: "unknown"
+    elif callable(sample.backend):
+        get_backend = lambda job: getattr(job.backend(), 'name', 'unknown')
+    else:
+        get_backend = lambda job: str(job.backend)
+
+    if not hasattr(sample, 'status'):
+        get_status = lambda job: "unknown"
+    elif callable(sample.status):
+        get_status = lambda job: str(job.status())
+    else:
+        get_status = lambda job: str(job.status)
+
+    return lambda job: (get_id(job), get_backend(job), get_status(job))
+
+# job class -> summarizer from _build_job_summarizer
+_job_summarizers = {}
+
+def _build_job_extractor(sample):
+    """Return a job -> job_data function specialised for the class of sample
+
+    Which attributes a runtime job class exposes is fixed, so it is resolved once here
+    instead of being probed with hasattr for every job.
+    """
+    job_id_is_method = callable(getattr(sample, 'job_id', None))
+    has_job_id = hasattr(sample, 'job_id')
+    backend_attr = next((a for a in ('backend', 'backend_name') if hasattr(sample, a)), None)
+    has_status = hasattr(sample, 'status')
+    has_creation_date = hasattr(sample, 'creation_date')
+    has_shots = hasattr(sample, 'shots')
+    has_input_params = not has_shots and hasattr(sample, 'input_params')
+
+    def extract(job):
+        if job_id_is_method:
+            job_id = str(job.job_id())
+        elif has_job_id:
+            job_id = str(job.job_id)
+        else:
+            job_id = str(job)[:20]
+
+        backend_name = str(getattr(job, backend_attr)) if backend_attr else 'unknown'
+
+        status = 'unknown'
+        if has_status:
+            raw_status = job.status()
+            status_name = getattr(raw_status, 'name', None)
+            if status_name is None:
+                status_name = getattr(raw_status, 'value', raw_status)
+            status = str(status_name).lower()
+
+        created_time = job.creation_date if has_creation_date else None
+        if not created_time:
+            start_time = time.time() - 600  # Default to 10 minutes ago
+        elif hasattr(created_time, 'timestamp'):
+            start_time = created_time.timestamp()
+        else:
+            start_time = time.mktime(created_time.timetuple())
+
+        if has_shots:
+            shots = job.shots
+        elif has_input_params:
+            shots = getattr(job.input_params, 'shots', 1024)
+        else:
+            shots = 1024
+
+        return {
+            "id": job_id,
+            "backend": backend_name,
+            "status": status,
+            "qubits": 5,  # Will be updated from backend info
+            "created": start_time,
+            "shots": shots,
+            "real_data": True
+        }
+
+    return extract
+
+def _job_columns(jobs):
+    """Struct-of-arrays copy of job dicts, for vectorised filtering and counting"""
+    count = len(jobs)
+    return {
+        'id': np.array([job.get('id') for job in jobs], dtype=object),
+        'backend': np.array([job.get('backend') for job in jobs], dtype=object),
+        'status': np.array([str(job.get('status', '')).lower() for job in jobs], dtype=object),
+        'created': np.fromiter((job.get('created') or 0.0 for job in jobs), dtype=np.float64, count=count),
+        'shots': np.fromiter((job.get('shots') or 0 for job in jobs), dtype=np.int64, count=count),
+    }
+
+# Performance model behind the recommendation predictions, one column per parameter.
+# The last row is the profile for backends not listed here, so an index of -1 selects it.
+_BACKEND_PROFILES = (
+    # name, base_time, qubit_factor, parallel_jobs, queue_efficiency, priority_factor, max_parallel, efficiency
+    ('ibm_belem', 45, 0.8, 1, 0.8, 1.0, 1, 0.8),
+    ('ibm_lagos', 35, 0.7, 1, 0.85, 1.0, 1, 0.85),
+    ('ibm_quito', 50, 0.9, 1, 0.75, 1.0, 1, 0.75),
+    ('ibmq_qasm_simulator', 5, 0.1, 10, 0.95, 0.5, 10, 0.95),
+    ('ibm_oslo', 25, 0.5, 2, 0.9, 0.8, 2, 0.9),
+    ('ibm_brisbane', 20, 0.4, 3, 0.92, 0.7, 3, 0.92),
+    ('ibm_pittsburgh', 18, 0.35, 3, 0.95, 0.6, 3, 0.95),
+    ('ibm_sherbrooke', 15, 0.3, 4, 0.98, 0.5, 4, 0.98),
+    (None, 30, 0.6, 1, 0.8, 1.0, 1, 0.8),
+)
+_BACKEND_INDEX = {sys.intern(row[0]): i for i, row in enumerate(_BACKEND_PROFILES[:-1])}
+(_BASE_TIME, _QUBIT_FACTOR, _PARALLEL_JOBS, _QUEUE_EFFICIENCY,
+ _PRIORITY_FACTOR, _MAX_PARALLEL, _EFFICIENCY) = np.array([row[1:] for row in _BACKEND_PROFILES], dtype=np.float64).T
+
+# Source of the +/-10% runtime and +/-15% wait variance in predictions
+_rng = np.random.default_rng()
+
+# Algorithm complexity -> runtime multiplier (Bell states / Grover, VQE / QAOA, error correction)
+_COMPLEXITY_RUNTIME = {'low': 0.6, 'medium': 1.0, 'high': 2.2}
+# Algorithm complexity -> share of the backend's throughput left for such jobs
+_COMPLEXITY_THROUGHPUT = {'low': 1.0, 'medium': 0.8, 'high': 0.6}
+
+@lru_cache(maxsize=8)
+def _time_of_day_factor_for(bucket):
+    """Queue slowdown for usage at the local hour of a 10-minute bucket of epoch time"""
+    current_hour = time.localtime(bucket * 600).tm_hour
+    if 9 <= current_hour <= 17:  # Business hours
+        return 1.2  # 20% slower during peak hours
+    if 18 <= current_hour <= 22:  # Evening
+        return 1.1  # 10% slower
+    return 0.8  # Night/early morning: 20% faster
+
+def _time_of_day_factor():
+    return _time_of_day_factor_for(int(time.time() // 600))
+
+def _predict_backends(backends, job_complexity='medium', time_factor=None):
+    """Predicted runtime (s), queue wait (s) and throughput (jobs/h) for each backend dict, as arrays
+
+    time_factor defaults to the current _time_of_day_factor().
+    """
+    count = len(backends)
+    idx = np.fromiter((_BACKEND_INDEX.get(b.get('name', 'unknown'), -1) for b in backends), dtype=np.intp, count=count)
+    num_qubits = np.fromiter((int(b.get('num_qubits', 5) or 5) for b in backends), dtype=np.float64, count=count)
+    pending_jobs = np.fromiter((int(b.get('pending_jobs', 0) or 0) for b in backends), dtype=np.float64, count=count)
+    complexity = str(job_complexity).lower()
+    runtime_variance, wait_variance = _rng.uniform(size=(2, count))
+    
+    # Runtime: backend base time scaled by qubit count and algorithm complexity, plus
+    # compilation and execution overhead, with +/-10% variance
+    complexity_factor = _COMPLEXITY_RUNTIME.get(complexity, 1.0)
+    runtime = (_BASE_TIME[idx] * (1 + num_qubits * _QUBIT_FACTOR[idx] * 0.1) * complexity_factor
+               + (8 + num_qubits * 0.5) + (5 + complexity_factor * 3))
+    runtime = np.maximum(2.0, runtime * (0.9 + 0.2 * runtime_variance))
+    
+    # Wait: pending jobs spread over the parallel slots, slowed by queue inefficiency,
+    # sped up by priority and scaled for the time of day, with +/-15% variance
+    if time_factor is None:
+        time_factor = _time_of_day_factor()
+    wait = pending_jobs / _PARALLEL_JOBS[idx] * runtime / _QUEUE_EFFICIENCY[idx] * _PRIORITY_FACTOR[idx] * time_factor
+    wait = np.maximum(0.0, wait * (0.85 + 0.3 * wait_variance))
+    
+    # Throughput: parallel slots at the backend's efficiency; complex jobs reduce it further
+    throughput_factor = _COMPLEXITY_THROUGHPUT.get(complexity, 0.8)
+    throughput = 3600.0 / runtime * _MAX_PARALLEL[idx] * _EFFICIENCY[idx] * throughput_factor
+    return runtime, wait, throughput
+
+# Explanation attached to each recommendation
+_EXPL_TMPL = ("algorithm={}, weights(queue={:.2f}, operational={:.2f}, qubits={:.2f}), "
+              "queue_score={:.2f}, operational_score={:.2f}, qubit_score={:.2f}, "
+              "predicted_wait={:.2f}s, throughput={:.2f} jobs/h")
+
+def _score_weights(algorithm, min_qubits):
+    """(queue, operational, qubits) score weights for a recommendation algorithm"""
+    algo = str(algorithm).lower()
+    if algo in ('fastest_queue', 'low_latency'):
+        return 0.8, 0.2, 0.0
+    if algo == 'highest_qubits':
+        return 0.1, 0.2, 0.7
+    if algo == 'auto':
+        # If requirement is heavy on qubits, bias toward qubit capacity
+        return (0.2, 0.2, 0.6) if min_qubits >= 64 else (0.6, 0.3, 0.1)
+    return 0.5, 0.3, 0.2  # balanced
+
+def _score_kernel(pending, operational, num_qubits, wait, min_qubits, w_queue, w_oper, w_qubits, max_wait):
+    """0..1 backend scores plus their queue and qubit components, over arrays of backends"""
+    queue_scores = 1.0 / (1.0 + np.maximum(pending, 0.0))
+    if min_qubits > 0:
+        # Reward meeting/exceeding requirement, diminishing returns
+        qubit_scores = np.minimum(1.0, np.maximum(0.1, 0.5 + 0.5 * (num_qubits - min_qubits) / max(1.0, min_qubits)))
+        qubit_scores = np.where(num_qubits < min_qubits, 0.0, qubit_scores)
+    else:
+        qubit_scores = np.minimum(1.0, num_qubits / 127.0)
+    scores = w_queue * queue_scores + w_oper * operational + w_qubits * qubit_scores
+    scores = np.where(wait > max_wait, scores * 0.5, scores)
+    return np.minimum(1.0, np.maximum(0.0, scores)), queue_scores, qubit_scores
+
+if njit is not None:
+    _score_kernel = njit(cache=True)(_score_kernel)
+
+def _score_backends(backends, waits, algorithm, requirements):
+    """Score backend dicts against requirements; returns (weights, scores, queue_scores, qubit_scores)"""
+    count = len(backends)
+    min_qubits = int(requirements.get('min_qubits', 0) or 0)
+    max_wait = requirements.get('max_wait_seconds')
+    max_wait = float(max_wait) if isinstance(max_wait, (int, float)) else np.inf
+    weights = _score_weights(algorithm, min_qubits)
+    pending = np.fromiter((int(b.get('pending_jobs', 0) or 0) for b in backends), dtype=np.float64, count=count)
+    operational = np.fromiter((1.0 if b.get('operational', False) else 0.0 for b in backends), dtype=np.float64, count=count)
+    num_qubits = np.fromiter((int(b.get('num_qubits', 0) or 0) for b in backends), dtype=np.float64, count=count)
+    return (weights,) + tuple(_score_kernel(pending, operational, num_qubits, np.asarray(waits, dtype=np.float64),
+                                            float(min_qubits), *weights, max_wait))
+
+def _rank_backends(scores, waits, pending, top_k):
+    """Indices of the top_k backends by score, then shortest wait, then fewest pending jobs
+
+    Scores and waits are compared at the precision they are reported with. When only the
+    top few are wanted, candidates are first cut down to those scoring at least the k-th best.
+    """
+    scores = np.round(scores, 4)
+    waits = np.round(waits, 2)
+    candidates = np.arange(len(scores))
+    if 0 < top_k < len(scores):
+        kth_best = -np.partition(-scores, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(scores >= kth_best)
+    order = candidates[np.lexsort((pending[candidates], waits[candidates], -scores[candidates]))]
+    return order[:top_k] if top_k > 0 else order
+
+# Known device sizes, used when configuration() does not report n_qubits
+_DEVICE_QUBIT_MAP = {
+    'ibm_brisbane': 127,
+    'ibm_pittsburgh': 133,
+    'ibm_manila': 5,
+    'ibm_lima': 5,
+    'ibm_belem': 5,
+    'ibm_quito': 5,
+}
+
+# Matches the repr of runtime backends, e.g. <IBMBackend('ibm_brisbane')>
+_IBM_NAME_RE = re.compile(r"IBMBackend\('([^']+)'\)")
+
+# Backend snapshots waiting to be persisted; the writer only keeps the newest one
+_db_writer_queue = queue.Queue(maxsize=8)
+
+def _db_writer_loop():
+    """Persist backend snapshots off the request thread, coalescing queued updates"""
+    while True:
+        backend_list = _db_writer_queue.get()
+        while True:
+            try:
+                backend_list = _db_writer_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        try:
+            # Hold the database lock so the snapshot and status row land together
+            with db.lock:
+                db.store_backends(backend_list)
+                db.update_system_status(True)
+            logger.info("Backend data stored in database")
+        except Exception as e:
+            logger.warning("Failed to store backend data in database: %s", e)
+            try:
+                db.update_system_status(False, str(e))
+            except Exception:
+                pass
+
+_db_writer_thread = threading.Thread(target=_db_writer_loop, daemon=True, name='db-writer')
+_db_writer_thread.start()
+
+# Quantum states are written in batches: the flush loop collects whatever arrives
+# within STATE_FLUSH_INTERVAL of the first queued state and commits it in one go
+STATE_FLUSH_INTERVAL = 0.25
+_state_writer_queue = queue.Queue()
+
+def _state_writer_loop():
+    """Persist queued quantum states with one executemany per batch"""
+    while True:
+        batch = [_state_writer_queue.get()]
+        deadline = time.monotonic() + STATE_FLUSH_INTERVAL
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_state_writer_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            db.store_quantum_states(batch)
+        except Exception as e:
+            logger.warning("Failed to store %d quantum states in database: %s", len(batch), e)
+
+_state_writer_thread = threading.Thread(target=_state_writer_loop, daemon=True, name='state-writer')
+_state_writer_thread.start()
+
 class QuantumBackendManager:
     """Manager for IBM Quantum backends - REAL DATA ONLY"""
     
-    def __init__(self, token=None, crn=None):
+    def __init__(self, token=None, crn=None, poll_interval_s=None):
         print("\n🔧 QuantumBackendManager Initialization:")
         print(f"   📝 Token provided: {'Yes' if token else 'No'} ({len(token) if token else 0} chars)")
         print(f"   📝 CRN provided: {'Yes' if crn else 'No'} ({len(crn) if crn else 0} chars)")
@@ -388,6 +1119,42 @@ class QuantumBackendManager:
         self.quantum_states = []  # Store quantum state vectors
         self.current_state = None  # Current quantum state
         self.last_update_time = 0  # Timestamp of last successful data update
+        self._backends_cache = None  # (monotonic timestamp, raw backend list)
+        self._props_cache = {}  # (backend name, include_details) -> (monotonic timestamp, properties dict)
+        self._backend_pool = None  # Shared executor for per-backend property fetches
+        self._name_cache = {}  # id(backend) -> name, cleared at the start of each refresh
+        self._calibration_cache = {}  # backend name -> (last_update_date, extracted calibration maps)
+        self._backend_handles = {}  # backend name -> provider backend object, reused across submissions
+        self._transpile_cache = OrderedDict()  # (circuit structure, backend name) -> transpiled circuit, LRU order
+        self._handles_lock = threading.Lock()  # Guards _backend_handles across request threads
+        self._transpile_lock = threading.Lock()  # Guards _transpile_cache across request threads
+        self._result_cache = OrderedDict()  # job_id -> (monotonic timestamp, status, result_data), LRU order
+        self._result_lock = threading.Lock()
+        self._result_failures = {}  # job_id -> monotonic timestamp of the last failed prewarm fetch
+        self._result_prewarming = set()  # job ids with a prewarm fetch in flight
+        self._viz_cache = OrderedDict()  # visualization inputs -> encoded image, LRU order
+        self._viz_lock = threading.Lock()
+        self._reco_cache = OrderedDict()  # recommendation inputs -> ranked list, LRU order
+        self._reco_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # Held while a background update_data() runs
+        # PNG histograms are drawn on one long-lived figure outside pyplot's global state
+        self._fig_hist = Figure(figsize=(8, 5))
+        self._canvas_hist = FigureCanvasAgg(self._fig_hist)
+        self._fig_buf = io.BytesIO()
+        self._fig_lock = threading.Lock()
+        self._prefetched_jobs = None  # (offset, limit, Future) for the next jobs page
+        self._jobs_by_id = {}  # job id -> job dict, merged across incremental refreshes
+        self._jobs_last_seen_ts = 0  # creation time of the newest merged job
+        self._jobs_lock = threading.Lock()  # Serializes fetch + merge into _jobs_by_id
+        self._job_extractors = {}  # job class -> extractor specialised by _build_job_extractor
+        self.http_session = None  # Runtime service's requests.Session once tuned
+        self.data_ready = threading.Event()  # Set once the post-connect data load has finished
+        self._init_lock = threading.Lock()  # One connection attempt at a time per manager
+        self._connected_key = None  # _credential_key() of the credentials is_connected refers to
+        self._probe_timeout = CONNECTION_PROBE_TIMEOUT
+        self.poll_interval_s = max(MIN_POLL_INTERVAL, DEFAULT_POLL_INTERVAL if poll_interval_s is None else poll_interval_s)
+        self._backends_flight = None  # _InFlight for the get_backends() call in progress
+        self._flight_lock = threading.Lock()
         
         # Only try to connect if we have a token
         if self.token and self.token.strip():
@@ -401,17 +1168,92 @@ class QuantumBackendManager:
             print("ðŸ“Š Quantum manager initialized with sample data mode")
             self.is_connected = False
     
+    @property
+    def job_data(self):
+        """Job dicts as served to the dashboard; job_columns holds the same jobs as arrays"""
+        return self._job_data
+    
+    @job_data.setter
+    def job_data(self, jobs):
+        self._job_data = jobs
+        self.job_columns = _job_columns(jobs)
+        # (job_id, backend, counts, shots, fidelity) for finished jobs that carry counts
+        self._done_jobs = [
+            (job.get('job_id', job.get('id', 'unknown')), job.get('backend', 'unknown'), job['result']['counts'],
+             job['result'].get('shots', 1024), job['result'].get('fidelity', 0.95))
+            for job in jobs
+            if str(job.get('status', '')).lower() == 'done' and 'counts' in (job.get('result') or ())
+        ]
+    
+    @property
+    def backend_data(self):
+        """Backend dicts as served to the dashboard; backend_operational and backend_count mirror them"""
+        return self._backend_data
+    
+    @backend_data.setter
+    def backend_data(self, backends):
+        self._backend_data = backends
+        self._backends_tuple = tuple(backends)  # Read-only snapshot for the ranking helpers
+        self.backend_count = len(backends)  # Read by every /status poll
+        self.backend_operational = np.fromiter((bool(b.get('operational', False)) for b in backends),
+                                               dtype=bool, count=len(backends))
+    
+    def invalidate_cache(self):
+        """Drop cached backend list, properties and job results so the next call refetches"""
+        self._backends_cache = None
+        self._props_cache = {}
+        with self._handles_lock:
+            self._backend_handles = {}
+        with self._transpile_lock:
+            self._transpile_cache.clear()
+        self._prefetched_jobs = None
+        with self._jobs_lock:
+            self._jobs_by_id = {}
+            self._jobs_last_seen_ts = 0
+        with self._reco_lock:
+            self._reco_cache.clear()
+        with self._result_lock:
+            self._result_cache.clear()
+            self._result_failures.clear()
+    
     def connect_with_credentials(self, token, crn=None):
         """Connect to IBM Quantum with provided credentials"""
-        self.token = token
-        self.crn = crn
-        if self.token and self.token.strip():
-            self._initialize_quantum_connection()
-        else:
-            print("ðŸ“Š Initializing quantum connection...")
-            self.is_connected = False
+        key = _credential_key(token, crn)
+        with self._init_lock:
+            # Checked under the lock so a caller that waited on a concurrent connect
+            # with the same credentials returns instead of connecting again
+            if self.is_connected and key == self._connected_key:
+                logger.debug("Already connected with these credentials; skipping reconnect")
+                return
+            if key != self._connected_key:
+                # Don't serve the previous account's backends and jobs while the new ones load
+                self.backend_data = []
+                self.job_data = []
+            self.token = token
+            self.crn = crn
+            self.invalidate_cache()
+            if self.token and self.token.strip():
+                self._connect_locked(key)
+            else:
+                print("ðŸ“Š Initializing quantum connection...")
+                self.is_connected = False
         
     def _initialize_quantum_connection(self):
+        """Serialize connection attempts so concurrent requests don't probe and load twice"""
+        key = _credential_key(self.token, self.crn)
+        with self._init_lock:
+            if self.is_connected and key == self._connected_key:
+                return
+            self._connect_locked(key)
+
+    def _connect_locked(self, key):
+        """Connect with the current credentials, identified by key; caller holds _init_lock"""
+        self._connected_key = None
+        self._connect_unlocked()
+        if self.is_connected:
+            self._connected_key = key
+
+    def _connect_unlocked(self):
         """Initialize connection to IBM Quantum (REAL ONLY - NO SIMULATION)"""
         print("\n🔍 CHECKING IBM QUANTUM REQUIREMENTS:")
         print(f"   📦 IBM_PACKAGES_AVAILABLE: {IBM_PACKAGES_AVAILABLE}")
@@ -439,153 +1281,55 @@ class QuantumBackendManager:
             print("ðŸ”— Connecting to IBM Cloud Quantum Runtime...")
             print(f"âœ… qiskit_ibm_runtime version: {qiskit_ibm_runtime.__version__}")
 
-            # Try different instance configurations in order of preference
-            instances_to_try = []
-
-            # Add user CRN if provided
-            if self.crn and self.crn.strip():
-                instances_to_try.append(self.crn)
-
-            # Add common public instances for fallback
-            instances_to_try.extend([
-                "ibm-q/open/main",  # Main public instance
-                "ibm-q/open/ibm-q-yorktown/main",
-                "ibm-q/open/ibm-q-armonk/main",
-                None  # Try without instance as last resort
-            ])
-
-            connection_successful = False
-
-            for instance in instances_to_try:
-                try:
-                    if instance:
-                        print(f"ðŸ”— Trying instance: {instance}")
-                        service = qiskit_ibm_runtime.QiskitRuntimeService(
-                            channel="ibm_cloud",
-                            token=self.token,
-                            instance=instance
-                        )
-                    else:
-                        print("ðŸ”— Trying without instance (public access)")
-                        service = qiskit_ibm_runtime.QiskitRuntimeService(
-                            channel="ibm_cloud",
-                            token=self.token
-                        )
-
-                    # Test the connection by trying to list backends with timeout
-                    print("ðŸ“¡ Testing connection by fetching backends...")
-                    
-                    # Use threading-based timeout for Windows compatibility
-                    import threading
-                    import queue
-                    
-                    def fetch_backends_with_timeout(service, result_queue, timeout=30):
-                        try:
-                            backends = service.backends()
-                            result_queue.put(('success', backends))
-                        except Exception as e:
-                            result_queue.put(('error', e))
-                    
-                    result_queue = queue.Queue()
-                    thread = threading.Thread(target=fetch_backends_with_timeout, args=(service, result_queue, 30))
-                    thread.daemon = True
-                    thread.start()
-                    thread.join(timeout=30)
-                    
-                    if thread.is_alive():
-                        print(f"â° Connection timeout for instance: {instance}")
-                        continue
-                    
-                    if result_queue.empty():
-                        print(f"â° Connection timeout for instance: {instance}")
-                        continue
-                        
-                    result_type, result_data = result_queue.get()
-                    
-                    if result_type == 'error':
-                        print(f"âš ï¸ Backend fetch failed for {instance}: {str(result_data)[:100]}...")
-                        continue
-                        
-                    backends = result_data
-                    
-                    if backends and len(backends) > 0:
-                        # Store provider and mark connection success
-                        self.provider = service
-                        self.is_connected = True
-                        connection_successful = True
-
-                        # Detailed logging of successful connection
-                        instance_desc = f" (instance: {instance})" if instance else " (public)"
-                        print(f"\n🎉 SUCCESS! Connected to IBM Cloud Quantum Runtime{instance_desc}")
-                        print(f"   📊 Total backends discovered: {len(backends)}")
-                        print("   📋 Real IBM Quantum backends available:")
-
-                        for i, backend in enumerate(backends[:10]):  # Show first 10 backends
-                            backend_name = getattr(backend, 'name', 'Unknown')
-                            backend_qubits = getattr(backend, 'num_qubits', 'Unknown')
-                            backend_status = getattr(backend, 'status', 'Unknown')
-                            print(f"      {i+1:2d}. {backend_name} ({backend_qubits} qubits, {backend_status})")
-
-                        if len(backends) > 10:
-                            print(f"      ... and {len(backends) - 10} more backends")
-
-                        print("\n💾 FETCHING DETAILED BACKEND DATA FROM IBM QUANTUM...")
-                        print("   🔄 This will show real backend configurations...")
-
-                        # Populate backend_data and job_data immediately after connection
-                        self.update_data()
-
-                        # Exit loop once connected
-                        return
-                    else:
-                        print(f"âš ï¸ Service connected but no backends available for instance: {instance}")
-
-                except Exception as inst_err:
-                    print(f"âš ï¸ Instance {instance} failed: {str(inst_err)[:100]}...")
+            for instance, service in self._service_candidates():
+                backends = self._try_connect(service, instance)
+                if not backends:
                     continue
 
-            if not connection_successful:
-                # Try a simpler connection approach without timeout
-                print("ðŸ”„ Trying simpler connection approach...")
-                try:
-                    # Try with just the token, no instance
-                    simple_service = qiskit_ibm_runtime.QiskitRuntimeService(
-                        channel="ibm_cloud",
-                        token=self.token
-                    )
-                    
-                    # Quick test - just try to create the service
-                    print("ðŸ“¡ Testing simple connection...")
-                    self.provider = simple_service
-                    self.is_connected = True
-                    print("âœ… Connected to IBM Cloud Quantum Runtime (simple mode)")
-                    print("   Will fetch backends on first call")
-                    
-                    # Populate backend_data and job_data immediately after connection
-                    print("ðŸ”„ Populating backend and job data...")
-                    self.update_data()
-                    return
-                    
-                except Exception as simple_err:
-                    print(f"âš ï¸ Simple connection also failed: {str(simple_err)[:100]}...")
-
-                    # If all instances failed, provide detailed error
-                    error_msg = "âŒ Could not connect to any IBM Quantum instance."
-                    print(error_msg)
-                    print("ðŸ” Troubleshooting:")
-                    print("   - Network connectivity to IBM Cloud may be blocked")
-                    print("   - Verify your IBM Quantum token is valid")
-                    print("   - Check if you have access to IBM Quantum services")
-                    print("   - Try again later as services might be temporarily unavailable")
-                    print("   - If you have a CRN, ensure it's correct")
-                    print("   - For public access, your token must have IBM Cloud access")
-                    print("   - Check firewall/proxy settings")
-                    print("ðŸ”„ Falling back to sample data for demonstration")
-
-                    self.is_connected = False
-                    self.provider = None
-                    # Don't raise an error - let the app continue with fallback data
-                    return
+                # Store provider and mark connection success
+                self.provider = service
+                self.http_session = self._configure_service_session(service)
+                self.is_connected = True
+
+                # Detailed logging of successful connection
+                instance_desc = f" (instance: {instance})" if instance else " (public)"
+                print(f"\n🎉 SUCCESS! Connected to IBM Cloud Quantum Runtime{instance_desc}")
+                print(f"   📊 Total backends discovered: {len(backends)}")
+                print("   📋 Real IBM Quantum backends available:")
+
+                for i, backend in enumerate(backends[:10]):  # Show first 10 backends
+                    backend_name = getattr(backend, 'name', 'Unknown')
+                    backend_qubits = getattr(backend, 'num_qubits', 'Unknown')
+                    backend_status = getattr(backend, 'status', 'Unknown')
+                    print(f"      {i+1:2d}. {backend_name} ({backend_qubits} qubits, {backend_status})")
+
+                if len(backends) > 10:
+                    print(f"      ... and {len(backends) - 10} more backends")
+
+                print("\n💾 FETCHING DETAILED BACKEND DATA FROM IBM QUANTUM...")
+                print("   🔄 Loading real backend configurations in the background...")
+
+                # Populate backend_data and job_data off the login request
+                self._start_background_update()
+                return
+
+            # If all instances failed, provide detailed error
+            error_msg = "âŒ Could not connect to any IBM Quantum instance."
+            print(error_msg)
+            print("ðŸ” Troubleshooting:")
+            print("   - Network connectivity to IBM Cloud may be blocked")
+            print("   - Verify your IBM Quantum token is valid")
+            print("   - Check if you have access to IBM Quantum services")
+            print("   - Try again later as services might be temporarily unavailable")
+            print("   - If you have a CRN, ensure it's correct")
+            print("   - For public access, your token must have IBM Cloud access")
+            print("   - Check firewall/proxy settings")
+            print("ðŸ”„ Falling back to sample data for demonstration")
+
+            self.is_connected = False
+            self.provider = None
+            # Don't raise an error - let the app continue with fallback data
+            return
             
         except Exception as e:
             print(f"âš ï¸ IBM Cloud Quantum Runtime failed: {str(e)[:200]}...")
@@ -601,35 +1345,133 @@ class QuantumBackendManager:
             self.provider = None
             return
     
+    def _start_background_update(self):
+        """Run the first update_data() on a daemon thread; data_ready is set when it finishes"""
+        self.data_ready.clear()
+        threading.Thread(target=self._background_update, name='quantum-initial-update',
+                         daemon=True).start()
+
+    def _background_update(self):
+        # Waits out a periodic refresh already in flight rather than running alongside it
+        with self._refresh_lock:
+            try:
+                self.update_data()
+            except Exception as e:
+                logger.error("Background data update failed: %s", e)
+            finally:
+                self.data_ready.set()
+
+    def _refresh_in_background(self):
+        """Start update_data() on a daemon thread unless a background refresh is already running"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        
+        def refresh():
+            try:
+                self.update_data()
+            except Exception as e:
+                logger.error("Background data refresh failed: %s", e)
+            finally:
+                self._refresh_lock.release()
+        
+        threading.Thread(target=refresh, name='quantum-refresh', daemon=True).start()
+
+    def _service_candidates(self):
+        """Yield (instance, service) pairs in order of preference, built lazily"""
+        # User CRN first, then the account's default instance. The legacy ibm-q/open/*
+        # hub strings are not accepted by the ibm_cloud channel, so they are not tried.
+        instances = [self.crn] if self.crn and self.crn.strip() else []
+        instances.append(None)
+
+        for instance in instances:
+            try:
+                if instance:
+                    print(f"ðŸ”— Trying instance: {instance}")
+                    service = qiskit_ibm_runtime.QiskitRuntimeService(
+                        channel="ibm_cloud",
+                        token=self.token,
+                        instance=instance
+                    )
+                else:
+                    print("ðŸ”— Trying without instance (public access)")
+                    service = qiskit_ibm_runtime.QiskitRuntimeService(
+                        channel="ibm_cloud",
+                        token=self.token
+                    )
+            except Exception as inst_err:
+                print(f"âš ï¸ Instance {instance} failed: {str(inst_err)[:100]}...")
+                continue
+            yield instance, service
+
+    def _try_connect(self, service, instance):
+        """Probe a candidate service; return its backend list, or None if it is unusable"""
+        print("ðŸ“¡ Testing connection by fetching backends...")
+
+        future = _probe_pool.submit(service.backends)
+        try:
+            backends = future.result(timeout=self._probe_timeout)
+        except FuturesTimeoutError:
+            future.cancel()  # Only succeeds if the probe never started
+            print(f"â° Connection timeout for instance: {instance}")
+            return None
+        except Exception as fetch_err:
+            print(f"âš ï¸ Backend fetch failed for {instance}: {str(fetch_err)[:100]}...")
+            return None
+
+        if not backends:
+            print(f"âš ï¸ Service connected but no backends available for instance: {instance}")
+            return None
+        return backends
+    
+    def _configure_service_session(self, service):
+        """Mount a pooled, retrying HTTPS adapter on the runtime service's HTTP session
+
+        qiskit-ibm-runtime keeps its requests.Session on a private client, so this is best
+        effort: if the attribute layout differs the service keeps its default adapter.
+        """
+        api_client = getattr(service, '_api_client', None)
+        session = getattr(api_client, 'session', None)
+        if not isinstance(session, requests.Session):
+            logger.debug("Runtime service exposes no requests.Session; keeping default adapter")
+            return None
+
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount("https://", adapter)
+        return session
+    
     def get_real_backends(self):
         """Get available backends from IBM Quantum Runtime Service - REAL DATA ONLY"""
         if not self.is_connected or not self.provider:
-            print("âŒ Not connected to IBM Quantum - cannot retrieve backends")
+            logger.warning("Not connected to IBM Quantum - cannot retrieve backends")
             return []
 
+        cached = self._backends_cache
+        if cached is not None and time.monotonic() - cached[0] < BACKENDS_CACHE_TTL:
+            return cached[1]
+
         try:
             # Use the runtime service to get backends
             if hasattr(self.provider, 'backends'):
-                print("ðŸ“¡ Fetching real backends from IBM Quantum...")
+                logger.debug("Fetching real backends from IBM Quantum")
                 backends = self.provider.backends()
 
                 # Check if we got any backends
                 if backends:
-                    print(f"âœ… Retrieved {len(backends)} real backends from IBM Quantum")
-                    for i, backend in enumerate(backends[:3]):  # Show first 3
-                        print(f"   - {backend.name}")
-                    if len(backends) > 3:
-                        print(f"   ... and {len(backends) - 3} more")
+                    self._backends_cache = (time.monotonic(), backends)
+                    logger.info("Retrieved %d real backends from IBM Quantum", len(backends))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Backends: %s", ", ".join(str(getattr(b, 'name', b)) for b in backends[:3]))
                     return backends
                 else:
-                    print("âš ï¸ Connected to IBM Quantum but no backends available")
+                    logger.warning("Connected to IBM Quantum but no backends available")
                     return []
             else:
-                print("âŒ Provider not properly initialized")
+                logger.error("Provider not properly initialized")
                 return []
 
         except Exception as e:
-            print(f"âŒ Error retrieving backends from IBM Quantum: {str(e)[:200]}...")
+            logger.error("Error retrieving backends from IBM Quantum: %.200s", e)
             # If we get an error, mark as not connected and return empty
             self.is_connected = False
             return []
@@ -639,85 +1481,138 @@ class QuantumBackendManager:
         raise RuntimeError("SIMULATORS ARE NOT ALLOWED - REAL QUANTUM DATA REQUIRED")
         
     def get_backends(self):
-        """Get available quantum backends - REAL DATA ONLY"""
-            
+        """Get available quantum backends - REAL DATA ONLY
+
+        Concurrent callers share a single fetch: the first one does the work and the
+        rest wait for its result instead of each hitting IBM Quantum.
+        """
+        with self._flight_lock:
+            flight = self._backends_flight
+            leader = flight is None
+            if leader:
+                flight = self._backends_flight = _InFlight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._fetch_backend_list()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flight_lock:
+                self._backends_flight = None
+            flight.done.set()
+        return flight.result
+
+    def _fetch_backend_list(self):
+        """Fetch and process the backend list; only called by the get_backends() leader"""
         if not self.is_connected:
             raise RuntimeError("ERROR: Not connected to IBM Quantum. Cannot get real backends. No fallback data available.")
             
         # Only get real backends
+        self._name_cache.clear()
         real_backends = self.get_real_backends()
         if not real_backends:
             raise RuntimeError("ERROR: No real backends found. Check your IBM Quantum connection.")
             
-        # Convert backends to a format that can be processed
-        backend_list = []
-        for backend in real_backends:
-            try:
-                # Extract the proper backend name
-                backend_name = self._extract_backend_name(backend)
-                # Get comprehensive properties (now returns dict)
-                properties = self._extract_backend_properties(backend)
-                num_qubits = properties['num_qubits']
-
-                backend_info = {
-                    "name": backend_name,
-                    "operational": True,  # Assume operational if we can access it
-                    "pending_jobs": 0,  # Will be updated later
-                    "num_qubits": num_qubits if num_qubits > 0 else 5,  # Use real qubit count or default
-                    "real_data": True,  # Mark as real data
-                    "backend_version": properties['backend_version'],
-                    "last_update_date": properties['last_update_date'],
-                    "gate_errors": properties['gate_errors'],
-                    "readout_errors": properties['readout_errors'],
-                    "t1_times": properties['t1_times'],
-                    "t2_times": properties['t2_times'],
-                    "coupling_map": properties['coupling_map'],
-                    "basis_gates": properties['basis_gates'],
-                    "conditional": properties['conditional'],
-                    "open_pulse": properties['open_pulse'],
-                    "memory": properties['memory'],
-                    "max_shots": properties['max_shots'],
-                    "max_experiments": properties['max_experiments']
-                }
-                backend_list.append(backend_info)
-            except Exception as e:
-                print(f"Error processing backend {backend}: {e}")
-                continue
+        # Convert backends to a format that can be processed. Each backend needs its own
+        # configuration()/properties() round-trip, so fetch them concurrently.
+        backend_list = [info for info in self._get_backend_pool().map(self._process_backend, real_backends)
+                        if info is not None]
         
-        print(f"âœ… Processed {len(backend_list)} real backends")
+        logger.info("Processed %d real backends", len(backend_list))
         
-        # Store in database for offline access
+        # Persist for offline access on the background writer so the request isn't blocked
         try:
-            db.store_backends(backend_list)
-            db.update_system_status(True)
-            print("ðŸ’¾ Backend data stored in database")
-        except Exception as e:
-            print(f"âš ï¸ Failed to store backend data in database: {e}")
-            db.update_system_status(False, str(e))
+            _db_writer_queue.put_nowait(backend_list)
+        except queue.Full:
+            pass  # The writer is behind; a newer snapshot will follow
         
         return backend_list
     
+    def _backend_for(self, backend_name):
+        """Return the provider's backend object for backend_name, looked up once per connection"""
+        with self._handles_lock:
+            backend = self._backend_handles.get(backend_name)
+        if backend is None:
+            # Looked up outside the lock; two threads racing here just both fetch it
+            backend = self.provider.get_backend(backend_name)
+            with self._handles_lock:
+                backend = self._backend_handles.setdefault(backend_name, backend)
+        return backend
+    
+    def _transpile_for(self, circuit, backend_name, backend):
+        """Transpile circuit for backend, reusing the result for structurally identical circuits"""
+        try:
+            key = (backend_name, circuit.num_qubits, circuit.num_clbits, tuple(
+                (inst.operation.name, tuple(inst.operation.params),
+                 tuple(circuit.find_bit(q).index for q in inst.qubits),
+                 tuple(circuit.find_bit(c).index for c in inst.clbits))
+                for inst in circuit.data))
+            hash(key)
+        except TypeError:
+            # Unhashable gate parameters (e.g. matrices): transpile without caching
+            return _qk().transpile(circuit, backend)
+        with self._transpile_lock:
+            transpiled = self._transpile_cache.get(key)
+            if transpiled is not None:
+                self._transpile_cache.move_to_end(key)
+                return transpiled
+        # Transpile outside the lock so other submissions are not held up behind it
+        transpiled = _qk().transpile(circuit, backend)
+        with self._transpile_lock:
+            self._transpile_cache[key] = transpiled
+            self._transpile_cache.move_to_end(key)
+            while len(self._transpile_cache) > TRANSPILE_CACHE_SIZE:
+                self._transpile_cache.popitem(last=False)
+        return transpiled
+    
+    def _get_backend_pool(self):
+        """Return the executor shared by all per-backend property fetches"""
+        if self._backend_pool is None:
+            self._backend_pool = ThreadPoolExecutor(max_workers=BACKEND_FETCH_WORKERS,
+                                                    thread_name_prefix='backend-props')
+        return self._backend_pool
+    
+    def _process_backend(self, backend):
+        """Build the backend_info dict for a single backend, or None if it fails"""
+        try:
+            # Extract the proper backend name
+            backend_name = self._extract_backend_name(backend)
+            # List view: configuration only, the properties() call is left to get_backend_status
+            properties = self._extract_backend_properties(backend, include_details=False)
+            num_qubits = properties['num_qubits']
+
+            info = BackendInfo(**{
+                **properties,
+                "name": backend_name,
+                "num_qubits": num_qubits if num_qubits > 0 else 5,  # Use real qubit count or default
+            })
+            return info.as_dict()
+        except Exception as e:
+            logger.warning("Error processing backend %s: %s", backend, e)
+            return None
+    
     def get_backend_status(self, backend):
         """Get comprehensive status of a backend with robust error handling - REAL DATA ONLY"""
         if not self.is_connected:
-            print("ERROR: Not connected to IBM Quantum. Cannot get backend status.")
+            logger.error("Not connected to IBM Quantum. Cannot get backend status.")
             return None
 
         try:
             # ðŸš¨ DEBUG: Check what type of backend object we received
-            print(f"ðŸ” DEBUG: Backend type: {type(backend)}")
-            if isinstance(backend, dict):
-                print(f"ðŸ” DEBUG: Backend dict keys: {list(backend.keys())}")
+            logger.debug("Backend type: %s", type(backend))
+            if isinstance(backend, dict) and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Backend dict keys: %s", list(backend.keys()))
             
-            # Robust backend name extraction
-            backend_name = self._extract_backend_name(backend)
-            print(f"âœ… Processing backend: {backend_name}")
-
-            # Robust status information extraction
-            operational, pending_jobs = self._extract_backend_status(backend)
-
-            # Robust properties information extraction (now returns dict)
-            properties = self._extract_backend_properties(backend)
+            # Name, live status and (cached) properties in one pass
+            backend_name, operational, pending_jobs, properties = self._extract_all(backend)
+            logger.debug("Processing backend: %s", backend_name)
 
             return {
                 "name": backend_name,
@@ -740,7 +1635,7 @@ class QuantumBackendManager:
                 "max_experiments": properties['max_experiments']
             }
         except Exception as e:
-            print(f"Error getting status for backend: {e}")
+            logger.warning("Error getting status for backend: %s", e)
 
             # Basic information without detailed properties
             try:
@@ -770,55 +1665,75 @@ class QuantumBackendManager:
     
     def _extract_backend_name(self, backend):
         """Robustly extract backend name handling both method and property access"""
+        # ðŸš¨ URGENT FIX: Handle case where backend is already a dict
+        if isinstance(backend, dict):
+            name = backend.get('name')
+            if isinstance(name, str) and name.strip():
+                return sys.intern(name.strip())
+            return backend.get('name', 'unknown_backend')
+
+        # Backend names are immutable, so memoize per object for the current refresh;
+        # they are interned so lookups in _BACKEND_INDEX can match on identity
+        key = id(backend)
+        cached = self._name_cache.get(key)
+        if cached is not None:
+            return cached
+
+        name = self._resolve_backend_name(backend)
+        if isinstance(name, str):
+            name = sys.intern(name)
+        self._name_cache[key] = name
+        return name
+    
+    def _resolve_backend_name(self, backend):
+        """Look up a backend object's name without caching"""
         try:
-            # ðŸš¨ URGENT FIX: Handle case where backend is already a dict
-            if isinstance(backend, dict):
-                if 'name' in backend:
-                    name = backend['name']
-                    if isinstance(name, str) and name.strip():
-                        return name.strip()
-                return backend.get('name', 'unknown_backend')
-            
-            # For IBM Cloud Quantum Runtime backends
-            if hasattr(backend, 'name'):
-                if callable(getattr(backend, 'name', None)):
-                    # Legacy backend with name() method
-                    name = backend.name()
-                else:
-                    # Modern backend with name property
-                    name = backend.name
-                
-                if name and str(name).strip():
-                    return str(name).strip()
+            # For IBM Cloud Quantum Runtime backends: name is a property on modern
+            # backends and a method on legacy ones
+            try:
+                name = backend.name
+            except AttributeError:
+                name = None
+            else:
+                if callable(name):
+                    name = name()
+            
+            if name and str(name).strip():
+                return str(name).strip()
             
             # For IBM backends, try to extract from string representation
-            backend_str = str(backend)
-            if 'IBMBackend' in backend_str and '(' in backend_str and ')' in backend_str:
-                # Extract name from format: <IBMBackend('ibm_brisbane')>
-                start = backend_str.find("('") + 2
-                end = backend_str.find("')")
-                if start > 1 and end > start:
-                    extracted_name = backend_str[start:end]
-                    if extracted_name and extracted_name.strip():
-                        return extracted_name.strip()
+            match = _IBM_NAME_RE.search(str(backend))
+            if match and match.group(1).strip():
+                return match.group(1).strip()
             
         except Exception as e:
-            print(f"Error extracting backend name: {e}")
+            logger.warning("Error extracting backend name: %s", e)
         
         # Fallback to string representation
         return str(backend)
     
+    def _extract_all(self, backend):
+        """Extract name, status and properties together, calling each remote method at most once
+
+        Returns (name, operational, pending_jobs, properties_dict).
+        """
+        backend_name = self._extract_backend_name(backend)
+        operational, pending_jobs = self._extract_backend_status(backend)
+        properties = self._extract_backend_properties(backend)
+        return backend_name, operational, pending_jobs, properties
+    
     def _extract_backend_status(self, backend):
         """Robustly extract backend status information"""
         operational = False
         pending_jobs = 0
         
         try:
-            if hasattr(backend, 'status'):
-                if callable(getattr(backend, 'status', None)):
+            status_attr = getattr(backend, 'status', None)
+            if status_attr is not None:
+                if callable(status_attr):
                     # Legacy backend with status() method
                     try:
-                        status_obj = backend.status()
+                        status_obj = status_attr()
                         if hasattr(status_obj, 'to_dict'):
                             status_dict = status_obj.to_dict()
                             operational = status_dict.get("operational", False)
@@ -828,20 +1743,38 @@ class QuantumBackendManager:
                         elif hasattr(status_obj, 'pending_jobs'):
                             pending_jobs = status_obj.pending_jobs
                     except Exception as status_err:
-                        print(f"Error extracting status from method: {status_err}")
+                        logger.warning("Error extracting status from method: %s", status_err)
                 else:
                     # Modern backend with status attribute
-                    status_value = backend.status
+                    status_value = status_attr
                     if isinstance(status_value, str):
                         operational = status_value.lower() == "active"
                     elif hasattr(backend, 'pending_jobs'):
                         pending_jobs = getattr(backend, 'pending_jobs', 0)
         except Exception as e:
-            print(f"Error extracting backend status: {e}")
+            logger.warning("Error extracting backend status: %s", e)
         
         return operational, pending_jobs
     
-    def _extract_backend_properties(self, backend):
+    def _extract_backend_properties(self, backend, include_details=True):
+        """Extract backend properties, served from a per-backend TTL cache when warm
+
+        include_details=False skips the properties() call (T1/T2, gate and readout errors),
+        which is all the list view needs. A cached detailed entry also satisfies such calls.
+        """
+        backend_name = self._extract_backend_name(backend)
+        now = time.monotonic()
+        cache_keys = [(backend_name, True)] if include_details else [(backend_name, True), (backend_name, False)]
+        for cache_key in cache_keys:
+            cached = self._props_cache.get(cache_key)
+            if cached is not None and now - cached[0] < BACKEND_PROPERTIES_CACHE_TTL:
+                return cached[1]
+
+        properties = self._fetch_backend_properties(backend, include_details)
+        self._props_cache[(backend_name, include_details)] = (time.monotonic(), properties)
+        return properties
+    
+    def _fetch_backend_properties(self, backend, include_details=True):
         """Extract backend properties from IBM Quantum Runtime Service backends"""
         num_qubits = 0
         backend_version = 'unknown'
@@ -863,11 +1796,11 @@ class QuantumBackendManager:
         try:
             backend_name = self._extract_backend_name(backend)
 
-            # For IBM Quantum Runtime Service backends, try different property access methods
-            if hasattr(backend, 'configuration') and backend.configuration():
+            # For IBM Quantum Runtime Service backends, try different property access methods.
+            # configuration() is a remote call, so fetch it exactly once.
+            config = backend.configuration() if hasattr(backend, 'configuration') else None
+            if config:
                 try:
-                    config = backend.configuration()
-
                     # Try to get configuration as dict
                     if hasattr(config, 'to_dict'):
                         config_dict = config.to_dict()
@@ -893,65 +1826,65 @@ class QuantumBackendManager:
                         backend_version = getattr(config, 'backend_version', 'unknown')
 
                 except Exception as config_err:
-                    print(f"Error extracting configuration from {backend_name}: {config_err}")
+                    logger.warning("Error extracting configuration from %s: %s", backend_name, config_err)
 
-            # Try properties if available
-            if hasattr(backend, 'properties') and callable(getattr(backend, 'properties', None)):
+            # Try properties if available (skipped for the list view)
+            if include_details and hasattr(backend, 'properties') and callable(getattr(backend, 'properties', None)):
                 try:
                     properties_obj = backend.properties()
-                    if properties_obj and hasattr(properties_obj, 'to_dict'):
+                    # last_update_date changes only when IBM publishes a new calibration, so
+                    # the per-qubit/per-gate maps are reused until it does
+                    calibration_stamp = getattr(properties_obj, 'last_update_date', None)
+                    cached = self._calibration_cache.get(backend_name)
+                    if properties_obj and calibration_stamp is not None and cached and cached[0] == calibration_stamp:
+                        t1_times, t2_times, gate_errors, readout_errors, last_update_date = cached[1]
+                    elif properties_obj and hasattr(properties_obj, 'to_dict'):
                         properties_dict = properties_obj.to_dict()
 
                         # Extract qubit information if available
                         if isinstance(properties_dict, dict):
                             qubits_info = properties_dict.get('qubits', [])
                             if isinstance(qubits_info, list):
-                                for i, qubit in enumerate(qubits_info):
-                                    if isinstance(qubit, dict):
-                                        if 'T1' in qubit:
-                                            t1_times[i] = qubit['T1']
-                                        if 'T2' in qubit:
-                                            t2_times[i] = qubit['T2']
+                                t1_times = {i: q['T1'] for i, q in enumerate(qubits_info)
+                                            if isinstance(q, dict) and 'T1' in q}
+                                t2_times = {i: q['T2'] for i, q in enumerate(qubits_info)
+                                            if isinstance(q, dict) and 'T2' in q}
 
                             # Extract gate errors
                             gates_info = properties_dict.get('gates', [])
                             if isinstance(gates_info, list):
-                                for gate in gates_info:
-                                    if isinstance(gate, dict):
-                                        gate_name = gate.get('gate', '')
-                                        parameters = gate.get('parameters', {})
-                                        if isinstance(parameters, dict):
-                                            gate_error = parameters.get('gate_error')
-                                            if gate_name and gate_error is not None:
-                                                gate_errors[gate_name] = gate_error
+                                gate_errors = {
+                                    g['gate']: g['parameters']['gate_error']
+                                    for g in gates_info
+                                    if isinstance(g, dict) and g.get('gate')
+                                    and isinstance(g.get('parameters'), dict)
+                                    and g['parameters'].get('gate_error') is not None
+                                }
 
                             # Extract readout errors
                             readout_info = properties_dict.get('readout', [])
                             if isinstance(readout_info, list):
-                                for readout in readout_info:
-                                    if isinstance(readout, dict):
-                                        qubit_idx = readout.get('qubit', 0)
-                                        parameters = readout.get('parameters', {})
-                                        if isinstance(parameters, dict):
-                                            readout_error = parameters.get('readout_error')
-                                            if readout_error is not None:
-                                                readout_errors[qubit_idx] = readout_error
+                                readout_errors = {
+                                    r.get('qubit', 0): r['parameters']['readout_error']
+                                    for r in readout_info
+                                    if isinstance(r, dict)
+                                    and isinstance(r.get('parameters'), dict)
+                                    and r['parameters'].get('readout_error') is not None
+                                }
 
                             last_update_date = properties_dict.get('last_update_date', 'unknown')
 
+                        if calibration_stamp is not None:
+                            self._calibration_cache[backend_name] = (
+                                calibration_stamp,
+                                (t1_times, t2_times, gate_errors, readout_errors, last_update_date))
+
                 except Exception as prop_err:
-                    print(f"Error extracting properties from {backend_name}: {prop_err}")
+                    logger.warning("Error extracting properties from %s: %s", backend_name, prop_err)
 
             # If we still don't have num_qubits, try to infer from backend name
             if num_qubits == 0:
-                if 'ibm_brisbane' in backend_name.lower():
-                    num_qubits = 127
-                elif 'ibm_pittsburgh' in backend_name.lower():
-                    num_qubits = 133
-                elif 'ibm_manila' in backend_name.lower() or 'ibm_lima' in backend_name.lower() or 'ibm_belem' in backend_name.lower() or 'ibm_quito' in backend_name.lower():
-                    num_qubits = 5
-                else:
-                    num_qubits = getattr(backend, 'num_qubits', 5)
+                num_qubits = _DEVICE_QUBIT_MAP.get(backend_name.lower()) or getattr(backend, 'num_qubits', 5)
 
             # Set some reasonable defaults if we don't have real data
             if not basis_gates:
@@ -962,7 +1895,7 @@ class QuantumBackendManager:
                 max_experiments = 300
 
         except Exception as e:
-            print(f"Error extracting backend properties from {backend_name}: {e}")
+            logger.warning("Error extracting backend properties from %s: %s", backend_name, e)
 
         return {
             'num_qubits': num_qubits,
@@ -987,142 +1920,351 @@ class QuantumBackendManager:
             return []
             
         try:
-            processed_jobs = []
+            with self._jobs_lock:
+                changed_jobs = []
             
-            # Use the runtime service jobs method
-            if hasattr(self.provider, 'jobs'):
-                try:
-                    # Get jobs using the runtime service - increase limit to get more jobs
-                    jobs = self.provider.jobs(limit=50)  # Increased from 20 to 50
-                    print(f"âœ… Retrieved {len(jobs)} real jobs from IBM Quantum Runtime")
+                # Use the runtime service jobs method
+                if hasattr(self.provider, 'jobs'):
+                    try:
+                        # Only jobs created since the last refresh, plus cached jobs still in flight
+                        jobs = self._fetch_new_jobs()
+                        logger.info("Retrieved %d new real jobs from IBM Quantum Runtime", len(jobs))
                     
-                    for job in jobs:
-                        try:
-                            # Extract job information from runtime service job objects
-                            # ðŸš¨ URGENT FIX: Properly extract job data from RuntimeJobV2 objects
-                            try:
-                                # For RuntimeJobV2, job_id is a property, not method
-                                if hasattr(job, 'job_id'):
-                                    job_id = str(job.job_id)
-                                else:
-                                    job_id = str(job)[:20]  # Fallback to first 20 chars
-                            except:
-                                job_id = f"job_{hash(str(job)) % 10000}"
-                            
-                            try:
-                                # Backend name extraction
-                                if hasattr(job, 'backend'):
-                                    backend_name = str(job.backend)
-                                elif hasattr(job, 'backend_name'):
-                                    backend_name = str(job.backend_name)
-                                else:
-                                    backend_name = 'unknown'
-                            except:
-                                backend_name = 'unknown'
-                            
-                            try:
-                                # Status extraction - call the method properly
-                                if hasattr(job, 'status'):
-                                    raw_status = job.status()
-                                    # Extract status name from JobStatus enum
-                                    if hasattr(raw_status, 'name'):
-                                        status = raw_status.name.lower()
-                                    elif hasattr(raw_status, 'value'):
-                                        status = str(raw_status.value).lower()
-                                    else:
-                                        status = str(raw_status).lower()
-                                else:
-                                    status = 'unknown'
-                            except:
-                                status = 'pending'
-                            
-                            # Try to get creation time
-                            created_time = getattr(job, 'creation_date', None)
-                            if created_time:
-                                if hasattr(created_time, 'timestamp'):
-                                    start_time = created_time.timestamp()
-                                else:
-                                    start_time = time.mktime(created_time.timetuple())
-                            else:
-                                start_time = time.time() - 600  # Default to 10 minutes ago
-                            
-                            # Try to get shots information
-                            shots = 1024  # Default
+                        for job in jobs:
                             try:
-                                if hasattr(job, 'shots'):
-                                    shots = job.shots
-                                elif hasattr(job, 'input_params'):
-                                    input_params = job.input_params
-                                    if hasattr(input_params, 'shots'):
-                                        shots = input_params.shots
-                            except:
-                                shots = 1024
+                                changed_jobs.append(self._process_job(job))
                             
-                            # Create real job data with more information
-                            job_data = {
-                                "id": str(job_id),
-                                "backend": str(backend_name),
-                                "status": str(status),
-                                "qubits": 5,  # Will be updated from backend info
-                                "created": start_time,
-                                "shots": shots,
-                                "real_data": True
-                            }
-                            processed_jobs.append(job_data)
-                            
-                        except Exception as job_err:
-                            print(f"Error processing job {job}: {job_err}")
-                            continue
+                            except Exception as job_err:
+                                logger.warning("Error processing job %s: %s", job, job_err)
+                                continue
+                    
+                        changed_jobs.extend(self._refresh_unfinished_jobs({job["id"] for job in changed_jobs}))
                             
-                except Exception as e:
-                    print(f"Error with runtime jobs: {str(e)[:200]}...")
+                    except Exception as e:
+                        logger.warning("Error with runtime jobs: %.200s...", e)
+            
+                processed_jobs = self._merge_jobs(changed_jobs)
             
-            # Store the processed jobs in the manager for later use
-            self.job_data = processed_jobs
+                # Store the processed jobs in the manager for later use
+                self.job_data = processed_jobs
             
-            # Store in database for offline access
+            # Start on the next page while this one is stored and rendered
+            if len(processed_jobs) >= JOBS_PAGE_SIZE:
+                self._prefetch_jobs_page(JOBS_PAGE_SIZE, JOBS_PAGE_SIZE)
+            
+            # Store in database for offline access; unchanged jobs are already there
+            try:
+                if changed_jobs:
+                    db.store_jobs(changed_jobs)
+                db.update_system_status(True)
+                logger.debug("Job data stored in database")
+            except Exception as e:
+                logger.warning("Failed to store job data in database: %s", e)
+                db.update_system_status(False, str(e))
+            
+            # If we got real jobs, return them
+            if processed_jobs:
+                logger.debug("Returning %d real quantum jobs", len(processed_jobs))
+                return processed_jobs
+                
+            # No fallback - return empty list if no real jobs found
+            logger.info("No real jobs found - returning empty list")
+            return processed_jobs
+
+        except Exception as e:
+            logger.error("Error fetching real jobs: %.200s...", e)
+            return []
+    
+    def _fetch_new_jobs(self):
+        """Fetch the jobs created since the newest job already merged into _jobs_by_id"""
+        if not self._jobs_by_id:
+            return self.provider.jobs(limit=JOBS_PAGE_SIZE)
+        since = datetime.fromtimestamp(self._jobs_last_seen_ts)
+        try:
+            return self.provider.jobs(limit=JOBS_PAGE_SIZE, created_after=since)
+        except TypeError:
+            # Runtime clients without a created_after filter get the full first page
+            return self.provider.jobs(limit=JOBS_PAGE_SIZE)
+    
+    def _refresh_unfinished_jobs(self, skip_ids):
+        """Re-read cached jobs that had not reached a final status, except skip_ids
+
+        Statuses come from two list calls, one for the still-pending jobs and one for jobs
+        finished since the oldest unfinished one was created. Jobs neither list covers are
+        looked up one by one on the backend pool, at most JOB_REFRESH_MAX_LOOKUPS per refresh.
+        """
+        unfinished = {job_id: job for job_id, job in list(self._jobs_by_id.items())
+                      if job_id not in skip_ids and job["status"] not in _TERMINAL_JOB_STATUSES}
+        if not unfinished:
+            return []
+        
+        refreshed = []
+        oldest = datetime.fromtimestamp(min(job["created"] for job in unfinished.values()))
+        for filters in ({'pending': True}, {'pending': False, 'created_after': oldest}):
+            try:
+                listed = self.provider.jobs(limit=JOBS_PAGE_SIZE, **filters)
+            except TypeError:
+                break  # Runtime client without these filters; look the jobs up individually
+            except Exception as e:
+                logger.warning("Error listing jobs for status refresh: %s", e)
+                break
+            for raw_job in listed:
+                try:
+                    job_id = raw_job.job_id()
+                except Exception:
+                    continue
+                if unfinished.pop(job_id, None) is not None:
+                    try:
+                        refreshed.append(self._process_job(raw_job))
+                    except Exception as job_err:
+                        logger.warning("Error refreshing job %s: %s", job_id, job_err)
+            if not unfinished:
+                return refreshed
+        
+        def lookup(job_id):
+            try:
+                return self._process_job(self.provider.job(job_id))
+            except Exception as job_err:
+                logger.warning("Error refreshing job %s: %s", job_id, job_err)
+                return None
+        
+        remaining = list(unfinished)[:JOB_REFRESH_MAX_LOOKUPS]
+        refreshed.extend(job for job in self._get_backend_pool().map(lookup, remaining) if job is not None)
+        return refreshed
+    
+    def _merge_jobs(self, changed_jobs):
+        """Merge changed jobs into _jobs_by_id and return the newest JOBS_PAGE_SIZE, newest first
+
+        The merge goes into a fresh dict so readers of the previous _jobs_by_id never see it change size.
+        """
+        jobs_by_id = dict(self._jobs_by_id)
+        for job in changed_jobs:
+            jobs_by_id[job["id"]] = job
+        newest = sorted(jobs_by_id.values(), key=lambda job: job["created"], reverse=True)[:JOBS_PAGE_SIZE]
+        self._jobs_by_id = {job["id"]: job for job in newest}
+        if newest:
+            self._jobs_last_seen_ts = max(self._jobs_last_seen_ts, newest[0]["created"])
+        return newest
+    
+    def _fetch_jobs_page(self, offset, limit):
+        """Fetch and process one page of jobs from the runtime service"""
+        processed_jobs = []
+        for job in self.provider.jobs(limit=limit, skip=offset):
+            try:
+                processed_jobs.append(self._process_job(job))
+            except Exception as job_err:
+                logger.warning("Error processing job %s: %s", job, job_err)
+        return processed_jobs
+    
+    def _prefetch_jobs_page(self, offset, limit):
+        self._prefetched_jobs = (offset, limit,
+                                 self._get_backend_pool().submit(self._fetch_jobs_page, offset, limit))
+    
+    def get_jobs_page(self, offset, limit=JOBS_PAGE_SIZE):
+        """Return a page of jobs, using the prefetched page when it matches"""
+        if not self.is_connected or not self.provider:
+            return []
+        
+        prefetched = self._prefetched_jobs
+        try:
+            if prefetched is not None and prefetched[:2] == (offset, limit):
+                jobs = prefetched[2].result()
+            else:
+                jobs = self._fetch_jobs_page(offset, limit)
+        except Exception as e:
+            logger.warning("Error fetching jobs page at offset %d: %s", offset, e)
+            return []
+        
+        if len(jobs) >= limit:
+            self._prefetch_jobs_page(offset + limit, limit)
+        return jobs
+    
+    def _process_job(self, job):
+        """Turn a runtime job object into the job_data dict used by the dashboard"""
+        extractor = self._job_extractors.get(type(job))
+        if extractor is None:
+            extractor = self._job_extractors[type(job)] = _build_job_extractor(job)
+        try:
+            return extractor(job)
+        except Exception:
+            # Jobs that don't match their class's shape go through the defensive path
+            return self._process_job_generic(job)
+    
+    def _process_job_generic(self, job):
+        """Attribute-probing version of _process_job that tolerates any job shape"""
+        # Extract job information from runtime service job objects
+        # ðŸš¨ URGENT FIX: Properly extract job data from RuntimeJobV2 objects
+        # Each attribute is read once; a missing one raises AttributeError instead of
+        # being looked up twice through hasattr()
+        try:
+            # For RuntimeJobV2, job_id is a property, not method
+            try:
+                job_id = str(job.job_id)
+            except AttributeError:
+                job_id = str(job)[:20]  # Fallback to first 20 chars
+        except:
+            job_id = f"job_{hash(str(job)) % 10000}"
+        
+        try:
+            # Backend name extraction
+            try:
+                backend_name = str(job.backend)
+            except AttributeError:
+                backend_name = str(getattr(job, 'backend_name', 'unknown'))
+        except:
+            backend_name = 'unknown'
+        
+        try:
+            # Status extraction - call the method properly
+            try:
+                raw_status = job.status()
+            except AttributeError:
+                status = 'unknown'
+            else:
+                # Extract status name from JobStatus enum
+                try:
+                    status = raw_status.name.lower()
+                except AttributeError:
+                    status = str(getattr(raw_status, 'value', raw_status)).lower()
+        except:
+            status = 'pending'
+        
+        # Try to get creation time
+        created_time = getattr(job, 'creation_date', None)
+        if created_time:
+            try:
+                start_time = created_time.timestamp()
+            except AttributeError:
+                start_time = time.mktime(created_time.timetuple())
+        else:
+            start_time = time.time() - 600  # Default to 10 minutes ago
+        
+        # Try to get shots information
+        try:
             try:
-                db.store_jobs(processed_jobs)
-                db.update_system_status(True)
-                print("ðŸ’¾ Job data stored in database")
-            except Exception as e:
-                print(f"âš ï¸ Failed to store job data in database: {e}")
-                db.update_system_status(False, str(e))
-            
-            # If we got real jobs, return them
-            if processed_jobs:
-                print(f"âœ… Returning {len(processed_jobs)} real quantum jobs")
-                return processed_jobs
-                
-            # No fallback - return empty list if no real jobs found
-            print("No real jobs found - returning empty list")
-            return processed_jobs
-
-        except Exception as e:
-            print(f"Error fetching real jobs: {str(e)[:200]}...")
-            return []
+                shots = job.shots
+            except AttributeError:
+                shots = getattr(job.input_params, 'shots', 1024)
+        except:
+            shots = 1024
+        
+        # Create real job data with more information
+        job_data = {
+            "id": str(job_id),
+            "backend": str(backend_name),
+            "status": str(status),
+            "qubits": 5,  # Will be updated from backend info
+            "created": start_time,
+            "shots": shots,
+            "real_data": True
+        }
+        return job_data
     
-    def get_real_job_result(self, job_id):
-        """Get real job result from IBM Quantum using job ID"""
+    def get_real_job_result(self, job_id, wait_timeout=JOB_RESULT_WAIT_TIMEOUT):
+        """Get real job result from IBM Quantum using job ID, served from cache when possible
+
+        A job still unfinished after wait_timeout seconds gets a payload with
+        "finished": False, which is not cached.
+        """
+        with self._result_lock:
+            cached = self._result_cache.get(job_id)
+            if cached is not None:
+                cached_at, status, result_data = cached
+                if status in _TERMINAL_JOB_STATUSES or time.monotonic() - cached_at < JOB_RESULT_CACHE_TTL:
+                    self._result_cache.move_to_end(job_id)
+                    return result_data
+
+        result_data = self._fetch_job_result(job_id, wait_timeout)
+        if result_data is not None and result_data.get('finished', True):
+            # Status may be a JobStatus repr such as "JobStatus.DONE"
+            status = str(result_data['status']).rsplit('.', 1)[-1].lower()
+            with self._result_lock:
+                self._result_cache[job_id] = (time.monotonic(), status, result_data)
+                self._result_cache.move_to_end(job_id)
+                while len(self._result_cache) > JOB_RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return result_data
+
+    def _wait_for_final_status(self, job, timeout=None):
+        """Poll job status every poll_interval_s until it reaches a final state or timeout expires
+
+        Returns False if the timeout expired first.
+        """
+        in_final_state = getattr(job, 'in_final_state', None)
+        if not callable(in_final_state):
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not in_final_state():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval_s)
+        return True
+
+    def _prewarm_results(self, job_ids):
+        """Fetch up to JOB_RESULT_PREWARM_LIMIT uncached results on the backend pool without waiting
+
+        Jobs already cached, already being fetched, or whose fetch failed within
+        JOB_RESULT_FAILURE_TTL seconds are skipped.
+        """
+        now = time.monotonic()
+        with self._result_lock:
+            self._result_failures = {job_id: failed_at for job_id, failed_at in self._result_failures.items()
+                                     if now - failed_at < JOB_RESULT_FAILURE_TTL}
+            pending = [job_id for job_id in job_ids
+                       if job_id not in self._result_cache and job_id not in self._result_failures
+                       and job_id not in self._result_prewarming][:JOB_RESULT_PREWARM_LIMIT]
+            self._result_prewarming.update(pending)
+        pool = self._get_backend_pool()
+        for job_id in pending:
+            pool.submit(self._prewarm_result, job_id)
+
+    def _prewarm_result(self, job_id):
+        """Fetch one result into the cache, remembering the job for a while if the fetch fails"""
+        try:
+            result_data = self.get_real_job_result(job_id)
+        except Exception:
+            result_data = None
+        with self._result_lock:
+            self._result_prewarming.discard(job_id)
+            if result_data is None:
+                self._result_failures[job_id] = time.monotonic()
+
+    def _fetch_job_result(self, job_id, wait_timeout=JOB_RESULT_WAIT_TIMEOUT):
+        """Fetch and assemble a job result from IBM Quantum; see get_real_job_result"""
         if not self.is_connected or not self.provider:
-            print("❌ Not connected to IBM Quantum")
+            logger.warning("Not connected to IBM Quantum")
             return None
         
         try:
-            print(f"📡 Fetching real job result for job ID: {job_id}")
+            logger.debug("Fetching real job result for job ID: %s", job_id)
             
             # Get the job using the service
             job = self.provider.job(job_id)
             
             if not job:
-                print(f"❌ Job {job_id} not found")
+                logger.warning("Job %s not found", job_id)
                 return None
             
-            # Get job result
-            job_result = job.result()
+            # Poll for completion at our own interval rather than the SDK's, and give up
+            # after wait_timeout so a queued job cannot hold the request indefinitely
+            if not self._wait_for_final_status(job, wait_timeout):
+                try:
+                    status = job.status().name.lower()
+                except Exception:
+                    status = 'pending'
+                return {
+                    "job_id": job_id,
+                    "status": status,
+                    "finished": False,
+                    "counts": {},
+                    "real_data": True,
+                    "message": f"Job has not finished after {wait_timeout:g}s; try again later"
+                }
+            with _result_fetch_slots:
+                job_result = job.result()
             
             if not job_result:
-                print(f"❌ No result available for job {job_id}")
+                logger.warning("No result available for job %s", job_id)
                 return None
             
             # Extract real measurement data
@@ -1144,20 +2286,21 @@ class QuantumBackendManager:
                                 counts = pub_result.data.get_counts()
                                 break
                 
-                print(f"📊 Retrieved measurement data for job {job_id}: {len(counts)} measurement outcomes")
+                logger.debug("Retrieved measurement data for job %s: %d measurement outcomes", job_id, len(counts))
                 
             except Exception as result_error:
-                print(f"⚠️ Could not retrieve measurement data for job {job_id}: {result_error}")
+                logger.warning("Could not retrieve measurement data for job %s: %s", job_id, result_error)
                 counts = {}
             
             # Get execution time if available
             try:
-                if hasattr(job, 'time_per_step') and job.time_per_step:
-                    execution_time = sum(job.time_per_step)
-                elif hasattr(job, 'execution_time'):
-                    execution_time = job.execution_time
+                time_per_step = getattr(job, 'time_per_step', None)
+                if time_per_step:
+                    execution_time = sum(time_per_step)
+                else:
+                    execution_time = getattr(job, 'execution_time', execution_time)
             except Exception as time_error:
-                print(f"⚠️ Could not retrieve execution time: {time_error}")
+                logger.debug("Could not retrieve execution time: %s", time_error)
                 execution_time = 0
             
             # Get job metadata
@@ -1167,35 +2310,41 @@ class QuantumBackendManager:
             created_time = time.time()
             
             try:
-                if hasattr(job, 'backend') and callable(job.backend):
-                    backend_obj = job.backend()
-                    backend_name = getattr(backend_obj, 'name', 'unknown')
-                elif hasattr(job, 'backend_name'):
-                    backend_name = job.backend_name
+                try:
+                    backend_attr = job.backend
+                except AttributeError:
+                    backend_name = getattr(job, 'backend_name', backend_name)
+                else:
+                    if callable(backend_attr):
+                        backend_name = getattr(backend_attr(), 'name', 'unknown')
                 
-                if hasattr(job, 'status') and callable(job.status):
-                    status_obj = job.status()
-                    status = str(status_obj)
-                elif hasattr(job, 'status'):
-                    status = str(job.status)
+                try:
+                    status_attr = job.status
+                except AttributeError:
+                    pass
+                else:
+                    status = str(status_attr() if callable(status_attr) else status_attr)
                 
-                if hasattr(job, 'shots'):
-                    shots = job.shots
+                shots = getattr(job, 'shots', shots)
                 
-                if hasattr(job, 'creation_date') and callable(job.creation_date):
-                    try:
-                        created_time = job.creation_date().timestamp()
-                    except:
-                        created_time = time.time() - 1800  # Default to 30 minutes ago
-                elif hasattr(job, 'creation_date'):
+                try:
+                    creation_date = job.creation_date
+                except AttributeError:
+                    pass
+                else:
                     try:
-                        created_time = job.creation_date.timestamp()
+                        if callable(creation_date):
+                            creation_date = creation_date()
+                        created_time = creation_date.timestamp()
                     except:
                         created_time = time.time() - 1800  # Default to 30 minutes ago
                     
             except Exception as meta_error:
-                print(f"⚠️ Could not retrieve job metadata: {meta_error}")
+                logger.debug("Could not retrieve job metadata: %s", meta_error)
             
+            # Reduce the counts in C; outcome count grows as 2^n for wide circuits
+            total_counts = int(np.fromiter(counts.values(), dtype=np.int64, count=len(counts)).sum()) if counts else 0
+
             # Create comprehensive result data
             result_data = {
                 "job_id": job_id,
@@ -1211,16 +2360,14 @@ class QuantumBackendManager:
                 "scenario_name": f"Real Job {job_id}",
                 "description": f"Real quantum job executed on {backend_name}",
                 "total_shots": shots,
-                "probability_sum": round(sum(counts.values()) / shots * 100, 1) if shots > 0 else 0
+                "probability_sum": round(total_counts / shots * 100, 1) if shots > 0 else 0
             }
             
-            print(f"✅ Successfully processed real job result: {job_id}")
+            logger.debug("Successfully processed real job result: %s", job_id)
             return result_data
             
-        except Exception as e:
-            print(f"❌ Error fetching real job result for {job_id}: {e}")
-            import traceback
-            print(f"Full error: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error fetching real job result for %s", job_id)
             return None
     
     def simulate_jobs(self):
@@ -1231,72 +2378,92 @@ class QuantumBackendManager:
     def update_data(self):
         """Update backend and job data - REAL DATA ONLY"""
         if not self.is_connected:
-            print("❌ ERROR: Not connected to IBM Quantum. Cannot update with real data.")
+            logger.error("Not connected to IBM Quantum. Cannot update with real data.")
             self.backend_data = []
             self.job_data = []
-            print("🚫 No data available - IBM Quantum connection required")
+            logger.info("No data available - IBM Quantum connection required")
             return
         
-        print("\n🔄 UPDATING REAL IBM QUANTUM DATA...")
-        print("   📡 Fetching live backend information...")
+        logger.info("Updating real IBM Quantum data")
         
         # Real data path - only executes if connected
+        self._name_cache.clear()
         # Get all raw backends first
         raw_backends = self.get_real_backends()
-        print(f"   📊 Found {len(raw_backends) if raw_backends else 0} raw backends from IBM Quantum")
+        logger.debug("Found %d raw backends from IBM Quantum", len(raw_backends) if raw_backends else 0)
         
-        # Process backend data using raw backend objects
+        # The job listing is independent of the backends, so start it first and let it
+        # overlap with the per-backend status fetches below
+        pool = self._get_backend_pool()
+        jobs_future = pool.submit(self.get_real_jobs)
+
+        # Process backend data using raw backend objects; each status is its own round-trip
         backend_data = []
-        print("   🔧 Processing backend configurations:")
 
-        for i, backend in enumerate(raw_backends):
+        for backend, backend_status in zip(raw_backends, pool.map(self.get_backend_status, raw_backends)):
             backend_name = getattr(backend, 'name', 'Unknown')
-            print(f"      {i+1:2d}. Processing {backend_name}...")
-            backend_status = self.get_backend_status(backend)
             if backend_status:  # Only add if we got valid data
                 backend_name_processed = backend_status.get('name', 'unknown')
                 backend_qubits = backend_status.get('num_qubits', 'unknown')
                 backend_status_val = backend_status.get('status', 'unknown')
-                print(f"         ✅ {backend_name_processed}: {backend_qubits} qubits, {backend_status_val}")
+                logger.debug("%s: %s qubits, %s", backend_name_processed, backend_qubits, backend_status_val)
                 backend_data.append(backend_status)
             else:
-                print(f"         ⚠️  Failed to get status for {backend_name}")
+                logger.warning("Failed to get status for %s", backend_name)
         
         self.backend_data = backend_data
-        print(f"   📋 Successfully processed {len(backend_data)} backends")
+        with self._reco_lock:
+            self._reco_cache.clear()
+        logger.debug("Successfully processed %d backends", len(backend_data))
         
         # Only get real job data from IBM Quantum
-        print("   💼 Fetching real job data...")
-        real_jobs = self.get_real_jobs()
+        logger.debug("Waiting for real job data")
+        real_jobs = jobs_future.result()
         if real_jobs:
             self.job_data = real_jobs
-            print(f"   📄 Retrieved {len(real_jobs)} real jobs from IBM Quantum")
-            for i, job in enumerate(real_jobs[:5]):  # Show first 5 jobs
-                job_id = job.get('id', 'unknown')[:10]
-                job_status = job.get('status', 'unknown')
-                print(f"      {i+1}. Job {job_id}... ({job_status})")
-            if len(real_jobs) > 5:
-                print(f"      ... and {len(real_jobs) - 5} more jobs")
+            logger.debug("Retrieved %d real jobs from IBM Quantum", len(real_jobs))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Jobs: %s", ", ".join("%s... (%s)" % (job.get('id', 'unknown')[:10], job.get('status', 'unknown')) for job in real_jobs[:5]))
         else:
-            print("   ⚠️  No real jobs found. Dashboard will show empty job list.")
+            logger.info("No real jobs found. Dashboard will show empty job list.")
             self.job_data = []
         
-        print(f"\n✅ DATA UPDATE COMPLETE:")
-        print(f"   📊 Backends: {len(self.backend_data)}")
-        print(f"   💼 Jobs: {len(self.job_data)}")
-        print("   🔄 Using REAL IBM Quantum data: True")
+        logger.info("Data update complete: %d backends, %d jobs", len(self.backend_data), len(self.job_data))
         self.last_update_time = time.time()
-        print(f"   ⏰ Last updated: {time.strftime('%H:%M:%S', time.localtime(self.last_update_time))}")
+        _publish_responses(self.backend_data, self.job_data, _credential_key(self.token, self.crn),
+                           self.last_update_time)
+        # Prewarm the result cache for finished jobs once the update is published; unfinished
+        # ones would block in result()
+        self._prewarm_results([job['id'] for job in self.job_data if job.get('status') == 'done'])
 
     def create_quantum_visualization(self, backend_data, visualization_type='histogram'):
         """Create a visualization of quantum state for a backend
         
         visualization_type: 'histogram', 'circuit', or 'bloch'
+        
+        The image only depends on a handful of backend fields, so unchanged backends
+        are served from a small LRU instead of being redrawn on every refresh.
         """
+        key = (backend_data.get("name", "unknown"), backend_data.get("operational", False),
+               backend_data.get("status", "") == "active", backend_data.get("num_qubits", 5),
+               backend_data.get("pending_jobs", 0), visualization_type)
+        with self._viz_lock:
+            img_str = self._viz_cache.get(key)
+            if img_str is not None:
+                self._viz_cache.move_to_end(key)
+                return img_str
+
+        img_str = self._render_visualization(backend_data, visualization_type)
+        if img_str is not None:
+            with self._viz_lock:
+                self._viz_cache[key] = img_str
+                while len(self._viz_cache) > VISUALIZATION_CACHE_SIZE:
+                    self._viz_cache.popitem(last=False)
+        return img_str
+
+    def _render_visualization(self, backend_data, visualization_type):
+        """Draw the visualization for create_quantum_visualization; returns base64 image data or None"""
         try:
-            # Import Qiskit components
-            from qiskit import QuantumCircuit
-            
             # Get backend properties
             backend_name = backend_data.get("name", "unknown")
             is_operational = backend_data.get("operational", False)
@@ -1310,41 +2477,14 @@ class QuantumBackendManager:
             if num_qubits < 2:
                 num_qubits = 2  # Minimum 2 qubits for interesting visualizations
                 
-            # Create circuit based on backend properties
-            qc = QuantumCircuit(num_qubits, num_qubits)
-            
-            # Add gates based on backend properties
-            # More gates for active backends
-            if is_active:
-                for i in range(num_qubits):
-                    qc.h(i)  # Hadamard gates for superposition
-                
-                # Add entanglement - more for operational backends
-                if is_operational:
-                    for i in range(num_qubits-1):
-                        qc.cx(i, i+1)  # CNOT gates for entanglement
-                        
-                # Add phase gates based on pending jobs
-                phase_count = min(3, pending_jobs // 2) if pending_jobs > 0 else 0
-                for i in range(phase_count):
-                    qc.t(i % num_qubits)
-            else:
-                # Simple circuit for inactive backends
-                qc.h(0)
-                if num_qubits > 1:
-                    qc.cx(0, 1)
-            
-            # Add measurements
-            qc.measure(range(num_qubits), range(num_qubits))
-            
             # Generate visualization based on type
             if visualization_type == 'circuit':
                 try:
                     # Circuit diagram visualization using text mode first (more reliable)
-                    from qiskit.visualization import circuit_drawer
+                    qk = _qk()
                     
                     # Create a simpler circuit for visualization
-                    viz_qc = QuantumCircuit(min(3, num_qubits))
+                    viz_qc = qk.QuantumCircuit(min(3, num_qubits))
                     viz_qc.h(0)
                     if viz_qc.num_qubits > 1:
                         viz_qc.cx(0, 1)
@@ -1353,10 +2493,10 @@ class QuantumBackendManager:
                     
                     # Draw circuit using matplotlib
                     plt.figure(figsize=(7, 5))
-                    circuit_drawer(viz_qc, output='mpl')
+                    qk.circuit_drawer(viz_qc, output='mpl')
                     plt.title(f"{backend_name} Circuit")
                 except Exception as circuit_error:
-                    print(f"Circuit visualization fallback: {circuit_error}")
+                    logger.debug("Circuit visualization fallback: %s", circuit_error)
                     # Fallback to simple matplotlib visualization
                     plt.figure(figsize=(7, 5))
                     plt.plot([0, 1, 2], [1, 0, 1], 'b-')
@@ -1371,7 +2511,7 @@ class QuantumBackendManager:
             elif visualization_type == 'bloch':
                 try:
                     # Bloch sphere visualization
-                    from qiskit.visualization import plot_bloch_vector
+                    qk = _qk()
                     
                     # Create a simple state vector based on backend properties
                     if is_active and is_operational:
@@ -1386,10 +2526,10 @@ class QuantumBackendManager:
                     
                     # Plot Bloch sphere
                     plt.figure(figsize=(5, 5))
-                    plot_bloch_vector(vector, title=f"{backend_name} State")
+                    qk.plot_bloch_vector(vector, title=f"{backend_name} State")
                     
                 except Exception as bloch_error:
-                    print(f"Bloch visualization fallback: {bloch_error}")
+                    logger.debug("Bloch visualization fallback: %s", bloch_error)
                     # Fallback to simple circle visualization
                     plt.figure(figsize=(5, 5))
                     circle = plt.Circle((0, 0), 1, fill=False)
@@ -1405,72 +2545,28 @@ class QuantumBackendManager:
             else:  # Default: histogram
                 # Create histogram visualization based on backend properties
                 try:
-                    # Generate histogram data based on backend characteristics
-                    import numpy as np
-                    
-                    # Create measurement results based on backend properties
-                    if is_active and is_operational:
-                        # For active operational backends, show superposition results
-                        # Simulate measurement outcomes for a Bell state
-                        outcomes = ['00', '01', '10', '11']
-                        # Bell state gives equal probability for |00âŸ© and |11âŸ©
-                        probabilities = [0.5, 0.0, 0.0, 0.5]
-                    elif is_active:
-                        # For active but not operational backends, show mixed results
-                        outcomes = ['00', '01', '10', '11']
-                        probabilities = [0.4, 0.1, 0.1, 0.4]
-                    else:
-                        # For inactive backends, show mostly |00âŸ© state
-                        outcomes = ['00', '01', '10', '11']
-                        probabilities = [0.8, 0.05, 0.05, 0.1]
-                    
-                    # Add some noise based on pending jobs
+                    # Measurement results based on backend properties, with some noise from pending jobs
+                    base_probs = _HIST_BASE_PROBS[(is_active, is_active and bool(is_operational))]
                     noise_factor = min(0.1, pending_jobs * 0.01)
-                    for i in range(len(probabilities)):
-                        if i == 0:  # Keep |00âŸ© dominant
-                            probabilities[i] = max(0.1, probabilities[i] - noise_factor)
-                        else:
-                            probabilities[i] += noise_factor / (len(probabilities) - 1)
+                    spread = noise_factor / (len(base_probs) - 1)
+                    probabilities = [max(0.1, base_probs[0] - noise_factor)]  # Keep |00> dominant
+                    probabilities += [p + spread for p in base_probs[1:]]
                     
                     # Normalize probabilities
                     total = sum(probabilities)
                     probabilities = [p / total for p in probabilities]
+                    outcomes = _HIST_OUTCOMES
                     
-                    # Create histogram
-                    plt.figure(figsize=(8, 5))
-                    bars = plt.bar(outcomes, probabilities, color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'])
-                    
-                    # Customize the plot
-                    plt.title(f'{backend_name} Measurement Results', fontsize=14, fontweight='bold')
-                    plt.xlabel('Measurement Outcome', fontsize=12)
-                    plt.ylabel('Probability', fontsize=12)
-                    plt.ylim(0, 1)
-                    
-                    # Add probability values on top of bars
-                    for bar, prob in zip(bars, probabilities):
-                        height = bar.get_height()
-                        plt.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                                f'{prob:.2f}', ha='center', va='bottom', fontweight='bold')
-                    
-                    # Add backend info as text
                     info_text = f'Qubits: {num_qubits_backend} | Jobs: {pending_jobs} | Status: {"Active" if is_active else "Inactive"}'
-                    plt.figtext(0.5, 0.02, info_text, ha='center', fontsize=10, style='italic')
+                    if not USE_MATPLOTLIB_HISTOGRAMS:
+                        return _render_histogram_svg(backend_name, outcomes, probabilities, info_text)
                     
-                    plt.grid(True, alpha=0.3)
-                    plt.tight_layout()
+                    return self._render_histogram_png(backend_name, outcomes, probabilities, info_text)
                     
                 except Exception as hist_error:
-                    print(f"Histogram visualization fallback: {hist_error}")
+                    logger.debug("Histogram visualization fallback: %s", hist_error)
                     # Fallback to simple bar chart
-                    plt.figure(figsize=(8, 5))
-                    outcomes = ['|00âŸ©', '|01âŸ©', '|10âŸ©', '|11âŸ©']
-                    probabilities = [0.5, 0.2, 0.2, 0.1]
-                    plt.bar(outcomes, probabilities, color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'])
-                    plt.title(f'{backend_name} Quantum State Distribution')
-                    plt.xlabel('Quantum State')
-                    plt.ylabel('Probability')
-                    plt.ylim(0, 1)
-                    plt.grid(True, alpha=0.3)
+                    return self._render_histogram_png(backend_name, _FALLBACK_OUTCOMES, _FALLBACK_PROBS)
             
             # Save figure to base64 string
             buf = io.BytesIO()
@@ -1482,9 +2578,46 @@ class QuantumBackendManager:
             return img_str
             
         except Exception as e:
-            print(f"Error creating quantum visualization: {e}")
+            logger.error("Error creating quantum visualization: %s", e)
             return None
 
+    def _render_histogram_png(self, backend_name, outcomes, probabilities, info_text=None):
+        """Draw a histogram on the shared figure and return it as base64 PNG data
+
+        Without info_text this draws the plain fallback chart.
+        """
+        with self._fig_lock:
+            fig = self._fig_hist
+            fig.clear()
+            ax = fig.add_subplot()
+            bars = ax.bar(outcomes, probabilities, color=_HIST_COLORS)
+            ax.set_ylim(0, 1)
+            ax.grid(True, alpha=0.3)
+            
+            if info_text is None:
+                ax.set_title(f'{backend_name} Quantum State Distribution')
+                ax.set_xlabel('Quantum State')
+                ax.set_ylabel('Probability')
+            else:
+                ax.set_title(f'{backend_name} Measurement Results', fontsize=14, fontweight='bold')
+                ax.set_xlabel('Measurement Outcome', fontsize=12)
+                ax.set_ylabel('Probability', fontsize=12)
+                
+                # Add probability values on top of bars
+                for bar, prob in zip(bars, probabilities):
+                    ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 0.01,
+                            f'{prob:.2f}', ha='center', va='bottom', fontweight='bold')
+                
+                # Add backend info as text
+                fig.text(0.5, 0.02, info_text, ha='center', fontsize=10, style='italic')
+                fig.tight_layout()
+            
+            buf = self._fig_buf
+            buf.seek(0)
+            buf.truncate()
+            fig.savefig(buf, format='png', dpi=120, bbox_inches='tight')
+            return base64.b64encode(buf.getvalue()).decode('utf-8')
+
     def generate_quantum_state(self):
         """Generate a real quantum state vector based on backend properties"""
         try:
@@ -1504,7 +2637,6 @@ class QuantumBackendManager:
             # Generate state based on backend properties
             if is_operational:
                 # Generate a superposition state for operational backends
-                import numpy as np
                 # Create a Bell state-like superposition
                 alpha = np.sqrt(0.7)  # |0âŸ© component
                 beta = np.sqrt(0.3) * np.exp(1j * np.pi / 4)  # |1âŸ© component with phase
@@ -1520,59 +2652,49 @@ class QuantumBackendManager:
                 # x = 2*Re(Î±*Î²*)
                 # y = 2*Im(Î±*Î²*)
                 # z = |Î±|Â² - |Î²|Â²
-                x = 2 * np.real(alpha * np.conj(beta))
-                y = 2 * np.imag(alpha * np.conj(beta))
-                z = np.abs(alpha)**2 - np.abs(beta)**2
-                
-                state_vector = [x, y, z]
+                state_vector = _bloch(alpha, beta)
                 
                 # Store the state
-                self.current_state = {
+                self.current_state = _finalize_state({
                     'vector': state_vector,
                     'alpha': alpha,
                     'beta': beta,
                     'backend': backend.get('name', 'unknown'),
                     'timestamp': time.time()
-                }
+                })
                 
                 self.quantum_states.append(self.current_state)
                 
-                # Store quantum state in database
-                try:
-                    db.store_quantum_state({
-                        'name': f"state_{backend.get('name', 'unknown')}",
-                        'state_vector': state_vector,
-                        'theta': 0.0,  # Will be calculated from alpha/beta
-                        'phi': 0.0,
-                        'fidelity': 0.95
-                    })
-                except Exception as e:
-                    print(f"âš ï¸ Failed to store quantum state in database: {e}")
+                # Persist on the background state writer, off the request path
+                _state_writer_queue.put({
+                    'name': f"state_{backend.get('name', 'unknown')}",
+                    'state_vector': state_vector,
+                    'theta': 0.0,  # Will be calculated from alpha/beta
+                    'phi': 0.0,
+                    'fidelity': 0.95
+                })
                 
                 return state_vector
             else:
                 # Generate a simple |0âŸ© state for inactive backends
                 state_vector = [0, 0, 1]  # |0âŸ© state
-                self.current_state = {
+                self.current_state = _finalize_state({
                     'vector': state_vector,
                     'alpha': 1.0,
                     'beta': 0.0,
                     'backend': backend.get('name', 'unknown'),
                     'timestamp': time.time()
-                }
+                })
                 self.quantum_states.append(self.current_state)
                 
-                # Store quantum state in database
-                try:
-                    db.store_quantum_state({
-                        'name': f"state_{backend.get('name', 'unknown')}_fallback",
-                        'state_vector': state_vector,
-                        'theta': 0.0,
-                        'phi': 0.0,
-                        'fidelity': 1.0
-                    })
-                except Exception as e:
-                    print(f"âš ï¸ Failed to store fallback quantum state in database: {e}")
+                # Persist on the background state writer, off the request path
+                _state_writer_queue.put({
+                    'name': f"state_{backend.get('name', 'unknown')}_fallback",
+                    'state_vector': state_vector,
+                    'theta': 0.0,
+                    'phi': 0.0,
+                    'fidelity': 1.0
+                })
                 
                 return state_vector
                 
@@ -1589,37 +2711,16 @@ class QuantumBackendManager:
             if not self.current_state:
                 return None
             
-            import numpy as np
-            from qiskit import QuantumCircuit, Aer, execute
-            from qiskit.quantum_info import Operator
-            
-            # Create a simple 1-qubit circuit
-            qc = QuantumCircuit(1, 1)
-            
-            # Apply the specified gate
-            if gate_type == 'h':  # Hadamard
-                qc.h(0)
-            elif gate_type == 'x':  # Pauli-X
-                qc.x(0)
-            elif gate_type == 'y':  # Pauli-Y
-                qc.y(0)
-            elif gate_type == 'z':  # Pauli-Z
-                qc.z(0)
-            elif gate_type == 'rx':  # Rotation around X-axis
-                qc.rx(angle, 0)
-            elif gate_type == 'ry':  # Rotation around Y-axis
-                qc.ry(angle, 0)
-            elif gate_type == 'rz':  # Rotation around Z-axis
-                qc.rz(angle, 0)
-            else:
+            # A single-qubit gate is a 2x2 matrix applied to [alpha, beta]
+            matrix = _GATES.get(gate_type)
+            if matrix is None:
+                matrix = _rotation_gate(gate_type, angle)
+            if matrix is None:
                 print(f"Unknown gate type: {gate_type}")
                 return None
             
-            # Execute the circuit
-            backend = Aer.get_backend('statevector_simulator')
-            job = execute(qc, backend)
-            result = job.result()
-            statevector = result.get_statevector()
+            statevector = matrix @ np.array([self.current_state.get('alpha', 1.0),
+                                             self.current_state.get('beta', 0.0)], dtype=complex)
             
             # Convert to Bloch sphere coordinates
             # For a 1-qubit state |ÏˆâŸ© = Î±|0âŸ© + Î²|1âŸ©
@@ -1627,14 +2728,10 @@ class QuantumBackendManager:
             beta = statevector[1]
             
             # Bloch vector coordinates
-            x = 2 * np.real(alpha * np.conj(beta))
-            y = 2 * np.imag(alpha * np.conj(beta))
-            z = np.abs(alpha)**2 - np.abs(beta)**2
-            
-            new_state_vector = [x, y, z]
+            new_state_vector = _bloch(alpha, beta)
             
             # Update current state
-            self.current_state = {
+            self.current_state = _finalize_state({
                 'vector': new_state_vector,
                 'alpha': alpha,
                 'beta': beta,
@@ -1642,7 +2739,7 @@ class QuantumBackendManager:
                 'angle': angle,
                 'backend': self.current_state.get('backend', 'unknown'),
                 'timestamp': time.time()
-            }
+            })
             
             self.quantum_states.append(self.current_state)
             return new_state_vector
@@ -1660,50 +2757,32 @@ class QuantumBackendManager:
             if not self.current_state:
                 return None
             
-            state = self.current_state
-            vector = state['vector']
-            
-            # Calculate additional properties
-            import numpy as np
-            
-            # Bloch sphere coordinates
-            x, y, z = vector
-            
-            # Convert to spherical coordinates
-            r = np.sqrt(x**2 + y**2 + z**2)
-            theta = np.arccos(z / r) if r > 0 else 0
-            phi = np.arctan2(y, x) if x != 0 else 0
-            
-            # State representation
-            alpha = state.get('alpha', 1.0)
-            beta = state.get('beta', 0.0)
-            
-            # Fidelity (assuming target is |0âŸ© state)
-            target_state = [0, 0, 1]
-            fidelity = (1 + x * target_state[0] + y * target_state[1] + z * target_state[2]) / 2
-            
-            return {
-                'bloch_vector': vector,
-                'spherical_coords': {
-                    'r': float(r),
-                    'theta': float(theta),
-                    'phi': float(phi)
-                },
-                'state_representation': {
-                    'alpha': str(alpha),
-                    'beta': str(beta),
-                    'equation': f"|ÏˆâŸ© = {alpha:.3f}|0âŸ© + {beta:.3f}|1âŸ©"
-                },
-                'fidelity': float(fidelity),
-                'backend': state.get('backend', 'unknown'),
-                'timestamp': state.get('timestamp', time.time()),
-                'gate_history': [s.get('gate_applied') for s in self.quantum_states if s.get('gate_applied')]
-            }
+            return self._state_info(self.current_state)
             
         except Exception as e:
             print(f"Error getting quantum state info: {e}")
             return None
 
+    def _state_info(self, state, is_simulated=False):
+        """Response body shared by get_quantum_state_info and its simulation variant"""
+        info = {
+            'bloch_vector': state['vector'],
+            'spherical_coords': dict(state['_spherical']),
+            'state_representation': {
+                'alpha': str(state.get('alpha', 1.0)),
+                'beta': str(state.get('beta', 0.0)),
+                'equation': state['_equation_polar' if is_simulated else '_equation_str']
+            },
+            'fidelity': state['_fidelity_z'],
+            'timestamp': state.get('timestamp', time.time()),
+        }
+        if is_simulated:
+            info.update(backend='simulation', is_simulated=True, gate_history=[])
+        else:
+            info.update(backend=state.get('backend', 'unknown'),
+                        gate_history=[s.get('gate_applied') for s in self.quantum_states if s.get('gate_applied')])
+        return info
+
     def generate_simulated_quantum_state(self):
         """Generate simulated quantum state when IBM Quantum is not available"""
         raise RuntimeError("SIMULATED QUANTUM STATES ARE NOT ALLOWED - REAL QUANTUM DATA REQUIRED")
@@ -1717,46 +2796,7 @@ class QuantumBackendManager:
             if not self.current_state:
                 return None
             
-            state = self.current_state
-            vector = state['vector']
-            
-            # Calculate additional properties
-            import numpy as np
-            
-            # Bloch sphere coordinates
-            x, y, z = vector
-            
-            # Convert to spherical coordinates
-            r = np.sqrt(x**2 + y**2 + z**2)
-            theta = np.arccos(z / r) if r > 0 else 0
-            phi = np.atan2(y, x) if x != 0 else 0
-            
-            # State representation
-            alpha = state.get('alpha', 1.0)
-            beta = state.get('beta', 0.0)
-            
-            # Fidelity (assuming target is |0âŸ© state)
-            target_state = [0, 0, 1]
-            fidelity = (1 + x * target_state[0] + y * target_state[1] + z * target_state[2]) / 2
-            
-            return {
-                'bloch_vector': vector,
-                'spherical_coords': {
-                    'r': float(r),
-                    'theta': float(theta),
-                    'phi': float(phi)
-                },
-                'state_representation': {
-                    'alpha': str(alpha),
-                    'beta': str(beta),
-                    'equation': f"|ÏˆâŸ© = {abs(alpha):.3f}|0âŸ© + {abs(beta):.3f}e^(i{np.angle(beta):.3f})|1âŸ©"
-                },
-                'fidelity': float(fidelity),
-                'backend': 'simulation',
-                'timestamp': state.get('timestamp', time.time()),
-                'is_simulated': True,
-                'gate_history': []
-            }
+            return self._state_info(self.current_state, is_simulated=True)
             
         except Exception as e:
             print(f"Error getting simulated quantum state info: {e}")
@@ -1786,71 +2826,74 @@ class QuantumBackendManager:
     def execute_real_quantum_circuit(self, circuit):
         """Execute a quantum circuit on real IBM Quantum hardware"""
         execution_log = []
-        import time
-        import datetime
+        
+        def _log(msg, _append=execution_log.append, _strftime=time.strftime):
+            _append(f"[{_strftime('%H:%M:%S')}] {msg}")
         
         try:
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Starting quantum circuit execution...")
+            _log("Starting quantum circuit execution...")
             
             if not self.is_connected or not self.provider:
                 raise RuntimeError("Not connected to IBM Quantum")
             
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Connected to IBM Quantum provider")
+            _log("Connected to IBM Quantum provider")
             
             # Get available backends
             backends = self.get_backends()
             if not backends:
                 raise RuntimeError("No available backends")
             
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Found {len(backends)} available backends")
+            _log(f"Found {len(backends)} available backends")
             
             # Log all available backends for debugging
             for i, backend in enumerate(backends):
-                execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Backend {i}: {backend.get('name', 'unknown')}")
+                _log(f"Backend {i}: {backend.get('name', 'unknown')}")
             
             # Prefer real hardware backends over simulators
             real_backends = [b for b in backends if 'simulator' not in b.get('name', '').lower()]
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Found {len(real_backends)} real hardware backends")
+            _log(f"Found {len(real_backends)} real hardware backends")
             
             if real_backends:
                 backend_name = real_backends[0].get('name', 'ibmq_manila')
-                execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Selected real hardware backend: {backend_name}")
+                _log(f"Selected real hardware backend: {backend_name}")
             else:
                 # No real hardware available - this should not happen in real mode
-                execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] ERROR: No real hardware backends available!")
+                _log("ERROR: No real hardware backends available!")
                 raise RuntimeError("No real hardware backends available - only simulators found")
             
-            # Log circuit details
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Circuit has {circuit.num_qubits} qubits, {circuit.depth()} depth")
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Circuit gates: {[gate[0].name for gate in circuit.data]}")
+            # Log circuit details; depth() walks the whole circuit, so it is taken once
+            num_qubits = circuit.num_qubits
+            depth = circuit.depth()
+            gate_names = [gate[0].name for gate in circuit.data]
+            _log(f"Circuit has {num_qubits} qubits, {depth} depth")
+            _log(f"Circuit gates: {gate_names}")
             
             # Execute on real IBM Quantum hardware using simple approach
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Using simple quantum execution...")
+            _log("Using simple quantum execution...")
             
-            # Get the backend object directly
-            backend = self.provider.get_backend(backend_name)
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Got backend object: {backend}")
+            # Get the backend object, reusing the handle from earlier submissions
+            backend = self._backend_for(backend_name)
+            _log(f"Got backend object: {backend}")
             
-            # Transpile the circuit for the backend
-            from qiskit import transpile
-            transpiled_circuit = transpile(circuit, backend)
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Circuit transpiled successfully")
+            # Transpile the circuit for the backend, or reuse an earlier identical transpilation
+            transpiled_circuit = self._transpile_for(circuit, backend_name, backend)
+            _log("Circuit transpiled successfully")
             
             # Execute the circuit
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Submitting job to {backend_name}...")
+            _log(f"Submitting job to {backend_name}...")
             job = backend.run(transpiled_circuit, shots=1024)
             
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Job submitted with ID: {job.job_id()}")
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Waiting for results...")
+            _log(f"Job submitted with ID: {job.job_id()}")
+            _log("Waiting for results...")
             
             # Get results with timeout
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Waiting for job completion (timeout: 60 seconds)...")
+            _log("Waiting for job completion (timeout: 60 seconds)...")
             result = job.result(timeout=60)
             counts = result.get_counts()
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Got measurement counts: {counts}")
+            _log(f"Got measurement counts: {counts}")
             
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Execution completed successfully")
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Results: {counts}")
+            _log("Execution completed successfully")
+            _log(f"Results: {counts}")
             
             return {
                 'counts': counts,
@@ -1860,14 +2903,14 @@ class QuantumBackendManager:
                 'shots': 1024,
                 'execution_log': execution_log,
                 'circuit_info': {
-                    'num_qubits': circuit.num_qubits,
-                    'depth': circuit.depth(),
-                    'gates': [gate[0].name for gate in circuit.data]
+                    'num_qubits': num_qubits,
+                    'depth': depth,
+                    'gates': gate_names
                 }
             }
             
         except Exception as e:
-            execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Error: {str(e)}")
+            _log(f"Error: {str(e)}")
             print(f"Error executing real quantum circuit: {e}")
             return None
 
@@ -1877,20 +2920,15 @@ class QuantumBackendManager:
             if not self.is_connected or self.simulation_mode:
                 return {"error": "Not connected to real quantum backend"}
 
-            # Get results from completed jobs
-            results = []
-            for job_data in self.job_data:
-                if job_data.get('status') == 'DONE' and 'result' in job_data:
-                    result_data = job_data['result']
-                    if 'counts' in result_data:
-                        results.append({
-                            'job_id': job_data.get('job_id', 'unknown'),
-                            'backend': job_data.get('backend', 'unknown'),
-                            'counts': result_data['counts'],
-                            'shots': result_data.get('shots', 1024),
-                            'fidelity': result_data.get('fidelity', 0.95),
-                            'real_data': True
-                        })
+            # Get results from completed jobs, indexed when job_data was last set
+            results = [{
+                'job_id': job_id,
+                'backend': backend,
+                'counts': counts,
+                'shots': shots,
+                'fidelity': fidelity,
+                'real_data': True
+            } for job_id, backend, counts, shots, fidelity in self._done_jobs]
 
             return {
                 'results': results,
@@ -1909,9 +2947,9 @@ class QuantumBackendManager:
 
             # Calculate performance metrics from backend data
             total_backends = len(self.backend_data)
-            operational_backends = sum(1 for b in self.backend_data if b.get('operational', False))
+            operational_backends = int(self.backend_operational.sum())
             total_jobs = len(self.job_data)
-            completed_jobs = sum(1 for j in self.job_data if j.get('status') == 'DONE')
+            completed_jobs = int((self.job_columns['status'] == 'done').sum())
 
             success_rate = (completed_jobs / total_jobs * 100) if total_jobs > 0 else 0
 
@@ -1963,297 +3001,159 @@ class QuantumBackendManager:
     # -------------------------
     # Recommendation utilities
     # -------------------------
-    def _predict_job_runtime_seconds(self, backend_info, job_complexity='medium'):
-        """Realistic runtime prediction for a single job on a backend (seconds)."""
-        try:
-            backend_name = backend_info.get('name', 'unknown')
-            num_qubits = int(backend_info.get('num_qubits', 5) or 5)
-            complexity = str(job_complexity).lower()
-            
-            # Realistic complexity factors based on actual quantum algorithms
-            complexity_factors = {
-                'low': 0.6,      # Simple circuits (Bell states, basic gates)
-                'medium': 1.0,   # Standard algorithms (Grover, VQE)
-                'high': 2.2      # Complex algorithms (QAOA, error correction)
-            }
-            complexity_factor = complexity_factors.get(complexity, 1.0)
-
-            # Backend-specific base performance (realistic based on IBM Quantum systems)
-            backend_performance = {
-                'ibm_belem': {'base_time': 45, 'qubit_factor': 0.8, 'tier': 'free'},
-                'ibm_lagos': {'base_time': 35, 'qubit_factor': 0.7, 'tier': 'free'},
-                'ibm_quito': {'base_time': 50, 'qubit_factor': 0.9, 'tier': 'free'},
-                'ibmq_qasm_simulator': {'base_time': 5, 'qubit_factor': 0.1, 'tier': 'simulator'},
-                'ibm_oslo': {'base_time': 25, 'qubit_factor': 0.5, 'tier': 'paid'},
-                'ibm_brisbane': {'base_time': 20, 'qubit_factor': 0.4, 'tier': 'paid'},
-                'ibm_pittsburgh': {'base_time': 18, 'qubit_factor': 0.35, 'tier': 'paid'},
-                'ibm_sherbrooke': {'base_time': 15, 'qubit_factor': 0.3, 'tier': 'premium'}
-            }
-            
-            # Get backend-specific performance or use defaults
-            perf = backend_performance.get(backend_name, {'base_time': 30, 'qubit_factor': 0.6, 'tier': 'unknown'})
-            
-            # Calculate realistic runtime based on:
-            # 1. Base backend performance
-            # 2. Qubit count scaling (more qubits = more time)
-            # 3. Algorithm complexity
-            # 4. Queue processing overhead
-            base_runtime = perf['base_time']
-            qubit_scaling = 1 + (num_qubits * perf['qubit_factor'] * 0.1)
-            
-            # Add realistic overhead factors
-            compilation_overhead = 8 + (num_qubits * 0.5)  # Compilation time
-            execution_overhead = 5 + (complexity_factor * 3)  # Execution overhead
-            
-            total_runtime = (base_runtime * qubit_scaling * complexity_factor) + compilation_overhead + execution_overhead
-            
-            # Add some realistic variance (Â±10%)
-            import random
-            variance = random.uniform(0.9, 1.1)
-            final_runtime = max(2.0, total_runtime * variance)
-            
-            return float(final_runtime)
-        except Exception:
-            return 30.0
+    def recommend_backends(self, algorithm='auto', top_k=5, requirements=None, job_complexity='medium', include_inactive=False):
+        """Return ranked backend recommendations with scores and predictions.
 
-    def _predict_wait_seconds(self, backend_info, job_complexity='medium'):
-        """Realistic queue wait prediction based on pending jobs, runtime, and backend characteristics."""
+        Rankings are cached until the backend fields they depend on change.
+        """
         try:
-            backend_name = backend_info.get('name', 'unknown')
-            pending_jobs = int(backend_info.get('pending_jobs', 0) or 0)
-            per_job_runtime = self._predict_job_runtime_seconds(backend_info, job_complexity)
-            
-            # Backend-specific queue processing characteristics
-            backend_queue_config = {
-                'ibm_belem': {'parallel_jobs': 1, 'queue_efficiency': 0.8, 'priority_factor': 1.0},
-                'ibm_lagos': {'parallel_jobs': 1, 'queue_efficiency': 0.85, 'priority_factor': 1.0},
-                'ibm_quito': {'parallel_jobs': 1, 'queue_efficiency': 0.75, 'priority_factor': 1.0},
-                'ibmq_qasm_simulator': {'parallel_jobs': 10, 'queue_efficiency': 0.95, 'priority_factor': 0.5},
-                'ibm_oslo': {'parallel_jobs': 2, 'queue_efficiency': 0.9, 'priority_factor': 0.8},
-                'ibm_brisbane': {'parallel_jobs': 3, 'queue_efficiency': 0.92, 'priority_factor': 0.7},
-                'ibm_pittsburgh': {'parallel_jobs': 3, 'queue_efficiency': 0.95, 'priority_factor': 0.6},
-                'ibm_sherbrooke': {'parallel_jobs': 4, 'queue_efficiency': 0.98, 'priority_factor': 0.5}
-            }
-            
-            config = backend_queue_config.get(backend_name, {'parallel_jobs': 1, 'queue_efficiency': 0.8, 'priority_factor': 1.0})
-            
-            # Calculate realistic wait time considering:
-            # 1. Number of pending jobs
-            # 2. Parallel processing capability
-            # 3. Queue efficiency (some jobs may fail/retry)
-            # 4. Priority factor (paid backends get priority)
-            # 5. Time of day factor (realistic usage patterns)
-            
-            # Base wait time calculation
-            effective_jobs = pending_jobs / config['parallel_jobs']
-            base_wait = effective_jobs * per_job_runtime
-            
-            # Apply queue efficiency (accounts for retries, failures, etc.)
-            efficiency_factor = config['queue_efficiency']
-            
-            # Apply priority factor (paid backends process faster)
-            priority_factor = config['priority_factor']
-            
-            # Time of day factor (realistic usage patterns)
-            import time
-            current_hour = time.localtime().tm_hour
-            if 9 <= current_hour <= 17:  # Business hours
-                time_factor = 1.2  # 20% slower during peak hours
-            elif 18 <= current_hour <= 22:  # Evening
-                time_factor = 1.1  # 10% slower
-            else:  # Night/early morning
-                time_factor = 0.8  # 20% faster
-            
-            # Calculate final wait time
-            final_wait = base_wait * (1 / efficiency_factor) * priority_factor * time_factor
-            
-            # Add some realistic variance (Â±15%)
-            import random
-            variance = random.uniform(0.85, 1.15)
-            final_wait = max(0.0, final_wait * variance)
-            
-            return float(final_wait)
+            data_source = self._ranking_backends()
         except Exception:
-            return 0.0
+            data_source = []
 
-    def _estimate_throughput_jobs_per_hour(self, backend_info, job_complexity='medium'):
-        """Realistic throughput estimation considering backend capabilities and queue efficiency."""
+        key = (tuple((b.get('name'), b.get('pending_jobs', 0), b.get('operational', False), b.get('num_qubits', 0))
+                     for b in data_source),
+               algorithm, top_k, frozenset((requirements or {}).items()), job_complexity, include_inactive)
+        with self._reco_lock:
+            cached = self._reco_cache.get(key)
+            if cached is not None:
+                self._reco_cache.move_to_end(key)
+                return list(cached)
+
+        if not include_inactive:
+            data_source = [backend for backend in data_source if backend.get('operational', False)]
+        
+        # Predictions and scores for every candidate at once
         try:
-            backend_name = backend_info.get('name', 'unknown')
-            per_job_runtime = self._predict_job_runtime_seconds(backend_info, job_complexity)
-            
-            if per_job_runtime <= 0:
-                return 0.0
-            
-            # Backend-specific parallel processing capabilities
-            backend_parallel_config = {
-                'ibm_belem': {'max_parallel': 1, 'efficiency': 0.8},
-                'ibm_lagos': {'max_parallel': 1, 'efficiency': 0.85},
-                'ibm_quito': {'max_parallel': 1, 'efficiency': 0.75},
-                'ibmq_qasm_simulator': {'max_parallel': 10, 'efficiency': 0.95},
-                'ibm_oslo': {'max_parallel': 2, 'efficiency': 0.9},
-                'ibm_brisbane': {'max_parallel': 3, 'efficiency': 0.92},
-                'ibm_pittsburgh': {'max_parallel': 3, 'efficiency': 0.95},
-                'ibm_sherbrooke': {'max_parallel': 4, 'efficiency': 0.98}
-            }
-            
-            config = backend_parallel_config.get(backend_name, {'max_parallel': 1, 'efficiency': 0.8})
-            
-            # Calculate theoretical maximum throughput
-            theoretical_throughput = (3600.0 / per_job_runtime) * config['max_parallel']
-            
-            # Apply efficiency factor (accounts for overhead, failures, maintenance)
-            actual_throughput = theoretical_throughput * config['efficiency']
-            
-            # Apply complexity factor (complex jobs reduce overall throughput)
-            complexity = str(job_complexity).lower()
-            complexity_factors = {'low': 1.0, 'medium': 0.8, 'high': 0.6}
-            complexity_factor = complexity_factors.get(complexity, 0.8)
-            
-            final_throughput = actual_throughput * complexity_factor
-            
-            return float(max(0.0, final_throughput))
+            _, waits, throughputs = _predict_backends(data_source, job_complexity, time_factor=_time_of_day_factor())
         except Exception:
-            return 0.0
-
-    def _compute_score(self, backend_info, algorithm='balanced', requirements=None, job_complexity='medium'):
-        """Compute a 0..1 score for a backend based on the chosen algorithm."""
+            waits = throughputs = np.zeros(len(data_source))
+        
+        # Rank first, so recommendation dicts are only built for the backends returned
         requirements = requirements or {}
-
-        operational_score = 1.0 if backend_info.get('operational', False) else 0.0
-        pending_jobs = int(backend_info.get('pending_jobs', 0) or 0)
-        queue_score = 1.0 / (1.0 + float(max(0, pending_jobs)))
-
-        num_qubits = int(backend_info.get('num_qubits', 0) or 0)
-        min_qubits = int(requirements.get('min_qubits', 0) or 0)
-        if min_qubits > 0 and num_qubits < min_qubits:
-            qubit_score = 0.0
+        limit = top_k if isinstance(top_k, int) else 0
+        pending = np.fromiter((int(b.get('pending_jobs', 0) or 0) for b in data_source),
+                              dtype=np.int64, count=len(data_source))
+        if (str(algorithm).lower() in ('fastest_queue', 'low_latency') and not include_inactive
+                and not isinstance(requirements.get('max_wait_seconds'), (int, float))):
+            # No qubit weight, no wait cap and every candidate operational: the score only falls
+            # as pending jobs rise, so rank on pending jobs then wait and score just the winners
+            order = np.lexsort((np.round(waits, 2), pending))
+            order = (order[:limit] if limit > 0 else order).tolist()
+            data_source = [data_source[i] for i in order]
+            waits, throughputs = waits[order], throughputs[order]
+            order = list(range(len(data_source)))
+            (w_queue, w_oper, w_qubits), scores, queue_scores, qubit_scores = _score_backends(
+                data_source, waits, algorithm, requirements)
         else:
-            if min_qubits <= 0:
-                qubit_score = min(1.0, num_qubits / 127.0)
-            else:
-                # Reward meeting/exceeding requirement, diminishing returns
-                qubit_score = 0.5 + 0.5 * (num_qubits - min_qubits) / max(1.0, float(min_qubits))
-                qubit_score = max(0.1, min(1.0, qubit_score))
-
-        algo = str(algorithm).lower()
-        if algo in ('fastest_queue', 'low_latency'):
-            w_queue, w_oper, w_qubits = 0.8, 0.2, 0.0
-        elif algo == 'highest_qubits':
-            w_queue, w_oper, w_qubits = 0.1, 0.2, 0.7
-        elif algo == 'auto':
-            # If requirement is heavy on qubits, bias toward qubit capacity
-            if min_qubits >= 64:
-                w_queue, w_oper, w_qubits = 0.2, 0.2, 0.6
-            else:
-                w_queue, w_oper, w_qubits = 0.6, 0.3, 0.1
-        else:  # balanced
-            w_queue, w_oper, w_qubits = 0.5, 0.3, 0.2
-
-        base_score = (
-            w_queue * queue_score +
-            w_oper * operational_score +
-            w_qubits * qubit_score
-        )
-
-        predicted_wait = self._predict_wait_seconds(backend_info, job_complexity)
-        max_wait = requirements.get('max_wait_seconds')
-        if isinstance(max_wait, (int, float)) and max_wait is not None:
-            if predicted_wait > float(max_wait):
-                base_score *= 0.5
-
-        base_score = max(0.0, min(1.0, float(base_score)))
-
-        details = {
-            "queue_score": queue_score,
-            "operational_score": operational_score,
-            "qubit_score": qubit_score,
-            "predicted_wait_seconds": predicted_wait,
-            "throughput_jobs_per_hour": self._estimate_throughput_jobs_per_hour(backend_info, job_complexity),
-            "weights": {
-                "queue": w_queue,
-                "operational": w_oper,
-                "qubits": w_qubits
-            }
-        }
-        return base_score, details
-
-    def recommend_backends(self, algorithm='auto', top_k=5, requirements=None, job_complexity='medium', include_inactive=False):
-        """Return ranked backend recommendations with scores and predictions."""
-        try:
-            data_source = list(self.backend_data) if self.backend_data else self.get_backends()
-        except Exception:
-            data_source = []
-
+            (w_queue, w_oper, w_qubits), scores, queue_scores, qubit_scores = _score_backends(
+                data_source, waits, algorithm, requirements)
+            order = _rank_backends(scores, waits, pending, limit).tolist()
+        
         recommendations = []
-        for backend in data_source:
-            if not include_inactive and not backend.get('operational', False):
-                continue
-            score, details = self._compute_score(backend, algorithm=algorithm, requirements=requirements or {}, job_complexity=job_complexity)
-            # Build explanation string
-            try:
-                expl = (
-                    f"algorithm={algorithm}, "
-                    f"weights(queue={details['weights']['queue']:.2f}, operational={details['weights']['operational']:.2f}, qubits={details['weights']['qubits']:.2f}), "
-                    f"queue_score={details['queue_score']:.2f}, operational_score={details['operational_score']:.2f}, qubit_score={details['qubit_score']:.2f}, "
-                    f"predicted_wait={details['predicted_wait_seconds']:.2f}s, throughput={details['throughput_jobs_per_hour']:.2f} jobs/h"
-                )
-            except Exception:
-                expl = f"algorithm={algorithm}"
+        for backend, score, queue_score, qubit_score, wait, throughput in zip(
+                [data_source[i] for i in order], scores[order].tolist(), queue_scores[order].tolist(),
+                qubit_scores[order].tolist(), waits[order].tolist(), throughputs[order].tolist()):
+            operational_score = 1.0 if backend.get('operational', False) else 0.0
+            details = {
+                "queue_score": queue_score,
+                "operational_score": operational_score,
+                "qubit_score": qubit_score,
+                "predicted_wait_seconds": wait,
+                "throughput_jobs_per_hour": throughput,
+                "weights": {
+                    "queue": w_queue,
+                    "operational": w_oper,
+                    "qubits": w_qubits
+                }
+            }
+            expl = _EXPL_TMPL.format(algorithm, w_queue, w_oper, w_qubits, queue_score, operational_score,
+                                     qubit_score, wait, throughput)
             recommendations.append({
                 "name": backend.get("name", "unknown"),
                 "score": round(float(score), 4),
                 "operational": bool(backend.get("operational", False)),
                 "pending_jobs": int(backend.get("pending_jobs", 0) or 0),
                 "num_qubits": int(backend.get("num_qubits", 0) or 0),
-                "predicted_wait_seconds": round(float(details["predicted_wait_seconds"]), 2),
-                "throughput_jobs_per_hour": round(float(details["throughput_jobs_per_hour"]), 2),
+                "predicted_wait_seconds": round(wait, 2),
+                "throughput_jobs_per_hour": round(throughput, 2),
                 "algorithm": algorithm,
                 "score_breakdown": details,
                 "explanation": expl
             })
 
-        recommendations.sort(key=lambda x: (-x["score"], x["predicted_wait_seconds"], x["pending_jobs"]))
-        if isinstance(top_k, int) and top_k > 0:
-            recommendations = recommendations[:top_k]
-        return recommendations
+        with self._reco_lock:
+            self._reco_cache[key] = recommendations
+            while len(self._reco_cache) > RECOMMENDATION_CACHE_SIZE:
+                self._reco_cache.popitem(last=False)
+        return list(recommendations)
 
     def get_backend_predictions(self, job_complexity='medium', requirements=None):
         """Return prediction metrics for all backends without ranking."""
         try:
-            data_source = list(self.backend_data) if self.backend_data else self.get_backends()
+            data_source = self._ranking_backends()
         except Exception:
             data_source = []
 
-        predictions = []
         min_qubits = int((requirements or {}).get('min_qubits', 0) or 0)
-        for backend in data_source:
-            num_qubits = int(backend.get('num_qubits', 0) or 0)
-            if min_qubits > 0 and num_qubits < min_qubits:
-                continue
-            pred_wait = self._predict_wait_seconds(backend, job_complexity)
-            predictions.append({
-                "name": backend.get("name", "unknown"),
-                "predicted_wait_seconds": round(float(pred_wait), 2),
-                "throughput_jobs_per_hour": round(float(self._estimate_throughput_jobs_per_hour(backend, job_complexity)), 2),
-                "operational": bool(backend.get("operational", False)),
-                "pending_jobs": int(backend.get("pending_jobs", 0) or 0),
-                "num_qubits": num_qubits
-            })
-        return predictions
-
-    def refresh_if_stale(self, max_age=30):
-        """Refresh cached data if older than max_age seconds."""
+        num_qubits = np.fromiter((int(b.get('num_qubits', 0) or 0) for b in data_source),
+                                 dtype=np.int64, count=len(data_source))
+        keep = np.flatnonzero(num_qubits >= min_qubits).tolist()
+        data_source = [data_source[i] for i in keep]
+        try:
+            _, waits, throughputs = _predict_backends(data_source, job_complexity)
+        except Exception:
+            waits = throughputs = np.zeros(len(data_source))
+
+        return [{
+            "name": backend.get("name", "unknown"),
+            "predicted_wait_seconds": round(wait, 2),
+            "throughput_jobs_per_hour": round(throughput, 2),
+            "operational": bool(backend.get("operational", False)),
+            "pending_jobs": int(backend.get("pending_jobs", 0) or 0),
+            "num_qubits": qubits
+        } for backend, qubits, wait, throughput in zip(
+            data_source, num_qubits[keep].tolist(), waits.tolist(), throughputs.tolist())]
+
+    def refresh_if_stale(self, max_age=30, background=False):
+        """Refresh cached data if older than max_age seconds.
+
+        With background=True the refresh runs on a daemon thread and this returns at once.
+        """
         if (time.time() - self.last_update_time) > max_age:
             print("ðŸ”„ Cached quantum data stale â€“ refreshing...")
-            self.update_data()
+            if background:
+                self._refresh_in_background()
+            else:
+                self.update_data()
+
+    def _ranking_backends(self):
+        """Backend dicts for recommendations and predictions
+
+        Cached data is served as is, with a background refresh once it is older than
+        RECOMMENDATION_DATA_MAX_AGE; get_backends() is only called while nothing is cached.
+        """
+        if self._backends_tuple:
+            self.refresh_if_stale(max_age=RECOMMENDATION_DATA_MAX_AGE, background=True)
+            return self._backends_tuple
+        return self.get_backends()
 
 # Initialize quantum manager without credentials - will be set by user input
 app.quantum_manager = None
+# Future of the pending get_manager(token, crn) call submitted by set_token()
+app.quantum_init_future = None
 
-# Store user tokens in session (in production, use proper session management)
+# Tokens for the fallback auth path, keyed on the random sid kept in the signed session
+# cookie (in production, use proper session management)
 user_tokens = {}
 
+def _session_id():
+    """Random per-browser id stored in the signed session cookie, created on first use"""
+    sid = session.get('sid')
+    if sid is None:
+        sid = session['sid'] = secrets.token_hex(16)
+    return sid
+
 # Helper function to get current user's token
 def get_current_user_token():
     """Get the current user's IBM Quantum token"""
@@ -2263,7 +3163,7 @@ def get_current_user_token():
             return get_user_token(user_id)
     else:
         # Fallback to old system
-        session_id = request.remote_addr if hasattr(request, 'remote_addr') else None
+        session_id = session.get('sid')
         if session_id and session_id in user_tokens:
             return user_tokens[session_id]
     return None
@@ -2700,6 +3600,24 @@ def test():
         "timestamp": time.time()
     })
 
+@app.route('/health')
+def health():
+    """Lightweight liveness probe used by the launcher scripts"""
+    return jsonify({"status": "ok"})
+
+def _init_quantum_manager(token, crn):
+    """Create or re-credential the shared manager; runs on _init_pool"""
+    try:
+        quantum_manager = quantum_manager_singleton.get_manager(token, crn)
+    except Exception as e:
+        logger.error("Quantum manager initialization failed: %s", e)
+        raise
+    if quantum_manager:
+        logger.info("Quantum manager ready for real IBM Quantum connection")
+    else:
+        logger.warning("Quantum manager initialized but not connected yet")
+    return quantum_manager
+
 @app.route('/token', methods=['POST'])
 def set_token():
     """Set user's IBM Quantum token"""
@@ -2714,8 +3632,8 @@ def set_token():
         if not token:
             return jsonify({"error": "Token cannot be empty"}), 400
         
-        print(f"ðŸ” Setting token: {token[:20]}...")
-        print(f"ðŸ” CRN: {crn if crn else 'None'}")
+        logger.debug("Setting token: %s...", token[:20])
+        logger.debug("CRN: %s", crn or None)
         
         if WATSONX_AUTH_AVAILABLE:
             # Use new secure token manager
@@ -2734,35 +3652,31 @@ def set_token():
                 session['quantum_token'] = token
                 if crn:
                     session['quantum_crn'] = crn
-                print("✅ Token stored securely with new authentication system")
+                logger.info("Token stored securely with new authentication system")
             else:
                 return jsonify({"error": "Failed to store token securely"}), 500
         else:
             # Fallback to old method
-            session_id = request.remote_addr  # Simple session ID for demo
+            session_id = _session_id()
             user_tokens[session_id] = token
             if crn:
                 user_tokens[f"{session_id}_crn"] = crn
-                print(f"CRN provided: {crn[:50]}...")
+                logger.debug("CRN provided: %s...", crn[:50])
         
         # Initialize quantum manager with user's token and CRN using singleton
         try:
-            print("ðŸ”„ Initializing QuantumBackendManager...")
-            quantum_manager = quantum_manager_singleton.get_manager(token, crn)
+            logger.debug("Initializing QuantumBackendManager...")
+            app.quantum_init_future = _init_pool.submit(_init_quantum_manager, token, crn)
 
             # Also store token in session for new auth system
             if WATSONX_AUTH_AVAILABLE and 'user_id' in session:
                 session['quantum_token'] = token
                 if crn:
                     session['quantum_crn'] = crn
-            if quantum_manager:
-                print(f"âœ… Quantum manager ready for real IBM Quantum connection")
-            else:
-                print("âš ï¸ Quantum manager initialized but not connected yet")
-            print(f"Quantum manager connected for user {session_id}")
+            logger.info("Quantum manager initializing for user %s", session.get('user_id') or session.get('sid'))
             
             # Return immediately - let the frontend handle the connection status
-            # The quantum manager will connect in the background
+            # The quantum manager connects on _init_pool; /status reports progress
             return jsonify({
                 "success": True, 
                 "message": "Quantum manager initialized! Connecting to IBM Quantum...",
@@ -2771,7 +3685,7 @@ def set_token():
             })
                 
         except Exception as e:
-            print(f"âŒ Quantum manager initialization failed: {e}")
+            logger.error("Quantum manager initialization failed: %s", e)
             return jsonify({
                 "success": False,
                 "message": f"Connection failed: {str(e)}",
@@ -2779,7 +3693,7 @@ def set_token():
             }), 500
         
     except Exception as e:
-        print(f"âŒ Error in set_token: {e}")
+        logger.error("Error in set_token: %s", e)
         return jsonify({"error": f"Error setting token: {str(e)}"}), 500
 
 @app.route('/status')
@@ -2806,7 +3720,7 @@ def get_status():
             }), 401
     else:
         # Fallback to basic check
-        session_id = request.remote_addr
+        session_id = _session_id()
         if session_id not in user_tokens:
             return jsonify({
                 "authenticated": False,
@@ -2815,14 +3729,21 @@ def get_status():
             }), 401
     
     has_manager = hasattr(app, 'quantum_manager') and app.quantum_manager is not None
-    is_connected = has_manager and quantum_manager_singleton.is_connected()
+    init_future = app.quantum_init_future
+    initializing = init_future is not None and not init_future.done()
+    init_error = None
+    if init_future is not None and init_future.done() and init_future.exception() is not None:
+        init_error = str(init_future.exception())
+    quantum_manager = quantum_manager_singleton.get_manager()
+    is_connected = has_manager and quantum_manager is not None and getattr(quantum_manager, 'is_connected', False)
     
     # Get quick backend count if connected
     backend_count = 0
+    loading = False
     if is_connected:
         try:
-            quantum_manager = quantum_manager_singleton.get_manager()
-            backend_count = len(quantum_manager.backend_data) if quantum_manager else 0
+            backend_count = getattr(quantum_manager, 'backend_count', 0)
+            loading = not quantum_manager.data_ready.is_set()
         except:
             pass
     
@@ -2830,8 +3751,14 @@ def get_status():
         "authenticated": True,
         "has_quantum_manager": has_manager,
         "is_connected": is_connected,
+        "initializing": initializing,
+        "init_error": init_error,
+        "loading": loading,
         "backend_count": backend_count,
-        "message": "Token is valid" if is_connected else "Connecting to IBM Quantum..."
+        "message": ("Token is valid" if is_connected
+                    else "Initializing quantum manager..." if initializing
+                    else f"Connection failed: {init_error}" if init_error
+                    else "Connecting to IBM Quantum...")
     })
 
 @app.route('/logout')
@@ -2842,9 +3769,7 @@ def logout():
         user_id = session.get('user_id')
         if user_id:
             try:
-                from secure_token_manager import SecureTokenManager
-                manager = SecureTokenManager()
-                manager.delete_token(user_id)
+                delete_user_token(user_id)
             except:
                 pass  # Ignore errors during cleanup
 
@@ -2852,7 +3777,7 @@ def logout():
         session.clear()
     else:
         # Fallback to basic cleanup
-        session_id = request.remote_addr
+        session_id = _session_id()
         if session_id in user_tokens:
             del user_tokens[session_id]
 
@@ -2861,6 +3786,24 @@ def logout():
 
     return redirect('/')
 
+# template name -> rendered HTML bytes, see _static_page()
+_rendered_pages = {}
+
+def _static_page(template, public=True):
+    """Response with a dashboard template rendered once and then served from memory
+
+    The dashboard templates take no variables; url_for() needs a request context, so
+    each page is rendered by its first request rather than at import time.
+    """
+    body = _rendered_pages.get(template)
+    if body is None:
+        body = render_template(template).encode('utf-8')
+        if not app.debug:  # Keep template edits visible while developing
+            _rendered_pages[template] = body
+    response = Response(body, mimetype='text/html')
+    response.headers['Cache-Control'] = f"{'public' if public else 'private'}, max-age={DASHBOARD_PAGE_MAX_AGE}"
+    return response
+
 @app.route('/dashboard')
 def dashboard():
     """Render dashboard if watsonx.ai authenticated"""
@@ -2874,41 +3817,176 @@ def dashboard():
             return redirect('/')
     else:
         # Fallback to basic check
-        session_id = request.remote_addr
+        session_id = _session_id()
         if session_id not in user_tokens:
             return redirect('/')
 
-    return render_template('hackathon_dashboard.html')
-
-@app.route('/advanced')
-def advanced_dashboard():
-    """Render advanced dashboard with 3D visualizations and glossy finish"""
-    # Allow access to view terminal data even without token
-    return render_template('advanced_dashboard.html')
+    return _static_page('hackathon_dashboard.html', public=False)
 
-@app.route('/modern')
-def modern_dashboard():
-    """Render modern dashboard as alternative"""
-    # Allow access to view terminal data even without token
-    return render_template('modern_dashboard.html')
-
-@app.route('/professional')
-def professional_dashboard():
-    """Render professional dashboard with widget customization"""
-    # Allow access to view terminal data even without token
-    return render_template('professional_dashboard.html')
-
-@app.route('/hackathon')
-def hackathon_dashboard():
-    """Render award-winning hackathon dashboard for Team Quantum Spark"""
-    # Allow access to view terminal data even without token
-    return render_template('hackathon_dashboard.html')
+# Dashboards open to everyone, to view terminal data even without a token:
+# path -> (endpoint, template). All share one view, _static_page().
+_PUBLIC_DASHBOARDS = {
+    '/advanced': ('advanced_dashboard', 'advanced_dashboard.html'),  # 3D visualizations and glossy finish
+    '/modern': ('modern_dashboard', 'modern_dashboard.html'),
+    '/professional': ('professional_dashboard', 'professional_dashboard.html'),  # Widget customization
+    '/hackathon': ('hackathon_dashboard', 'hackathon_dashboard.html'),  # Team Quantum Spark
+}
+for _path, (_endpoint, _template) in _PUBLIC_DASHBOARDS.items():
+    app.add_url_rule(_path, endpoint=_endpoint, view_func=partial(_static_page, _template))
 
 @app.route('/offline_status')
 def offline_status():
     """Render offline status and management dashboard"""
     return render_template('offline_status.html')
 
+# Demo backends served when there is no IBM Quantum data. These are the fixed values;
+# _build_demo_backends(dynamic=True) derives the time-varying queues and statuses from them
+_STATIC_BACKENDS = (
+    # FREE TIER BACKENDS (Open Plan - 10 minutes/month)
+    MappingProxyType({
+        "name": "ibm_belem",
+        "status": "active",
+        "pending_jobs": 2,
+        "operational": True,
+        "num_qubits": 5,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "low",
+        "tier": "free",
+        "plan": "Open Plan",
+        "pricing": "Free (10 min/month)",
+        "description": "5-qubit system for learning and exploration"
+    }),
+    MappingProxyType({
+        "name": "ibm_lagos",
+        "status": "active",
+        "pending_jobs": 1,
+        "operational": True,
+        "num_qubits": 7,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "low",
+        "tier": "free",
+        "plan": "Open Plan",
+        "pricing": "Free (10 min/month)",
+        "description": "7-qubit system for educational purposes"
+    }),
+    MappingProxyType({
+        "name": "ibm_quito",
+        "status": "active",
+        "pending_jobs": 3,
+        "operational": True,
+        "num_qubits": 5,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "moderate",
+        "tier": "free",
+        "plan": "Open Plan",
+        "pricing": "Free (10 min/month)",
+        "description": "5-qubit system for quantum algorithm testing"
+    }),
+    MappingProxyType({
+        "name": "ibmq_qasm_simulator",
+        "status": "active",
+        "pending_jobs": 0,
+        "operational": True,
+        "num_qubits": 32,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "immediate",
+        "tier": "free",
+        "plan": "Open Plan",
+        "pricing": "Free (unlimited)",
+        "description": "Quantum simulator for algorithm development"
+    }),
+    # PAID TIER BACKENDS (Premium Plans)
+    MappingProxyType({
+        "name": "ibm_oslo",
+        "status": "active",
+        "pending_jobs": 5,
+        "operational": True,
+        "num_qubits": 27,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "moderate",
+        "tier": "paid",
+        "plan": "Pay-As-You-Go",
+        "pricing": "â‚¹8,000/minute",
+        "description": "27-qubit system for research projects"
+    }),
+    MappingProxyType({
+        "name": "ibm_brisbane",
+        "status": "active",
+        "pending_jobs": 3,
+        "operational": True,
+        "num_qubits": 127,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "stable",
+        "tier": "paid",
+        "plan": "Premium Plan",
+        "pricing": "â‚¹4,000/minute",
+        "description": "127-qubit utility-scale quantum computer"
+    }),
+    MappingProxyType({
+        "name": "ibm_pittsburgh",
+        "status": "active",
+        "pending_jobs": 1,
+        "operational": True,
+        "num_qubits": 133,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "stable",
+        "tier": "paid",
+        "plan": "Premium Plan",
+        "pricing": "â‚¹4,000/minute",
+        "description": "133-qubit high-performance quantum system"
+    }),
+    MappingProxyType({
+        "name": "ibm_sherbrooke",
+        "status": "active",
+        "pending_jobs": 8,
+        "operational": True,
+        "num_qubits": 1000,
+        "visualization": None,
+        "real_data": False,
+        "queue_trend": "high",
+        "tier": "paid",
+        "plan": "Premium Plan",
+        "pricing": "â‚¹4,000/minute",
+        "description": "1000+ qubit next-generation quantum system"
+    })
+)
+
+# The fixed list never changes, so it is serialized once
+_DEMO_STATIC_BYTES = _json_body([dict(b) for b in _STATIC_BACKENDS])
+
+# (base, period) of each demo backend's pending_jobs swing, in _STATIC_BACKENDS order
+_DEMO_QUEUE_SWING = ((2, 5), (1, 3), (3, 4), (0, 1), (5, 8), (2000, 500), (300, 200), (8, 12))
+_DEMO_STATUSES = ("active", "maintenance", "busy")
+
+@lru_cache(maxsize=1)
+def _dynamic_demo_backends(base_time):
+    """Demo backends for one 10-second bucket; built by the first request in the bucket"""
+    last_updated = base_time * 10
+    backends = [{**b, "pending_jobs": base + base_time % period, "last_updated": last_updated}
+                for b, (base, period) in zip(_STATIC_BACKENDS, _DEMO_QUEUE_SWING)]
+    # ibm_brisbane and ibm_pittsburgh also cycle through statuses
+    for i, offset, trends in ((5, 0, ("increasing", "decreasing")), (6, 1, ("stable", "fluctuating", "fluctuating"))):
+        status = _DEMO_STATUSES[(base_time + offset) % 3]
+        backends[i].update(status=status, operational=status != "maintenance",
+                           queue_trend=trends[base_time % len(trends)])
+    return tuple(backends)
+
+def _build_demo_backends(dynamic):
+    """Demo backend list; with dynamic, queues and statuses change every 10 seconds
+
+    The dynamic list is shared between requests in the same bucket and must not be modified.
+    """
+    if not dynamic:
+        return [dict(b) for b in _STATIC_BACKENDS]
+    return _dynamic_demo_backends(int(time.time() // 10))
+
 @app.route('/api/backends')
 def api_get_backends():
     """API endpoint to get backend data - prioritize real data from terminal"""
@@ -2917,281 +3995,63 @@ def api_get_backends():
 @app.route('/backends')
 def get_backends():
     """Endpoint to get backend data - prioritize real data from terminal"""
+    # Look the manager up once per request
+    quantum_manager = quantum_manager_singleton.get_manager()
+    connected = quantum_manager is not None and getattr(quantum_manager, 'is_connected', False)
+
     # First check if we have real backend data from quantum manager (from terminal)
-    if quantum_manager_singleton.is_connected():
-        print("âœ… Using real backend data from terminal/quantum manager")
+    if connected:
+        logger.debug("Using real backend data from terminal/quantum manager")
         try:
-            quantum_manager = quantum_manager_singleton.get_manager()
             if quantum_manager:
                 # Access the stored backend_data directly (this contains real terminal data)
                 if hasattr(quantum_manager, 'backend_data') and quantum_manager.backend_data:
-                    print(f"ðŸ“Š Found {len(quantum_manager.backend_data)} real backends in terminal data")
-                    return jsonify(quantum_manager.backend_data)
+                    logger.debug("Found %d real backends in terminal data", len(quantum_manager.backend_data))
+                    return _cached_json(('backends', connected, quantum_manager.last_update_time),
+                                        lambda: quantum_manager.backend_data,
+                                        redis_key=_response_redis_key(
+                                            'api:backends', _credential_key(quantum_manager.token, quantum_manager.crn)),
+                                        updated_at=quantum_manager.last_update_time)
 
                 # Also try to get fresh data from provider
                 if hasattr(quantum_manager, 'provider') and quantum_manager.provider:
                     if hasattr(quantum_manager.provider, 'backends'):
                         backends = quantum_manager.provider.backends()
                         real_backends = []
-                        print(f"ðŸ“¡ Fetching {len(backends)} backends from provider...")
+                        logger.debug("Fetching %d backends from provider...", len(backends))
                         for backend in backends:
-                            backend_info = {
-                                "name": getattr(backend, 'name', 'Unknown'),
-                                "status": "active",
-                                "pending_jobs": 0,
-                                "operational": True,
-                                "num_qubits": getattr(backend, 'num_qubits', 0) if hasattr(backend, 'num_qubits') else 0,
-                                "visualization": None,
-                                "real_data": True
-                            }
+                            # Read the configuration once; properties on the backend object may each go to the server
+                            try:
+                                cfg = backend.configuration()
+                            except Exception:
+                                cfg = None
+                            backend_info = BackendSummary(
+                                name=getattr(cfg, 'backend_name', None) or getattr(backend, 'name', 'Unknown'),
+                                num_qubits=getattr(cfg, 'n_qubits', None) or getattr(backend, 'num_qubits', 0),
+                            )
                             real_backends.append(backend_info)
                         if real_backends:
-                            print(f"ðŸ“Š Returning {len(real_backends)} real backends to dashboard")
-                            return jsonify(real_backends)
+                            logger.debug("Returning %d real backends to dashboard", len(real_backends))
+                            return ojsonify(real_backends)
         except Exception as e:
-            print(f"âš ï¸ Error getting real backend data: {e}")
-            import traceback
-            print(f"Full error: {traceback.format_exc()}")
+            logger.warning("Error getting real backend data: %s", e)
+            logger.debug("Full error", exc_info=True)
     
     # Provide dynamic demo data when no real connection available
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
-        print("ðŸ“Š Initializing quantum visualization data...")
-        
-        # Generate dynamic values that change over time - MORE DRAMATIC CHANGES
-        current_time = time.time()
-        base_time = int(current_time / 10)  # Change every 10 seconds for more visible changes
-        
-        # Dynamic queue values that fluctuate more dramatically
-        brisbane_queue = 2000 + (base_time % 500)  # 2000-2500 range - BIG CHANGES
-        torino_queue = 300 + (base_time % 200)     # 300-500 range - BIG CHANGES
-        manila_queue = (base_time % 50)            # 0-50 range - BIG CHANGES
-        cairo_queue = 20 + (base_time % 100)       # 20-120 range - BIG CHANGES
-        
-        # Dynamic status changes
-        statuses = ["active", "maintenance", "busy"]
-        brisbane_status = statuses[base_time % 3]
-        torino_status = statuses[(base_time + 1) % 3]
-        manila_status = statuses[(base_time + 2) % 3]
-        cairo_status = statuses[(base_time + 3) % 3]
+        logger.debug("Initializing quantum visualization data...")
         
-        return jsonify([
-            # FREE TIER BACKENDS (Open Plan - 10 minutes/month)
-            {
-                "name": "ibm_belem",
-                "status": "active",
-                "pending_jobs": max(0, 2 + (base_time % 5)),
-                "operational": True,
-                "num_qubits": 5,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "low",
-                "tier": "free",
-                "plan": "Open Plan",
-                "pricing": "Free (10 min/month)",
-                "description": "5-qubit system for learning and exploration"
-            },
-            {
-                "name": "ibm_lagos",
-                "status": "active",
-                "pending_jobs": max(0, 1 + (base_time % 3)),
-                "operational": True,
-                "num_qubits": 7,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "low",
-                "tier": "free",
-                "plan": "Open Plan",
-                "pricing": "Free (10 min/month)",
-                "description": "7-qubit system for educational purposes"
-            },
-            {
-                "name": "ibm_quito",
-                "status": "active",
-                "pending_jobs": max(0, 3 + (base_time % 4)),
-                "operational": True,
-                "num_qubits": 5,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "moderate",
-                "tier": "free",
-                "plan": "Open Plan",
-                "pricing": "Free (10 min/month)",
-                "description": "5-qubit system for quantum algorithm testing"
-            },
-            {
-                "name": "ibmq_qasm_simulator",
-                "status": "active",
-                "pending_jobs": 0,
-                "operational": True,
-                "num_qubits": 32,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "immediate",
-                "tier": "free",
-                "plan": "Open Plan",
-                "pricing": "Free (unlimited)",
-                "description": "Quantum simulator for algorithm development"
-            },
-            
-            # PAID TIER BACKENDS (Premium Plans)
-            {
-                "name": "ibm_oslo",
-                "status": "active",
-                "pending_jobs": max(0, 5 + (base_time % 8)),
-                "operational": True,
-                "num_qubits": 27,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "moderate",
-                "tier": "paid",
-                "plan": "Pay-As-You-Go",
-                "pricing": "â‚¹8,000/minute",
-                "description": "27-qubit system for research projects"
-            },
-            {
-                "name": "ibm_brisbane",
-                "status": brisbane_status,
-                "pending_jobs": max(0, brisbane_queue),
-                "operational": brisbane_status != "maintenance",
-                "num_qubits": 127,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "increasing" if (base_time % 2) == 0 else "decreasing",
-                "tier": "paid",
-                "plan": "Premium Plan",
-                "pricing": "â‚¹4,000/minute",
-                "description": "127-qubit utility-scale quantum computer"
-            },
-            {
-                "name": "ibm_pittsburgh", 
-                "status": torino_status,
-                "pending_jobs": max(0, torino_queue),
-                "operational": torino_status != "maintenance",
-                "num_qubits": 133,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "stable" if (base_time % 3) == 0 else "fluctuating",
-                "tier": "paid",
-                "plan": "Premium Plan",
-                "pricing": "â‚¹4,000/minute",
-                "description": "133-qubit high-performance quantum system"
-            },
-            {
-                "name": "ibm_sherbrooke",
-                "status": "active",
-                "pending_jobs": max(0, 8 + (base_time % 12)),
-                "operational": True,
-                "num_qubits": 1000,
-                "visualization": None,
-                "real_data": False,
-                "last_updated": current_time,
-                "queue_trend": "high",
-                "tier": "paid",
-                "plan": "Premium Plan",
-                "pricing": "â‚¹4,000/minute",
-                "description": "1000+ qubit next-generation quantum system"
-            }
-        ])
+        return jsonify(_build_demo_backends(dynamic=True))
     
     # Get real backend data from IBM Quantum, with fallback data
-    if not quantum_manager_singleton.is_connected():
+    if not connected:
                 # Provide sample backend data when not connected to IBM Quantum
-                print("ðŸ“Š Loading backend configuration data...")
-                sample_backends = [
-                    # FREE TIER
-                    {
-                        "name": "ibm_belem",
-                        "status": "active",
-                        "pending_jobs": 2,
-                        "operational": True,
-                        "num_qubits": 5,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "free",
-                        "plan": "Open Plan",
-                        "pricing": "Free (10 min/month)",
-                        "description": "5-qubit system for learning"
-                    },
-                    {
-                        "name": "ibm_lagos",
-                        "status": "active",
-                        "pending_jobs": 1,
-                        "operational": True,
-                        "num_qubits": 7,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "free",
-                        "plan": "Open Plan",
-                        "pricing": "Free (10 min/month)",
-                        "description": "7-qubit educational system"
-                    },
-                    {
-                        "name": "ibmq_qasm_simulator",
-                        "status": "active",
-                        "pending_jobs": 0,
-                        "operational": True,
-                        "num_qubits": 32,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "free",
-                        "plan": "Open Plan",
-                        "pricing": "Free (unlimited)",
-                        "description": "Quantum simulator"
-                    },
-                    # PAID TIER
-                    {
-                        "name": "ibm_brisbane",
-                        "status": "active",
-                        "pending_jobs": 3,
-                        "operational": True,
-                        "num_qubits": 127,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "paid",
-                        "plan": "Premium Plan",
-                        "pricing": "â‚¹4,000/minute",
-                        "description": "127-qubit utility-scale system"
-                    },
-                    {
-                        "name": "ibm_pittsburgh",
-                        "status": "active",
-                        "pending_jobs": 1,
-                        "operational": True,
-                        "num_qubits": 133,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "paid",
-                        "plan": "Premium Plan",
-                        "pricing": "â‚¹4,000/minute",
-                        "description": "133-qubit high-performance system"
-                    },
-                    {
-                        "name": "ibm_sherbrooke",
-                        "status": "active",
-                        "pending_jobs": 8,
-                        "operational": True,
-                        "num_qubits": 1000,
-                        "visualization": None,
-                        "real_data": False,
-                        "tier": "paid",
-                        "plan": "Premium Plan",
-                        "pricing": "â‚¹4,000/minute",
-                        "description": "1000+ qubit next-gen system"
-                    }
-                ]
-                return jsonify(sample_backends)
+                logger.debug("Loading backend configuration data...")
+                return Response(_DEMO_STATIC_BYTES, mimetype='application/json')
 
     # Get real backends from quantum manager singleton
     try:
-        quantum_manager = quantum_manager_singleton.get_manager()
         if quantum_manager:
             backend_data = quantum_manager.get_backends()
         if not backend_data:
@@ -3221,42 +4081,41 @@ def get_backends():
     for backend in backend_data:
         try:
             # Create visualization of quantum encoding
-            quantum_manager = quantum_manager_singleton.get_manager()
             if quantum_manager:
                 visualization = quantum_manager.create_quantum_visualization(backend)
             else:
                 visualization = None
         except Exception as e:
             visualization = None
-            print(f"Error creating quantum visualization: {e}")
+            logger.warning("Error creating quantum visualization: %s", e)
             # Don't let visualization errors break the backend response
             
         # The backend data is already processed, so we can access it directly
-        response_data.append({
-            "name": backend.get("name", "Unknown"),
-            "status": "active",  # Set to active since we can access it
-            "pending_jobs": backend.get("pending_jobs", 0),
-            "operational": backend.get("operational", True),
-            "num_qubits": backend.get("num_qubits", 5),
-            "visualization": visualization,
-            "real_data": backend.get("real_data", True)
-        })
+        response_data.append(BackendSummary(
+            name=backend.get("name", "Unknown"),
+            status="active",  # Set to active since we can access it
+            pending_jobs=backend.get("pending_jobs", 0),
+            operational=backend.get("operational", True),
+            num_qubits=backend.get("num_qubits", 5),
+            visualization=visualization,
+            visualization_format=HISTOGRAM_IMAGE_FORMAT,
+            real_data=backend.get("real_data", True)
+        ))
     
     # Ensure cached data is fresh
     try:
-        quantum_manager = quantum_manager_singleton.get_manager()
         if quantum_manager:
             quantum_manager.refresh_if_stale(max_age=20)
     except Exception as e:
-        print(f"Auto refresh failed in /backends: {e}")
+        logger.warning("Auto refresh failed in /backends: %s", e)
     
-    return jsonify(response_data)
+    return _stream_json_list(response_data)
 
 @app.route('/debug_quantum_manager')
 def debug_quantum_manager():
     """Debug endpoint to see what data is in the quantum manager"""
     debug_info = {
-        "is_connected": quantum_manager_singleton.is_connected(),
+        "is_connected": quantum_manager_singleton.is_manager_connected(),
         "manager_exists": quantum_manager_singleton._manager is not None,
         "backend_data": [],
         "job_data": [],
@@ -3265,7 +4124,7 @@ def debug_quantum_manager():
     }
     
     try:
-        if quantum_manager_singleton.is_connected():
+        if quantum_manager_singleton.is_manager_connected():
             manager = quantum_manager_singleton.get_manager()
             if manager:
                 debug_info["backend_data"] = getattr(manager, 'backend_data', [])
@@ -3275,7 +4134,7 @@ def debug_quantum_manager():
     except Exception as e:
         debug_info["errors"].append(str(e))
     
-    return jsonify(debug_info)
+    return ojsonify(debug_info)
 
 @app.route('/api/jobs')
 def api_get_jobs():
@@ -3285,48 +4144,40 @@ def api_get_jobs():
 @app.route('/jobs')
 def get_jobs():
     """Endpoint to get job data - prioritize real data from terminal"""
+    quantum_manager = quantum_manager_singleton.get_manager()
+    connected = quantum_manager is not None and getattr(quantum_manager, 'is_connected', False)
+
     # First check if we have real job data from quantum manager (from terminal)
-    if quantum_manager_singleton.is_connected():
-        print("âœ… Using real job data from terminal/quantum manager")
+    if connected:
+        logger.debug("Using real job data from terminal/quantum manager")
         try:
-            quantum_manager = quantum_manager_singleton.get_manager()
+            offset = request.args.get('offset', type=int)
+            if quantum_manager and offset:
+                # Later pages come from the runtime service, usually already prefetched
+                limit = request.args.get('limit', JOBS_PAGE_SIZE, type=int)
+                return _stream_json_list(quantum_manager.get_jobs_page(offset, limit))
             if quantum_manager:
                 # Access the stored job_data directly (this contains real terminal data)
                 if hasattr(quantum_manager, 'job_data') and quantum_manager.job_data:
-                    print(f"ðŸ“Š Found {len(quantum_manager.job_data)} real jobs in terminal data")
-                    return jsonify(quantum_manager.job_data)
+                    logger.debug("Found %d real jobs in terminal data", len(quantum_manager.job_data))
+                    return _cached_json(('jobs', connected, quantum_manager.last_update_time),
+                                        lambda: quantum_manager.job_data,
+                                        redis_key=_response_redis_key(
+                                            'api:jobs', _credential_key(quantum_manager.token, quantum_manager.crn)),
+                                        updated_at=quantum_manager.last_update_time)
                 
                 # Also try to get fresh data from provider
                 if hasattr(quantum_manager, 'provider') and quantum_manager.provider:
                     if hasattr(quantum_manager.provider, 'jobs'):
-                        print("ðŸ“¡ Fetching jobs from provider...")
+                        logger.debug("Fetching jobs from provider...")
                         jobs = quantum_manager.provider.jobs(limit=10)
                         real_jobs = []
                         for job in jobs:
                             try:
-                                # Extract job information more carefully
-                                job_id = str(job) if hasattr(job, '__str__') else f"JOB_{int(time.time())}"
-                                if hasattr(job, 'job_id'):
-                                    if callable(job.job_id):
-                                        job_id = job.job_id()
-                                    else:
-                                        job_id = job.job_id
-                                
-                                backend_name = "unknown"
-                                if hasattr(job, 'backend'):
-                                    if callable(job.backend):
-                                        backend_obj = job.backend()
-                                        backend_name = getattr(backend_obj, 'name', 'unknown')
-                                    else:
-                                        backend_name = str(job.backend)
-                                
-                                status = "unknown"
-                                if hasattr(job, 'status'):
-                                    if callable(job.status):
-                                        status_obj = job.status()
-                                        status = str(status_obj)
-                                    else:
-                                        status = str(job.status)
+                                summarize = _job_summarizers.get(type(job))
+                                if summarize is None:
+                                    summarize = _job_summarizers[type(job)] = _build_job_summarizer(job)
+                                job_id, backend_name, status = summarize(job)
                                 
                                 real_jobs.append({
                                     "id": job_id,
@@ -3337,19 +4188,18 @@ def get_jobs():
                                     "real_data": True
                                 })
                             except Exception as job_err:
-                                print(f"âš ï¸ Error processing job {job}: {job_err}")
+                                logger.warning("Error processing job %s: %s", job, job_err)
                                 continue
                         
                         if real_jobs:
-                            print(f"ðŸ“Š Returning {len(real_jobs)} real jobs to dashboard")
-                            return jsonify(real_jobs)
+                            logger.debug("Returning %d real jobs to dashboard", len(real_jobs))
+                            return ojsonify(real_jobs)
         except Exception as e:
-            print(f"âš ï¸ Error getting real job data: {e}")
-            import traceback
-            print(f"Full error: {traceback.format_exc()}")
+            logger.warning("Error getting real job data: %s", e)
+            logger.debug("Full error", exc_info=True)
     
     # Only return real data - no fake data when not connected
-    print("📊 No IBM Quantum connection - returning empty job list")
+    logger.debug("No IBM Quantum connection - returning empty job list")
     return jsonify([])
 
 @app.route('/api/job_results')
@@ -3500,7 +4350,7 @@ def get_job_results():
                             continue
 
                     print(f"📊 Returning {len(job_results)} job results")
-                    return jsonify(job_results)
+                    return _stream_json_list(job_results)
 
                 except Exception as e:
                     print(f"❌ Error fetching jobs from provider: {e}")
@@ -3546,7 +4396,7 @@ def get_specific_job_result(job_id):
             
             if result_data:
                 print(f"🚀 Returning job result for {job_id}")
-                return jsonify(result_data)
+                return ojsonify(result_data)
             else:
                 print(f"❌ No result found for job {job_id}")
                 return jsonify({
@@ -3763,7 +4613,7 @@ def get_external_job_results():
 def get_calibration_data():
     """API endpoint to get current backend calibration status"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -3774,7 +4624,7 @@ def get_calibration_data():
 
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum. No fallback data available.",
@@ -3897,7 +4747,7 @@ def get_calibration_data():
                 calibration_data["system_health"]["overall_status"] = "unknown"
 
             print(f"âœ… Retrieved calibration data for {len(calibration_data['backend_calibrations'])} backends")
-            return jsonify(calibration_data)
+            return ojsonify(calibration_data)
 
         except Exception as e:
             print(f"Error fetching calibration data: {e}")
@@ -3934,7 +4784,7 @@ def get_calibration_data():
 def get_historical_data():
     """API endpoint to get historical job performance and trends"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -3945,7 +4795,7 @@ def get_historical_data():
 
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum. No fallback data available.",
@@ -4143,7 +4993,7 @@ def get_historical_data():
 def get_circuit_details():
     """API endpoint to get detailed circuit information including gates, qubit mapping, and transpilation"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -4154,7 +5004,7 @@ def get_circuit_details():
 
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             # Provide sample circuit details when not connected to IBM Quantum
             print("ðŸ“Š Loading circuit configuration data...")
             sample_details = [
@@ -4351,7 +5201,7 @@ def get_circuit_details():
 def get_realtime_monitoring():
     """API endpoint to get real-time monitoring data with queue positions and estimated times"""
     # Check if user has provided a token - provide sample data if not
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         print("ðŸ“Š Initializing real-time quantum metrics...")
         return jsonify({
@@ -4368,7 +5218,7 @@ def get_realtime_monitoring():
 
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum. No fallback data available.",
@@ -4478,7 +5328,7 @@ def get_realtime_monitoring():
                 realtime_data["system_status"]["average_queue_time"] = sum(queue_times) / len(queue_times)
 
             print(f"âœ… Retrieved real-time monitoring data for {len(realtime_data['queue_status'])} backends")
-            return jsonify(realtime_data)
+            return ojsonify(realtime_data)
 
         except Exception as e:
             print(f"Error fetching real-time monitoring data: {e}")
@@ -4514,7 +5364,7 @@ def get_realtime_monitoring():
 def get_performance_metrics():
     """API endpoint to get comprehensive performance metrics"""
     # Check if user has provided a token - provide sample data if not
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         print("ðŸ“Š Initializing quantum performance metrics...")
         return jsonify({
@@ -4528,7 +5378,7 @@ def get_performance_metrics():
 
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum. No fallback data available.",
@@ -4709,7 +5559,7 @@ def get_performance_metrics():
 def get_dashboard_metrics():
     """API endpoint to get real dashboard metrics for the top row"""
     # Provide demo metrics when no real connection available
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         print("ðŸ“Š Initializing quantum dashboard metrics...")
         return jsonify({
@@ -4725,7 +5575,7 @@ def get_dashboard_metrics():
     
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             if not IBM_PACKAGES_AVAILABLE:
                 # Provide sample metrics when IBM packages are not available
                 sample_metrics = {
@@ -4809,7 +5659,7 @@ def get_dashboard_metrics():
 def get_dashboard_state():
     """API endpoint to get dashboard state - prioritize real data from terminal"""
     # First check if we have real data from quantum manager (from terminal)
-    if quantum_manager_singleton.is_connected():
+    if quantum_manager_singleton.is_manager_connected():
         print("âœ… Using real dashboard state from terminal/quantum manager")
         try:
             quantum_manager = quantum_manager_singleton.get_manager()
@@ -4832,7 +5682,7 @@ def get_dashboard_state():
                 # Count real jobs from stored data
                 if hasattr(quantum_manager, 'job_data') and quantum_manager.job_data:
                     total_jobs = len(quantum_manager.job_data)
-                    running_jobs = len([j for j in quantum_manager.job_data if j.get('status', '').lower() in ['running', 'queued']])
+                    running_jobs = int(np.isin(quantum_manager.job_columns['status'], ('running', 'queued')).sum())
                     print(f"ðŸ“Š Found {total_jobs} jobs in stored data, {running_jobs} running/queued")
                 elif hasattr(quantum_manager, 'provider') and quantum_manager.provider:
                     if hasattr(quantum_manager.provider, 'jobs'):
@@ -4855,12 +5705,12 @@ def get_dashboard_state():
                     "real_data": True
                 }
                 print(f"ðŸ“Š Dashboard state: {active_backends} backends, {total_jobs} jobs")
-                return jsonify(dashboard_state)
+                return ojsonify(dashboard_state)
         except Exception as e:
             print(f"âš ï¸ Error getting real dashboard state: {e}")
     
     # Provide demo state when no real connection available
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         print("ðŸ“Š Initializing quantum dashboard state...")
         return jsonify({
@@ -4879,7 +5729,7 @@ def get_dashboard_state():
     
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
@@ -4989,7 +5839,7 @@ def get_dashboard_state():
 @app.route('/api/notifications')
 def notifications():
     """Server-Sent Events endpoint for real-time notifications"""
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return Response("Unauthorized", status=401)
     
@@ -5033,7 +5883,7 @@ def notifications():
 @app.route('/api/quantum_state_data')
 def get_quantum_state_data():
     """API endpoint to get quantum state data"""
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5043,7 +5893,7 @@ def get_quantum_state_data():
     
     try:
         # Check if we have a valid connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum. No fallback data available.",
@@ -5150,7 +6000,7 @@ def get_quantum_state_data():
 def get_circuit_data():
     """API endpoint for real quantum circuit data from IBM Quantum"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5159,7 +6009,7 @@ def get_circuit_data():
     
     try:
         # Check if we have a quantum manager with real connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
@@ -5274,7 +6124,7 @@ def get_circuit_data():
 def apply_quantum_gate():
     """Apply a quantum gate to the current state"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5327,7 +6177,7 @@ def apply_quantum_gate():
 def get_quantum_visualization_data():
     """Get real quantum visualization data from IBM Quantum"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5498,7 +6348,7 @@ def get_quantum_visualization_data():
 def get_real_features_summary():
     """API endpoint that provides a summary of all real quantum features implemented"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5507,7 +6357,7 @@ def get_real_features_summary():
     
     try:
         # Check if we have a quantum manager with real connection
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please check your API token and network connection"
@@ -5640,7 +6490,7 @@ def initialize_quantum_manager():
 def get_results():
     """Get measurement results data"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5648,7 +6498,7 @@ def get_results():
         }), 401
     
     try:
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum"
@@ -5665,7 +6515,7 @@ def get_results():
 def get_performance():
     """Get performance metrics data"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5673,7 +6523,7 @@ def get_performance():
         }), 401
     
     try:
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum"
@@ -5690,7 +6540,7 @@ def get_performance():
 def get_recommendations():
     """Return ranked backend recommendations based on algorithm and constraints."""
     # Auth check
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5699,7 +6549,7 @@ def get_recommendations():
             "real_data": False
         }), 401
 
-    if not quantum_manager_singleton.is_connected():
+    if not quantum_manager_singleton.is_manager_connected():
         return jsonify({"error": "Quantum manager not initialized"}), 503
 
     try:
@@ -5769,7 +6619,7 @@ def get_recommendations():
 def get_backend_predictions_api():
     """Return prediction metrics for available backends."""
     # Auth check
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -5778,7 +6628,7 @@ def get_backend_predictions_api():
             "real_data": False
         }), 401
 
-    if not quantum_manager_singleton.is_connected():
+    if not quantum_manager_singleton.is_manager_connected():
         return jsonify({"error": "Quantum manager not initialized"}), 503
 
     try:
@@ -5820,7 +6670,7 @@ def get_backend_predictions_api():
 def get_backend_comparison():
     """Return detailed backend comparison with sophisticated realistic predictions."""
     # Auth check
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -6523,7 +7373,7 @@ def _format_time(seconds):
 def get_quantum_state():
     """Get current quantum state data"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "error": "Authentication required",
@@ -6531,7 +7381,7 @@ def get_quantum_state():
         }), 401
     
     try:
-        if not quantum_manager_singleton.is_connected():
+        if not quantum_manager_singleton.is_manager_connected():
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum"
@@ -6548,7 +7398,7 @@ def get_quantum_state():
 def get_quantum_circuit():
     """API endpoint to get quantum circuit data for visualization"""
     # Check if user has provided a token
-    session_id = request.remote_addr
+    session_id = _session_id()
     if session_id not in user_tokens:
         return jsonify({
             "success": False,
@@ -6808,7 +7658,7 @@ def periodic_data_storage():
             time.sleep(900)
             
             # Get current data and store it
-            if quantum_manager_singleton.is_connected():
+            if quantum_manager_singleton.is_manager_connected():
                 quantum_manager = quantum_manager_singleton.get_manager()
                 if quantum_manager:
                     # Store current metrics
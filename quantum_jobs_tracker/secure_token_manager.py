@@ -15,6 +15,50 @@ import keyring
 from flask import session, current_app
 import redis
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson works on bytes directly, which is what Fernet consumes and produces
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(data):
+        return json.dumps(data).encode()
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Wall clock for persisted timestamps; the in-process cache uses time.monotonic
+_now = time.time
+
+# Seconds a decrypted token stays in the in-process cache
+TOKEN_CACHE_TTL = 30
+
+# Plaintext format marker for msgpack payloads. JSON payloads always start
+# with '{', so blobs written before msgpack was introduced still decode.
+_MSGPACK_MARKER = b'\x02'
+
+def _pack_payload(data):
+    """Serialize a token payload to bytes (msgpack if available, else JSON)"""
+    if msgpack is not None:
+        return _MSGPACK_MARKER + msgpack.packb(data, use_bin_type=True)
+    return _json_dumps(data)
+
+def _unpack_payload(payload):
+    """Deserialize a token payload produced by _pack_payload"""
+    if payload[:1] == _MSGPACK_MARKER:
+        if msgpack is None:
+            raise ValueError("Token payload is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(payload[1:], raw=False)
+    return _json_loads(payload)
 
 class SecureTokenManager:
     """Manages secure storage and retrieval of IBM Quantum tokens"""
@@ -23,10 +67,19 @@ class SecureTokenManager:
         self.use_keyring = use_keyring and self._keyring_available()
         self.use_redis = use_redis
         self.redis_client = None
+        self._redis_key = "quantum_token:{}".format
+        self._token_cache = {}  # user_id -> (monotonic expiry, storage_data)
 
         if use_redis:
             try:
-                self.redis_client = redis.from_url(redis_url or os.getenv('REDIS_URL', 'redis://localhost:6379'))
+                # Pool sized for batched lookups; bytes are stored as-is so responses stay undecoded
+                self.redis_client = redis.from_url(
+                    redis_url or os.getenv('REDIS_URL', 'redis://localhost:6379'),
+                    max_connections=32,
+                    socket_keepalive=True,
+                    health_check_interval=30,
+                    decode_responses=False
+                )
             except Exception as e:
                 print(f"Redis connection failed: {e}")
                 self.use_redis = False
@@ -34,6 +87,11 @@ class SecureTokenManager:
         # Generate or load encryption key
         self.encryption_key = self._get_encryption_key()
 
+        # Build the cipher once and bind specialised encrypt/decrypt closures,
+        # so hot paths avoid re-creating Fernet and repeated attribute lookups
+        self._fernet = Fernet(self.encryption_key)
+        self._encrypt_data, self._decrypt_data = self._make_codec(self._fernet)
+
     def _keyring_available(self):
         """Check if keyring is available"""
         try:
@@ -72,17 +130,23 @@ class SecureTokenManager:
 
             return key
 
-    def _encrypt_data(self, data):
-        """Encrypt data using Fernet"""
-        f = Fernet(self.encryption_key)
-        json_data = json.dumps(data)
-        return f.encrypt(json_data.encode()).decode()
+    @staticmethod
+    def _make_codec(fernet):
+        """Return (encrypt, decrypt) closures bound to a Fernet instance"""
+        encrypt = fernet.encrypt
+        decrypt = fernet.decrypt
+
+        def _encrypt_data(data, encrypt=encrypt, pack=_pack_payload):
+            """Encrypt data using Fernet, returning the raw token bytes"""
+            return encrypt(pack(data))
+
+        def _decrypt_data(encrypted_data, decrypt=decrypt, unpack=_unpack_payload):
+            """Decrypt data using Fernet (accepts bytes or str)"""
+            if isinstance(encrypted_data, str):
+                encrypted_data = encrypted_data.encode()
+            return unpack(decrypt(encrypted_data))
 
-    def _decrypt_data(self, encrypted_data):
-        """Decrypt data using Fernet"""
-        f = Fernet(self.encryption_key)
-        decrypted = f.decrypt(encrypted_data.encode())
-        return json.loads(decrypted.decode())
+        return _encrypt_data, _decrypt_data
 
     def store_token(self, user_id, token_data, method='api_token'):
         """
@@ -96,7 +160,7 @@ class SecureTokenManager:
         storage_data = {
             'token_data': token_data,
             'method': method,
-            'timestamp': int(time.time()),
+            'timestamp': int(_now()),
             'user_id': user_id
         }
 
@@ -110,16 +174,25 @@ class SecureTokenManager:
         else:
             self._store_file(user_id, encrypted_data)
 
-    def retrieve_token(self, user_id):
+        self._token_cache[user_id] = (time.monotonic() + TOKEN_CACHE_TTL, storage_data)
+
+    def retrieve_token(self, user_id, use_cache=True):
         """
         Retrieve token data securely
 
         Args:
             user_id: Unique user identifier
+            use_cache: Serve from the in-process cache when fresh; pass False where a
+                delete made by logout or by another worker must be seen at once
 
         Returns:
             Token data dictionary or None if not found
         """
+        if use_cache:
+            cached = self._token_cache.get(user_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
         encrypted_data = None
 
         # Try to retrieve from storage
@@ -131,17 +204,49 @@ class SecureTokenManager:
             encrypted_data = self._retrieve_file(user_id)
 
         if not encrypted_data:
+            self._token_cache.pop(user_id, None)
             return None
 
         try:
             storage_data = self._decrypt_data(encrypted_data)
+            self._token_cache[user_id] = (time.monotonic() + TOKEN_CACHE_TTL, storage_data)
             return storage_data
         except Exception as e:
             print(f"Failed to decrypt token data: {e}")
             return None
 
+    def retrieve_tokens(self, user_ids):
+        """
+        Retrieve token data for several users at once
+
+        Args:
+            user_ids: Iterable of user identifiers
+
+        Returns:
+            Dictionary mapping user_id to token data (or None if not found)
+        """
+        user_ids = list(user_ids)
+        if not (self.use_redis and user_ids):
+            return {user_id: self.retrieve_token(user_id) for user_id in user_ids}
+
+        # One round-trip for every key instead of one GET per user
+        encrypted_blobs = self.redis_client.mget([self._redis_key(user_id) for user_id in user_ids])
+
+        results = {}
+        for user_id, encrypted_data in zip(user_ids, encrypted_blobs):
+            if not encrypted_data:
+                results[user_id] = None
+                continue
+            try:
+                results[user_id] = self._decrypt_data(encrypted_data)
+            except Exception as e:
+                print(f"Failed to decrypt token data: {e}")
+                results[user_id] = None
+        return results
+
     def delete_token(self, user_id):
         """Delete stored token data"""
+        self._token_cache.pop(user_id, None)
         if self.use_redis:
             self._delete_redis(user_id)
         elif self.use_keyring:
@@ -150,22 +255,25 @@ class SecureTokenManager:
             self._delete_file(user_id)
 
     def _store_redis(self, user_id, data):
-        """Store in Redis"""
-        key = f"quantum_token:{user_id}"
+        """Store in Redis (raw bytes, no str round-trip)"""
+        key = self._redis_key(user_id)
         self.redis_client.set(key, data, ex=3600*24*30)  # 30 days
 
     def _retrieve_redis(self, user_id):
         """Retrieve from Redis"""
-        key = f"quantum_token:{user_id}"
+        key = self._redis_key(user_id)
         return self.redis_client.get(key)
 
     def _delete_redis(self, user_id):
         """Delete from Redis"""
-        key = f"quantum_token:{user_id}"
+        key = self._redis_key(user_id)
         self.redis_client.delete(key)
 
     def _store_keyring(self, user_id, data):
         """Store in system keyring"""
+        # keyring only accepts str passwords
+        if isinstance(data, bytes):
+            data = data.decode()
         keyring.set_password("quantum_dashboard", user_id, data)
 
     def _retrieve_keyring(self, user_id):
@@ -184,11 +292,13 @@ class SecureTokenManager:
         filename = f".quantum_token_{hashlib.sha256(user_id.encode()).hexdigest()[:16]}"
         filepath = os.path.join(os.path.dirname(__file__), filename)
 
-        with open(filepath, 'w') as f:
-            f.write(data)
+        if isinstance(data, str):
+            data = data.encode()
 
-        # Set restrictive permissions
-        os.chmod(filepath, 0o600)
+        # Create with restrictive permissions up front so the file is never world-readable
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
 
     def _retrieve_file(self, user_id):
         """Retrieve from encrypted file"""
@@ -198,7 +308,7 @@ class SecureTokenManager:
         if not os.path.exists(filepath):
             return None
 
-        with open(filepath, 'r') as f:
+        with open(filepath, 'rb') as f:
             return f.read()
 
     def _delete_file(self, user_id):
@@ -216,8 +326,32 @@ class TokenValidator:
         self.token_manager = token_manager
 
     def validate_token(self, user_id):
-        """Validate if stored token is still valid"""
-        token_data = self.token_manager.retrieve_token(user_id)
+        """Validate if stored token is still valid, always against storage rather than the cache"""
+        token_data = self.token_manager.retrieve_token(user_id, use_cache=False)
+        return self._validate_token_data(token_data)
+
+    def validate_many(self, user_ids, max_workers=16):
+        """
+        Validate the stored tokens of several users concurrently
+
+        Tokens are fetched in one batch and the connection tests, which are
+        network bound, run in a thread pool rather than one after another.
+
+        Returns:
+            Dictionary mapping user_id to a (is_valid, message) tuple
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        token_data = self.token_manager.retrieve_tokens(user_ids)
+        workers = min(max_workers, len(user_ids))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='token-validate') as executor:
+            results = executor.map(self._validate_token_data, (token_data.get(user_id) for user_id in user_ids))
+            return dict(zip(user_ids, results))
+
+    def _validate_token_data(self, token_data):
+        """Validate already-retrieved token data"""
         if not token_data:
             return False, "No token found"
 
@@ -262,7 +396,7 @@ class TokenValidator:
 
             # Test connection
             manager = QuantumBackendManager(token)
-            if manager.is_connected():
+            if manager.is_connected:
                 return True, "API token valid"
             else:
                 return False, "API token invalid"
@@ -315,12 +449,22 @@ def init_token_manager(app):
     if not hasattr(app, 'token_validator'):
         app.token_validator = TokenValidator(app.token_manager)
 
+    # Resolved once at boot so request helpers skip the attribute probing
+    app.extensions['quantum_tokens'] = (app.token_manager, app.token_validator)
+
     return app.token_manager, app.token_validator
 
+def _get_token_components():
+    """Return (token_manager, token_validator) for the current app, or (None, None)"""
+    if not current_app:
+        return None, None
+    return current_app.extensions.get('quantum_tokens', (None, None))
+
 # Convenience functions for Flask routes
 def get_user_token(user_id=None):
     """Get user's token from secure storage"""
-    if not current_app or not hasattr(current_app, 'token_manager'):
+    manager, _ = _get_token_components()
+    if manager is None:
         return None
 
     if user_id is None:
@@ -329,7 +473,7 @@ def get_user_token(user_id=None):
     if not user_id:
         return None
 
-    token_data = current_app.token_manager.retrieve_token(user_id)
+    token_data = manager.retrieve_token(user_id)
     if token_data:
         return token_data.get('token_data', {}).get('token')
 
@@ -337,15 +481,32 @@ def get_user_token(user_id=None):
 
 def store_user_token(user_id, token_data, method='api_token'):
     """Store user's token securely"""
-    if not current_app or not hasattr(current_app, 'token_manager'):
+    manager, _ = _get_token_components()
+    if manager is None:
+        return False
+
+    manager.store_token(user_id, token_data, method)
+    return True
+
+def delete_user_token(user_id=None):
+    """Delete user's stored token through the app's shared manager, dropping its cached copy"""
+    manager, _ = _get_token_components()
+    if manager is None:
+        return False
+
+    if user_id is None:
+        user_id = session.get('user_id')
+
+    if not user_id:
         return False
 
-    current_app.token_manager.store_token(user_id, token_data, method)
+    manager.delete_token(user_id)
     return True
 
 def validate_user_token(user_id=None):
     """Validate user's stored token"""
-    if not current_app or not hasattr(current_app, 'token_validator'):
+    _, validator = _get_token_components()
+    if validator is None:
         return False, "Token manager not initialized"
 
     if user_id is None:
@@ -354,7 +515,7 @@ def validate_user_token(user_id=None):
     if not user_id:
         return False, "No user ID"
 
-    return current_app.token_validator.validate_token(user_id)
+    return validator.validate_token(user_id)
 
 if __name__ == '__main__':
     # Test the token manager
@@ -890,7 +890,8 @@ class HackathonDashboard {
 
             console.log('🔄 Loading initial data...');
             
-            // Load data FIRST, then initialize dashboard
+            // Wait for the server's post-connect data load, then load data before initializing the dashboard
+            await this.waitForDataReady();
             await this.fetchDashboardData();
             
             // Now initialize dashboard with real data
@@ -932,6 +933,27 @@ class HackathonDashboard {
         }
     }
 
+    async waitForDataReady(maxAttempts = 30) {
+        // /status reports loading=true until the first backend and job refresh has finished
+        for (let attempt = 0; attempt < maxAttempts; attempt++) {
+            try {
+                const response = await fetch('/status');
+                if (!response.ok) {
+                    return;
+                }
+                const data = await response.json();
+                if (!data.loading) {
+                    return;
+                }
+            } catch (error) {
+                console.error('Error polling data status:', error);
+                return;
+            }
+            await new Promise(resolve => setTimeout(resolve, 1000));
+        }
+        console.log('⚠️ Data still loading after waiting; continuing with what is available');
+    }
+
     async checkConnectionStatus() {
         try {
             const response = await fetch('/connection_status');
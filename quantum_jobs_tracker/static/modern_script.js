@@ -183,7 +183,7 @@ function updateBackendsUI() {
                 </div>
                 <div class="backend-visualization">
                     ${backend.visualization 
-                        ? `<img src="data:image/png;base64,${backend.visualization}" alt="Quantum state visualization" style="max-width:100%;max-height:150px;">` 
+                        ? `<img src="data:image/${backend.visualization_format || 'png'};base64,${backend.visualization}" alt="Quantum state visualization" style="max-width:100%;max-height:150px;">` 
                         : 'Quantum Circuit'}
                 </div>
             </div>
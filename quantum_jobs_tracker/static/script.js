@@ -155,7 +155,7 @@ function updateBackendsUI(backends) {
                 </div>
                 ${backend.visualization ? `
                 <div class="visualization">
-                    <img src="data:image/png;base64,${backend.visualization}" alt="Quantum state visualization">
+                    <img src="data:image/${backend.visualization_format || 'png'};base64,${backend.visualization}" alt="Quantum state visualization">
                 </div>` : ''}
             </div>
         `;
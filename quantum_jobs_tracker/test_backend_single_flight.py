@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Checks that concurrent get_backends() calls share one backend list fetch
+"""
+
+import sys
+import os
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("flask")
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from real_quantum_app import QuantumBackendManager
+
+FOLLOWERS = 8
+
+
+def _manager(fetch):
+    """Manager with only the single-flight state, fetching through fetch() instead of IBM Quantum"""
+    manager = object.__new__(QuantumBackendManager)
+    manager._backends_flight = None
+    manager._flight_lock = threading.Lock()
+    manager._fetch_backend_list = fetch
+    return manager
+
+
+def _run_concurrently(manager, release):
+    """Start a leader, then followers while its fetch is blocked; returns [(result, error)] per caller"""
+    outcomes = [None] * (FOLLOWERS + 1)
+
+    def call(index):
+        try:
+            outcomes[index] = (manager.get_backends(), None)
+        except Exception as e:
+            outcomes[index] = (None, e)
+
+    leader = threading.Thread(target=call, args=(0,))
+    leader.start()
+    deadline = time.monotonic() + 5
+    while manager._backends_flight is None:
+        assert time.monotonic() < deadline, "leader never started its fetch"
+        time.sleep(0.01)
+
+    followers = [threading.Thread(target=call, args=(i,)) for i in range(1, FOLLOWERS + 1)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.2)  # Let every follower reach the wait on the leader's flight
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    return outcomes
+
+
+def test_followers_share_the_leaders_result():
+    calls = []
+    release = threading.Event()
+    backends = [{'name': 'ibm_test', 'num_qubits': 5}]
+
+    def fetch():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return backends
+
+    manager = _manager(fetch)
+    outcomes = _run_concurrently(manager, release)
+
+    assert len(calls) == 1
+    assert all(result is backends and error is None for result, error in outcomes)
+    assert manager._backends_flight is None
+
+
+def test_followers_reraise_the_leaders_error():
+    calls = []
+    release = threading.Event()
+    failure = RuntimeError("IBM Quantum unavailable")
+
+    def fetch():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        raise failure
+
+    manager = _manager(fetch)
+    outcomes = _run_concurrently(manager, release)
+
+    assert len(calls) == 1
+    assert all(result is None and error is failure for result, error in outcomes)
+    assert manager._backends_flight is None
+
+
+def test_next_call_after_a_flight_fetches_again():
+    calls = []
+    manager = _manager(lambda: calls.append(1) or len(calls))
+
+    assert manager.get_backends() == 1
+    assert manager.get_backends() == 2
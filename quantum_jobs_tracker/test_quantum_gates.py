@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Checks the gate matrices and Bloch vectors used by apply_quantum_gate against qiskit
+"""
+
+import sys
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("flask")
+pytest.importorskip("qiskit")
+
+from qiskit.circuit.library import HGate, XGate, YGate, ZGate, RXGate, RYGate, RZGate
+from qiskit.quantum_info import Operator
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from real_quantum_app import _GATES, _rotation_gate, _bloch
+
+ANGLES = [0.0, 0.3, np.pi / 2, np.pi, -1.7, 2 * np.pi]
+
+
+@pytest.mark.parametrize("name, gate", [("h", HGate()), ("x", XGate()), ("y", YGate()), ("z", ZGate())])
+def test_fixed_gates_match_qiskit(name, gate):
+    assert np.allclose(_GATES[name], Operator(gate).data)
+
+
+@pytest.mark.parametrize("name, gate_class", [("rx", RXGate), ("ry", RYGate), ("rz", RZGate)])
+@pytest.mark.parametrize("angle", ANGLES)
+def test_rotation_gates_match_qiskit(name, gate_class, angle):
+    assert np.allclose(_rotation_gate(name, angle), Operator(gate_class(angle)).data)
+
+
+def test_unknown_rotation_gate():
+    assert _rotation_gate("rq", 0.5) is None
+
+
+@pytest.mark.parametrize("alpha, beta, expected", [
+    (1, 0, [0, 0, 1]),
+    (0, 1, [0, 0, -1]),
+    (1 / np.sqrt(2), 1 / np.sqrt(2), [1, 0, 0]),
+    (1 / np.sqrt(2), -1 / np.sqrt(2), [-1, 0, 0]),
+    (1 / np.sqrt(2), 1j / np.sqrt(2), [0, 1, 0]),
+    (1 / np.sqrt(2), -1j / np.sqrt(2), [0, -1, 0]),
+])
+def test_bloch_vectors_of_basis_states(alpha, beta, expected):
+    assert np.allclose(_bloch(alpha, beta), expected)
+
+
+@pytest.mark.parametrize("name", ["h", "x", "y", "z"])
+def test_bloch_vector_after_gate(name):
+    # Starting from |0>, each gate's column 0 is the new state
+    alpha, beta = _GATES[name][:, 0]
+    vector = _bloch(alpha, beta)
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    expected = {"h": [1, 0, 0], "x": [0, 0, -1], "y": [0, 0, -1], "z": [0, 0, 1]}[name]
+    assert np.allclose(vector, expected)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Round-trip checks for the encrypted token payload formats
+"""
+
+import sys
+import os
+import json
+
+import pytest
+
+pytest.importorskip("cryptography")
+pytest.importorskip("keyring")
+pytest.importorskip("flask")
+pytest.importorskip("redis")
+
+from cryptography.fernet import Fernet
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import secure_token_manager
+from secure_token_manager import SecureTokenManager, _MSGPACK_MARKER
+
+TOKEN_DATA = {
+    'token_data': {'token': 'abc123', 'crn': 'crn:v1:bluemix:public:quantum-computing:us-east:a/1::'},
+    'method': 'api_token',
+    'created_at': 1700000000.5,
+    'user_id': 'user-1',
+}
+
+# msgpack encoding of {"a": 1}, so the missing-msgpack path can be checked without msgpack
+_MSGPACK_A_1 = b'\x81\xa1a\x01'
+
+
+@pytest.fixture
+def codec():
+    fernet = Fernet(Fernet.generate_key())
+    encrypt, decrypt = SecureTokenManager._make_codec(fernet)
+    return fernet, encrypt, decrypt
+
+
+def test_baseline_json_blob_decodes(codec):
+    # Blobs written before msgpack: Fernet over json.dumps, stored as str
+    fernet, _, decrypt = codec
+    blob = fernet.encrypt(json.dumps(TOKEN_DATA).encode()).decode()
+    assert decrypt(blob) == TOKEN_DATA
+    assert decrypt(blob.encode()) == TOKEN_DATA
+
+
+def test_json_round_trip_without_msgpack(codec, monkeypatch):
+    monkeypatch.setattr(secure_token_manager, 'msgpack', None)
+    fernet, encrypt, decrypt = codec
+    blob = encrypt(TOKEN_DATA)
+    assert fernet.decrypt(blob)[:1] == b'{'
+    assert decrypt(blob) == TOKEN_DATA
+
+
+def test_msgpack_round_trip(codec):
+    pytest.importorskip("msgpack")
+    fernet, encrypt, decrypt = codec
+    blob = encrypt(TOKEN_DATA)
+    assert fernet.decrypt(blob)[:1] == _MSGPACK_MARKER
+    assert decrypt(blob) == TOKEN_DATA
+    assert decrypt(blob.decode()) == TOKEN_DATA
+
+
+def test_msgpack_blob_without_msgpack_raises(codec, monkeypatch):
+    monkeypatch.setattr(secure_token_manager, 'msgpack', None)
+    fernet, _, decrypt = codec
+    blob = fernet.encrypt(_MSGPACK_MARKER + _MSGPACK_A_1)
+    with pytest.raises(ValueError, match="msgpack is not installed"):
+        decrypt(blob)
@@ -3,6 +3,11 @@ import subprocess
 import time
 import sys
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
 def run_quantum_app():
     """Start the quantum application in a separate process"""
     print("Starting Quantum Jobs Tracker application...")
@@ -17,13 +22,34 @@ def run_quantum_app():
         print(f"Error starting application: {e}")
         return None
 
+def wait_for_app(url="http://localhost:10000/health", timeout=15):
+    """Poll the health endpoint until the application answers or the deadline passes"""
+    if requests is None:
+        # No HTTP client available - fall back to a fixed grace period
+        time.sleep(3)
+        return False
+
+    deadline = time.time() + timeout
+    with requests.Session() as session:
+        while time.time() < deadline:
+            try:
+                response = session.get(url, timeout=0.25)
+                if response.ok:
+                    return True
+            except requests.RequestException:
+                pass
+            time.sleep(0.1)
+
+    print("Application did not report healthy within the timeout")
+    return False
+
 def main():
     """Main interactive loop"""
     # Start the quantum application
     app_process = run_quantum_app()
     
-    # Give the app time to start
-    time.sleep(3)
+    # Wait until the app is actually serving requests
+    wait_for_app()
     
     # Main interaction loop
     while True:
@@ -43,7 +69,7 @@ def main():
             if app_process:
                 app_process.terminate()
             app_process = run_quantum_app()
-            time.sleep(3)
+            wait_for_app()
             
         elif user_input.lower() == "status":
             print("Checking application status...")
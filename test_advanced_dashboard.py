@@ -4,8 +4,26 @@ Test script for Advanced Dashboard functionality
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+import socket
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets have TCP keep-alive on, in addition to urllib3's TCP_NODELAY"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+# One keep-alive connection pool shared by every request this script makes
+SESSION = requests.Session()
+SESSION.headers['Connection'] = 'keep-alive'
+SESSION.mount('http://', KeepAliveAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
 
 def test_advanced_dashboard():
     """Test the advanced dashboard endpoints"""
@@ -16,7 +34,7 @@ def test_advanced_dashboard():
     # Test main endpoint
     try:
         print("📡 Testing main advanced dashboard endpoint...")
-        response = requests.get(f"{base_url}/advanced", timeout=10)
+        response = SESSION.get(f"{base_url}/advanced", timeout=10)
         if response.status_code == 200:
             print("✅ Advanced dashboard HTML loaded successfully")
         else:
@@ -34,10 +52,15 @@ def test_advanced_dashboard():
         '/api/measurement_results'
     ]
 
-    for endpoint in api_endpoints:
+    # The endpoints are independent, so they are requested together and the sweep
+    # takes as long as the slowest one instead of the sum of all of them
+    print(f"📡 Testing {len(api_endpoints)} API endpoints...")
+    with ThreadPoolExecutor(max_workers=len(api_endpoints)) as pool:
+        futures = [pool.submit(SESSION.get, f"{base_url}{endpoint}", timeout=10) for endpoint in api_endpoints]
+
+    for endpoint, future in zip(api_endpoints, futures):
         try:
-            print(f"📡 Testing {endpoint}...")
-            response = requests.get(f"{base_url}{endpoint}", timeout=10)
+            response = future.result()
             if response.status_code == 200:
                 print(f"✅ {endpoint} responded successfully")
             else:
@@ -48,12 +71,29 @@ def test_advanced_dashboard():
     print("🎉 Advanced Dashboard test completed!")
     return True
 
+def wait_for_server(base_url="http://localhost:10000", timeout=15):
+    """Poll /health until the server responds instead of sleeping a fixed time"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if SESSION.get(f"{base_url}/health", timeout=0.25).ok:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    return False
+
 if __name__ == "__main__":
-    # Wait a moment for server to start
-    print("⏳ Waiting for server to start...")
-    time.sleep(3)
+    try:
+        # Wait for the server to start answering
+        print("⏳ Waiting for server to start...")
+        if not wait_for_server():
+            print("\n❌ Server at http://localhost:10000 did not report healthy within 15s - is it running?")
+            sys.exit(1)
 
-    success = test_advanced_dashboard()
+        success = test_advanced_dashboard()
+    finally:
+        SESSION.close()
     if success:
         print("\n✅ Advanced Dashboard appears to be working!")
         print("🌐 Open http://localhost:10000/advanced in your browser")